@@ -0,0 +1,5 @@
+"""Headless benchmarks for the Pygkit debug overlays.
+
+Run with ``python -m benchmarks`` from the root of the repository. The
+benchmarks use the SDL dummy video driver, so no display is needed.
+"""
@@ -0,0 +1,119 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Import statements to time, each run in a fresh interpreter
+STATEMENTS = (
+    "import pygkit",
+    "import pygkit.debug",
+    "import pygkit.utility",
+    "import pygkit.utility.config_manager",
+    "from pygkit.debug import DebugOverlay",
+    "import pygame"
+)
+
+# Script run in the fresh interpreter, printing the import time in
+# nanoseconds and whether Pygame was imported
+TIMING_SCRIPT = """
+import sys, time
+start = time.perf_counter_ns()
+{statement}
+print(time.perf_counter_ns() - start, "pygame" in sys.modules)
+"""
+
+
+def time_import(statement, runs):
+    """Times an import statement in fresh interpreters.
+
+    Args:
+        statement (str): The import statement to time.
+        runs (int): The number of interpreters to time it in.
+
+    Returns:
+        dict: The median and minimum import time in nanoseconds, and whether
+            the statement imports Pygame.
+    """
+
+    # Run from the root of the repository, with the dummy video driver
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (root, environment.get("PYTHONPATH")))
+    )
+    environment.setdefault("SDL_VIDEODRIVER", "dummy")
+    environment.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    durations = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMING_SCRIPT.format(statement=statement)],
+            capture_output=True,
+            check=True,
+            cwd=root,
+            env=environment,
+            text=True
+        ).stdout.split()
+        durations.append(int(output[0]))
+        imports_pygame = output[1] == "True"
+
+    durations.sort()
+    return {
+        "statement": statement,
+        "median_ns": durations[len(durations) // 2],
+        "min_ns": durations[0],
+        "imports_pygame": imports_pygame
+    }
+
+
+def main(args=None):
+    """Times the imports from the command line and prints the results as
+    JSON.
+
+    Args:
+        args (list, optional): The command line arguments (default
+            sys.argv[1:]).
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.import_time",
+        description="Import time benchmarks for Pygkit."
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=10,
+        help="number of fresh interpreters per statement (default 10)"
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="file to write the JSON results to (default stdout)"
+    )
+    options = parser.parse_args(args)
+
+    results = []
+    for statement in STATEMENTS:
+        result = time_import(statement, options.runs)
+        results.append(result)
+        print(
+            f"{statement}: {result['median_ns'] / 1e6:.1f} ms",
+            file=sys.stderr
+        )
+
+    # Write the results as JSON
+    report = {"python": sys.version.split()[0], "results": results}
+    output = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
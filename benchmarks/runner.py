@@ -0,0 +1,263 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+# Use the dummy video driver, so the benchmarks run without a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+
+def measure_frames(run_frame, num_frames, warmup_frames):
+    """Measures the time taken by each frame of a scenario.
+
+    Args:
+        run_frame (function): The function that runs a single frame.
+        num_frames (int): The number of frames to measure.
+        warmup_frames (int): The number of frames to run before measuring.
+
+    Returns:
+        list: The duration of each frame in nanoseconds.
+    """
+
+    # Let caches fill up before measuring
+    for _ in range(warmup_frames):
+        run_frame()
+
+    durations = []
+    for _ in range(num_frames):
+        start = time.perf_counter_ns()
+        run_frame()
+        durations.append(time.perf_counter_ns() - start)
+
+    return durations
+
+
+def measure_allocations(run_frame, num_frames):
+    """Measures the memory allocated by the frames of a scenario.
+
+    This runs separately from the timing, since tracing allocations slows
+    every frame down. The transient bytes of a frame are the highest traced
+    memory during the frame above the memory traced when it started, so
+    memory allocated and freed within the frame, such as a temporary Surface
+    or string, is still counted. The retained blocks and bytes are the memory
+    still held after the frames, such as leaks and cache growth.
+
+    Args:
+        run_frame (function): The function that runs a single frame.
+        num_frames (int): The number of frames to measure.
+
+    Returns:
+        dict: The mean and maximum transient bytes per frame, the number of
+            retained blocks and bytes per frame, and the peak traced memory
+            in bytes.
+    """
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        transient_sizes = []
+        peak = 0
+        for _ in range(num_frames):
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            run_frame()
+            frame_peak = tracemalloc.get_traced_memory()[1]
+            transient_sizes.append(frame_peak - start)
+            peak = max(peak, frame_peak)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Count only the memory still held after the frames, per frame
+    stats = after.compare_to(before, "filename")
+    blocks = sum(max(stat.count_diff, 0) for stat in stats)
+    size = sum(max(stat.size_diff, 0) for stat in stats)
+
+    return {
+        "transient_bytes_per_frame": sum(transient_sizes) / num_frames,
+        "max_transient_bytes": max(transient_sizes),
+        "retained_blocks_per_frame": blocks / num_frames,
+        "retained_bytes_per_frame": size / num_frames,
+        "peak_bytes": peak
+    }
+
+
+def summarize(durations):
+    """Summarizes a list of frame durations.
+
+    Args:
+        durations (list): The duration of each frame in nanoseconds.
+
+    Returns:
+        dict: The mean, median, 95th percentile, and maximum frame duration
+            in nanoseconds, and the number of frames per second.
+    """
+
+    durations = sorted(durations)
+    count = len(durations)
+    mean = sum(durations) / count
+
+    return {
+        "frames": count,
+        "mean_ns": mean,
+        "median_ns": durations[count // 2],
+        "p95_ns": durations[min(count - 1, int(count * 0.95))],
+        "max_ns": durations[-1],
+        "frames_per_second": 1e9 / mean if mean else None
+    }
+
+
+def run_benchmarks(
+        scenarios,
+        num_frames,
+        warmup_frames,
+        allocation_frames,
+        screen_size
+    ):
+    """Runs every scenario and collects the results.
+
+    Args:
+        scenarios (list): The scenarios to run.
+        num_frames (int): The number of frames to time per scenario.
+        warmup_frames (int): The number of frames to run before timing.
+        allocation_frames (int): The number of frames to trace allocations
+            for, or 0 to skip tracing.
+        screen_size (tuple): The size of the dummy screen.
+
+    Returns:
+        dict: The results, with information about the environment.
+    """
+
+    results = []
+    for scenario in scenarios:
+        # Start each scenario with a fresh screen
+        screen = pygame.display.set_mode(screen_size)
+        screen.fill("black")
+
+        run_frame = scenario.setup(scenario.params)
+        result = {
+            "id": scenario.get_id(),
+            "scenario": scenario.name,
+            "params": scenario.params
+        }
+        result.update(
+            summarize(measure_frames(run_frame, num_frames, warmup_frames))
+        )
+        if allocation_frames:
+            result["allocations"] = measure_allocations(
+                run_frame,
+                allocation_frames
+            )
+        results.append(result)
+
+        print(
+            f"{result['id']}: {result['mean_ns'] / 1000:.1f} us/frame",
+            file=sys.stderr
+        )
+
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(str(part) for part in pygame.get_sdl_version()),
+        "platform": platform.platform(),
+        "screen_size": list(screen_size),
+        "results": results
+    }
+
+
+def main(args=None):
+    """Runs the benchmarks from the command line and prints the results as
+    JSON.
+
+    Args:
+        args (list, optional): The command line arguments (default
+            sys.argv[1:]).
+
+    Returns:
+        None
+    """
+
+    # Import the scenarios after the video driver is set
+    from benchmarks.scenarios import get_scenarios
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Headless benchmarks for the Pygkit debug overlays."
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=300,
+        help="number of frames to time per scenario (default 300)"
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=30,
+        help="number of frames to run before timing (default 30)"
+    )
+    parser.add_argument(
+        "--allocation-frames",
+        type=int,
+        default=50,
+        help="number of frames to trace allocations for, 0 to skip "
+            "(default 50)"
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        nargs=2,
+        default=(1920, 1080),
+        metavar=("WIDTH", "HEIGHT"),
+        help="size of the dummy screen (default 1920 1080)"
+    )
+    parser.add_argument(
+        "--filter",
+        default=None,
+        help="only run scenarios whose id contains this text"
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="run a smaller set of scenarios"
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="file to write the JSON results to (default stdout)"
+    )
+    options = parser.parse_args(args)
+
+    pygame.init()
+    try:
+        scenarios = get_scenarios(quick=options.quick)
+        if options.filter:
+            scenarios = [
+                scenario for scenario in scenarios
+                if options.filter in scenario.get_id()
+            ]
+
+        report = run_benchmarks(
+            scenarios,
+            options.frames,
+            options.warmup,
+            options.allocation_frames,
+            tuple(options.size)
+        )
+    finally:
+        pygame.quit()
+
+    # Write the results as JSON
+    output = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
@@ -0,0 +1,393 @@
+import random
+import pygame
+from pygkit.debug import (
+    DebugOverlay,
+    InputOverlay,
+    OverlayManager,
+    RectOverlay
+)
+from pygkit.utility import SpatialHash, SweepAndPrune
+
+# Positions supported by DebugOverlay and InputOverlay
+POSITIONS = ("topleft", "topright", "bottomleft", "bottomright")
+
+
+class Scenario:
+    """A scripted benchmark scenario.
+
+    Args:
+        name (str): The name of the scenario.
+        params (dict): The parameters of the scenario, reported with the
+            results.
+        setup (function): A function that takes the params, sets up the
+            scenario, and returns a function that runs a single frame.
+    """
+
+    def __init__(self, name, params, setup):
+        """Initializes the Scenario.
+
+        Args:
+            name (str): The name of the scenario.
+            params (dict): The parameters of the scenario, reported with the
+                results.
+            setup (function): A function that takes the params, sets up the
+                scenario, and returns a function that runs a single frame.
+
+        Returns:
+            None
+        """
+
+        self.name = name
+        self.params = params
+        self.setup = setup
+
+    def get_id(self):
+        """Returns a unique id for the scenario and its parameters.
+
+        Returns:
+            str: The id of the scenario.
+        """
+
+        params = ",".join(
+            f"{key}={value}" for key, value in self.params.items()
+        )
+        return f"{self.name}[{params}]"
+
+
+def setup_debug_overlay(params):
+    """Sets up a DebugOverlay showing a number of variables.
+
+    Half of the variables change every frame, like an FPS counter, and the
+    other half never change.
+
+    Args:
+        params (dict): The scenario parameters.
+
+    Returns:
+        function: A function that runs a single frame.
+    """
+
+    overlay = DebugOverlay()
+    overlay.set_text_renderer(params["renderer"])
+    num_variables = params["variables"]
+    frame = [0]
+
+    def run_frame():
+        frame[0] += 1
+        variables = {}
+        for i in range(num_variables):
+            if i % 2:
+                variables[f"static_{i}"] = "This value never changes"
+            else:
+                variables[f"changing_{i}"] = round(frame[0] * 1.37 + i, 2)
+        overlay.draw(
+            position=params["position"],
+            background_enabled=params["background"],
+            **variables
+        )
+
+    return run_frame
+
+
+def setup_input_overlay(params):
+    """Sets up an InputOverlay watching every key, or a few expected keys.
+
+    Args:
+        params (dict): The scenario parameters.
+
+    Returns:
+        function: A function that runs a single frame.
+    """
+
+    if params["keys"] == "expected":
+        expected_keys = [
+            pygame.K_UP,
+            pygame.K_DOWN,
+            pygame.K_LEFT,
+            pygame.K_RIGHT
+        ]
+    else:
+        expected_keys = None
+    overlay = InputOverlay(
+        expected_keys=expected_keys,
+        expected_mouse_buttons=[0, 1, 2],
+        show_mouse_position=True,
+        event_driven=params["event_driven"]
+    )
+
+    def run_frame():
+        overlay.process_events(pygame.event.get())
+        overlay.draw(
+            position=params["position"],
+            background_enabled=params["background"]
+        )
+
+    return run_frame
+
+
+def create_sprites(num_sprites, num_groups, num_static_groups=0):
+    """Creates sprites at random positions, spread evenly over several groups.
+
+    Args:
+        num_sprites (int): The number of sprites.
+        num_groups (int): The number of groups.
+        num_static_groups (int, optional): The number of groups, counted from
+            the last one, whose sprites never move (default 0).
+
+    Returns:
+        tuple: The sprite groups, and a function that moves every sprite of
+            the other groups a little, wrapping around the screen.
+    """
+
+    # Use the same sprites on every run
+    rng = random.Random(0)
+    width, height = pygame.display.get_surface().get_size()
+
+    # Create the sprites, spread evenly over the groups
+    groups = [pygame.sprite.Group() for _ in range(num_groups)]
+    sprites = []
+    for i in range(num_sprites):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(
+            rng.randrange(width),
+            rng.randrange(height),
+            rng.randrange(8, 32),
+            rng.randrange(8, 32)
+        )
+        group_index = i % len(groups)
+        groups[group_index].add(sprite)
+        if group_index < num_groups - num_static_groups:
+            sprites.append(sprite)
+
+    def move_sprites():
+        for sprite in sprites:
+            sprite.rect.x = (sprite.rect.x + rng.randint(-2, 2)) % width
+            sprite.rect.y = (sprite.rect.y + rng.randint(-2, 2)) % height
+
+    return groups, move_sprites
+
+
+def setup_rect_overlay(params):
+    """Sets up a RectOverlay with sprites moving randomly in several groups.
+
+    Args:
+        params (dict): The scenario parameters.
+
+    Returns:
+        function: A function that runs a single frame.
+    """
+
+    groups, move_sprites = create_sprites(params["sprites"], params["groups"])
+    broad_phases = {
+        "spatial_hash": SpatialHash,
+        "sweep_and_prune": SweepAndPrune
+    }
+    overlay = RectOverlay(groups, broad_phases[params["broad_phase"]]())
+
+    def run_frame():
+        move_sprites()
+        overlay.draw()
+
+    return run_frame
+
+
+def setup_rect_overlay_static(params):
+    """Sets up a RectOverlay with sprites moving randomly in several groups,
+    and the sprites of the last groups never moving.
+
+    Args:
+        params (dict): The scenario parameters.
+
+    Returns:
+        function: A function that runs a single frame.
+    """
+
+    groups, move_sprites = create_sprites(
+        params["sprites"],
+        params["groups"],
+        params["static"]
+    )
+    overlay = RectOverlay(groups)
+    for group in groups[len(groups) - params["static"]:]:
+        overlay.set_static(group)
+
+    def run_frame():
+        move_sprites()
+        overlay.draw()
+
+    return run_frame
+
+
+def setup_rect_overlay_matrix(params):
+    """Sets up a RectOverlay with sprites moving randomly in several groups,
+    and a collision matrix enabling every pair of groups, the pairs of
+    neighbouring groups, or a single pair.
+
+    Args:
+        params (dict): The scenario parameters.
+
+    Returns:
+        function: A function that runs a single frame.
+    """
+
+    groups, move_sprites = create_sprites(params["sprites"], params["groups"])
+    overlay = RectOverlay(groups)
+    if params["matrix"] == "all":
+        group_pairs = [
+            (group_a, group_b) for group_a in groups for group_b in groups
+        ]
+    elif params["matrix"] == "neighbours":
+        group_pairs = [
+            (groups[i], groups[i + 1]) for i in range(len(groups) - 1)
+        ]
+    else:
+        group_pairs = [(groups[0], groups[1])]
+    overlay.set_collision_matrix(group_pairs)
+
+    def run_frame():
+        move_sprites()
+        overlay.draw()
+
+    return run_frame
+
+
+def setup_all_overlays(params):
+    """Sets up a DebugOverlay, InputOverlay, and RectOverlay together, drawn
+    one by one or through an OverlayManager.
+
+    Args:
+        params (dict): The scenario parameters.
+
+    Returns:
+        function: A function that runs a single frame.
+    """
+
+    groups, move_sprites = create_sprites(params["sprites"], 2)
+    debug_overlay = DebugOverlay()
+    input_overlay = InputOverlay(expected_keys=[pygame.K_UP, pygame.K_DOWN])
+    rect_overlay = RectOverlay(groups)
+    frame = [0]
+
+    if params["managed"]:
+        manager = OverlayManager()
+        manager.add_overlay(debug_overlay, "topleft")
+        manager.add_overlay(input_overlay, "bottomleft")
+        manager.add_overlay(rect_overlay)
+
+        def run_frame():
+            frame[0] += 1
+            move_sprites()
+            manager.process_events(pygame.event.get())
+            manager.draw({debug_overlay: {"frame": frame[0]}})
+    else:
+        def run_frame():
+            frame[0] += 1
+            move_sprites()
+            input_overlay.process_events(pygame.event.get())
+            debug_overlay.draw(position="topleft", frame=frame[0])
+            input_overlay.draw(position="bottomleft")
+            rect_overlay.draw()
+
+    return run_frame
+
+
+def get_scenarios(quick=False):
+    """Returns every benchmark scenario.
+
+    Args:
+        quick (bool, optional): If True, returns a smaller set of scenarios
+            (default False).
+
+    Returns:
+        list: The list of scenarios.
+    """
+
+    scenarios = []
+
+    # DebugOverlay with every position, background on and off
+    variable_counts = (10,) if quick else (5, 50)
+    positions = POSITIONS[:1] if quick else POSITIONS
+    for num_variables in variable_counts:
+        for position in positions:
+            for background in (True, False):
+                for renderer in ("cache", "atlas"):
+                    scenarios.append(Scenario(
+                        "debug_overlay",
+                        {
+                            "variables": num_variables,
+                            "position": position,
+                            "background": background,
+                            "renderer": renderer
+                        },
+                        setup_debug_overlay
+                    ))
+
+    # InputOverlay polling or following events
+    for keys in ("expected", "all"):
+        for event_driven in (False, True):
+            for position in positions:
+                scenarios.append(Scenario(
+                    "input_overlay",
+                    {
+                        "keys": keys,
+                        "event_driven": event_driven,
+                        "position": position,
+                        "background": True
+                    },
+                    setup_input_overlay
+                ))
+
+    # RectOverlay with N sprites in M groups
+    sprite_counts = ((200, 2),) if quick else ((200, 2), (2000, 4))
+    for num_sprites, num_groups in sprite_counts:
+        for broad_phase in ("spatial_hash", "sweep_and_prune"):
+            scenarios.append(Scenario(
+                "rect_overlay",
+                {
+                    "sprites": num_sprites,
+                    "groups": num_groups,
+                    "broad_phase": broad_phase
+                },
+                setup_rect_overlay
+            ))
+
+    # RectOverlay with some of the M groups static
+    sprite_counts = ((200, 2, 1),) if quick else (
+        (2000, 8, 0),
+        (2000, 8, 1),
+        (2000, 8, 3)
+    )
+    for num_sprites, num_groups, num_static_groups in sprite_counts:
+        scenarios.append(Scenario(
+            "rect_overlay_static",
+            {
+                "sprites": num_sprites,
+                "groups": num_groups,
+                "static": num_static_groups
+            },
+            setup_rect_overlay_static
+        ))
+
+    # RectOverlay with a collision matrix over M groups
+    sprite_counts = ((200, 2),) if quick else ((2000, 8),)
+    for num_sprites, num_groups in sprite_counts:
+        for matrix in ("all", "neighbours", "single"):
+            scenarios.append(Scenario(
+                "rect_overlay_matrix",
+                {
+                    "sprites": num_sprites,
+                    "groups": num_groups,
+                    "matrix": matrix
+                },
+                setup_rect_overlay_matrix
+            ))
+
+    # Every overlay together, drawn one by one or through the manager
+    for managed in (False, True):
+        scenarios.append(Scenario(
+            "all_overlays",
+            {"sprites": 20, "managed": managed},
+            setup_all_overlays
+        ))
+
+    return scenarios
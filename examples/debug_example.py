@@ -1,6 +1,11 @@
 import pygame
 import sys
-from pygkit.debug import DebugOverlay, InputOverlay, RectOverlay
+from pygkit.debug import (
+    DebugOverlay,
+    InputOverlay,
+    OverlayManager,
+    RectOverlay
+)
 
 # Constants
 SCREEN_WIDTH = 800
@@ -70,6 +75,29 @@ class Game:
                 color="navy"
             )
 
+        # Lay out and draw every overlay together. The 1, 2, and 3 keys
+        # toggle the debug, input, and rect overlays
+        self.overlay_manager = OverlayManager()
+        self.overlay_manager.add_overlay(
+            self.debug_overlay,
+            anchor="topleft",
+            toggle_key=pygame.K_1,
+            background_enabled=True
+        )
+        self.overlay_manager.add_overlay(
+            self.input_overlay,
+            anchor="bottomleft",
+            toggle_key=pygame.K_2,
+            background_enabled=False
+        )
+        self.overlay_manager.add_overlay(
+            self.rect_overlay,
+            toggle_key=pygame.K_3,
+            collision_color="maroon",
+            normal_color="blue",
+            rect_width=2
+        )
+
     def run(self):
         """Runs the game. The 1 key toggles the debug overlay, the 2 key toggles
         the input overlay, the 3 key toggles the rect overlay
@@ -81,23 +109,15 @@ class Game:
         # Main loop
         while True:
             # Event loop
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            for event in events:
                 # Check for quit event
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
 
-                # Check for 1 key press, toggle debug visibility if pressed
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_1:
-                    self.debug_overlay.toggle_visible()
-                
-                # Check for 2 key press, toggle input visibility if pressed
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_2:
-                    self.input_overlay.toggle_visible()
-
-                # Check for 3 key press, toggle rect visibility if pressed
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_3:
-                    self.rect_overlay.toggle_visible()
+            # Let the overlay manager handle the toggle keys
+            self.overlay_manager.process_events(events)
 
             # Draw background
             self.screen.fill("papayawhip")
@@ -106,29 +126,16 @@ class Game:
             self.boxes.update()
             self.boxes.draw(self.screen)
 
-            # Draw the debug overlay in the top-left corner
-            self.debug_overlay.draw(
-                position="topleft",
-                background_enabled=True,
-                test_message="This is a test message.",
-                fps=round(self.clock.get_fps(), 2),
-                small_circle_x=self.circle1.rect.x,
-                small_circle_y=self.circle1.rect.y,
-                small_circle_vel=self.circle1.velocity
-            )
-
-            # Draw the input overlay in the bottom-left corner
-            self.input_overlay.draw(
-                position="bottomleft",
-                background_enabled=False
-                )
-            
-            # Draw the rect overlay
-            self.rect_overlay.draw(
-                collision_color="maroon",
-                normal_color="blue",
-                rect_width=2
-            )
+            # Draw the overlays, with the variables of the debug overlay
+            self.overlay_manager.draw({
+                self.debug_overlay: {
+                    "test_message": "This is a test message.",
+                    "fps": round(self.clock.get_fps(), 2),
+                    "small_circle_x": self.circle1.rect.x,
+                    "small_circle_y": self.circle1.rect.y,
+                    "small_circle_vel": self.circle1.velocity
+                }
+            })
 
             # Update the display and limit the framerate
             pygame.display.flip()
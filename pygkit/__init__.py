@@ -1 +1,31 @@
-from .debug import *
+from .lazy import lazy_attributes
+
+# The debug overlays are also available from the top-level package
+lazy_imports = {
+    name: ".debug" for name in (
+        "DebugOverlay",
+        "InputOverlay",
+        "RectOverlay",
+        "TextCache",
+        "GlyphAtlas",
+        "Profiler",
+        "ProfilerOverlay",
+        "ProfilerSection",
+        "GraphOverlay",
+        "OverlayManager"
+    )
+}
+
+# Subpackages, and the debug overlay modules that were also available from
+# the top-level package, imported on first use
+lazy_modules = {
+    "debug": ".debug",
+    "utility": ".utility",
+    "debug_overlay": ".debug.debug_overlay",
+    "input_overlay": ".debug.input_overlay",
+    "rect_overlay": ".debug.rect_overlay"
+}
+
+__all__ = list(lazy_imports)
+
+__getattr__, __dir__ = lazy_attributes(globals(), lazy_imports, lazy_modules)
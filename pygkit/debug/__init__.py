@@ -1,3 +1,20 @@
-from .debug_overlay import DebugOverlay
-from .input_overlay import InputOverlay
-from .rect_overlay import RectOverlay
\ No newline at end of file
+from ..lazy import lazy_attributes
+
+# Submodule defining each public name. Submodules are only imported when one
+# of their names is first used, so importing the package stays cheap.
+lazy_imports = {
+    "DebugOverlay": ".debug_overlay",
+    "InputOverlay": ".input_overlay",
+    "RectOverlay": ".rect_overlay",
+    "TextCache": ".text_cache",
+    "GlyphAtlas": ".glyph_atlas",
+    "Profiler": ".profiler",
+    "ProfilerOverlay": ".profiler",
+    "ProfilerSection": ".profiler",
+    "GraphOverlay": ".graph_overlay",
+    "OverlayManager": ".overlay_manager"
+}
+
+__all__ = list(lazy_imports)
+
+__getattr__, __dir__ = lazy_attributes(globals(), lazy_imports)
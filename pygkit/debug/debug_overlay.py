@@ -1,7 +1,14 @@
 import pygame
+from pygkit.debug.glyph_atlas import GlyphAtlas
+from pygkit.debug.overlay import (
+    DirtyRectsMixin,
+    Overlay,
+    RefreshRateMixin
+)
+from pygkit.debug.text_cache import TextCache
 
 
-class DebugOverlay:
+class DebugOverlay(DirtyRectsMixin, RefreshRateMixin, Overlay):
     """A debug overlay that displays variables on the Pygame screen.
 
     Args:
@@ -15,8 +22,7 @@ class DebugOverlay:
             None
         """
 
-        # Screen variable
-        self.screen = pygame.display.get_surface()
+        super().__init__()
 
         # Default font for the DebugOverlay
         self.font = pygame.font.SysFont("Courier New", 16, bold=True)
@@ -24,14 +30,24 @@ class DebugOverlay:
         # Variable to track font color
         self.font_color = "white"
 
-        # Flag indicating whether the DebugOverlay is visible
-        self.visible = True
+        # Cache of rendered text surfaces, reused while the text is unchanged
+        self.text_cache = TextCache()
 
-        # Surface used to draw the DebugOverlay, set to the size of the screen
-        self.overlay_surface = pygame.Surface(
-            pygame.display.get_surface().get_size(),
-            pygame.SRCALPHA
-        )
+        # Renderer used to draw text, either "cache" or "atlas"
+        self.text_renderer = "cache"
+
+        # Glyph atlases for the current font, one per color
+        self.glyph_atlases = {}
+
+        # Surface holding the composed lines, and where it goes on the screen
+        self.panel = None
+        self.panel_rect = pygame.Rect(0, 0, 0, 0)
+
+        # Fingerprint of the inputs the panel was composed from
+        self.panel_key = None
+
+        # Number of frames that reused the panel instead of composing it
+        self.frames_skipped = 0
 
     def set_font(self, **options):
         """Sets the font used by the DebugOverlay.
@@ -83,22 +99,123 @@ class DebugOverlay:
         )
         self.font_color = default_options["color"]
 
-    def toggle_visible(self, enabled=None):
-        """Toggles the visibility of the DebugOverlay.
+        # Surfaces rendered with the old font can no longer be reused
+        self.text_cache.clear()
+        self.glyph_atlases.clear()
+
+    def set_cache_size(self, size):
+        """Sets the maximum number of text surfaces kept in the text cache.
 
         Args:
-            enabled (bool, optional): Whether to enable the overlay 
-                (default None).
+            size (int): The maximum number of surfaces to keep. A size of 0
+                disables the cache.
+
+        Raises:
+            TypeError: If size is not an integer.
+            ValueError: If size is negative.
 
         Returns:
             None
         """
 
-        # Toggle the visibility if enabled is None, or set it to the given value
-        if enabled is None:
-            self.visible = not self.visible
-        else:
-            self.visible = enabled
+        self.text_cache.set_max_size(size)
+
+    def get_cache_stats(self):
+        """Returns the hit and miss statistics of the text cache.
+
+        Returns:
+            dict: The number of hits, misses, cached surfaces, and the size
+                limit of the text cache.
+        """
+
+        return self.text_cache.get_stats()
+
+    def set_text_renderer(self, renderer):
+        """Sets the renderer used to draw text.
+
+        The "cache" renderer renders each line with the font and reuses the
+        surface while the line is unchanged. The "atlas" renderer draws each
+        line from a glyph atlas, which is faster for values that change every
+        frame, such as the FPS or positions.
+
+        Args:
+            renderer (str): The renderer to use, "cache" or "atlas".
+
+        Raises:
+            ValueError: If an invalid renderer is provided.
+
+        Returns:
+            None
+        """
+
+        if renderer not in ("cache", "atlas"):
+            raise ValueError(
+                "Invalid renderer. Must be \"cache\" or \"atlas\"."
+            )
+        self.text_renderer = renderer
+
+    def get_glyph_atlas(self, color):
+        """Returns the glyph atlas for the current font and the given color,
+        creating it if needed.
+
+        Args:
+            color (str or tuple): The color of the glyphs.
+
+        Returns:
+            GlyphAtlas: The glyph atlas.
+        """
+
+        # Colors such as pygame.Color are not hashable, so use a tuple
+        if not isinstance(color, (str, tuple)):
+            color = tuple(color)
+
+        atlas = self.glyph_atlases.get(color)
+        if atlas is None:
+            atlas = GlyphAtlas(self.font, color)
+            self.glyph_atlases[color] = atlas
+
+        return atlas
+
+    def render_text(self, text, color):
+        """Renders the given text with the current font, using the text cache.
+
+        Args:
+            text (str): The text to render.
+            color (str or tuple): The color to render with.
+
+        Returns:
+            pygame.Surface: The rendered text surface.
+        """
+
+        return self.text_cache.render(self.font, text, color)
+
+    def handle_resize(self):
+        """Updates the screen after a resize, and recomposes the panel on the
+        next draw.
+
+        Returns:
+            None
+        """
+
+        super().handle_resize()
+        self.panel_key = None
+
+    def get_text_lines(self, **variables):
+        """Returns a list of text lines for the given variables.
+
+        Args:
+            **variables: The variables to display on the overlay.
+
+        Returns:
+            list: The list of (text, color) tuples.
+        """
+
+        # Create a text line for each variable
+        text_lines = []
+        for var_name, value in variables.items():
+            text_lines.append((f"{var_name}: {value}", self.font_color))
+
+        return text_lines
 
     def get_text_surfaces(self, **variables):
         """Returns a list of text surfaces for the given variables.
@@ -112,19 +229,162 @@ class DebugOverlay:
 
         # Create text surfaces for variables
         text_surfaces = []
-        for var_name, value in variables.items():
-            text = self.font.render(
-                f"{var_name}: {value}",
-                True,
-                self.font_color
-            )
-            text_surfaces.append(text)
+        for text, color in self.get_text_lines(**variables):
+            text_surfaces.append(self.render_text(text, color))
 
         return text_surfaces
 
+    def compose_panel(self, text_lines, position, background_enabled):
+        """Composes the given text lines into the panel surface.
+
+        The panel is only as large as the lines it holds, and is placed on the
+        screen according to the given position. The background is a single
+        fill of the whole panel, and the text of every line is drawn with one
+        call to Surface.blits.
+
+        Args:
+            text_lines (list): The (text, color) tuples to compose.
+            position (str): The position of the debug text.
+            background_enabled (bool): Whether to draw a background behind the
+                text.
+
+        Returns:
+            None
+        """
+
+        line_size = self.font.get_linesize()
+
+        # Measure each line with the current renderer
+        measured_lines = []
+        for text, color in text_lines:
+            if self.text_renderer == "atlas":
+                atlas = self.get_glyph_atlas(color)
+                w, h = atlas.get_size(text)
+                measured_lines.append((text, atlas, w, h))
+            else:
+                text_surface = self.render_text(text, color)
+                w, h = text_surface.get_size()
+                measured_lines.append((text, text_surface, w, h))
+
+        # Calculate the size of the panel
+        panel_width = 0
+        panel_height = 0
+        for i, (text, source, w, h) in enumerate(measured_lines):
+            panel_width = max(panel_width, w)
+            panel_height = max(panel_height, i * line_size + h)
+
+        # Determine the panel offsets based on the position
+        total_height = len(text_lines) * line_size
+        right_aligned = position in ("topright", "bottomright")
+        if right_aligned:
+            x_offset = self.screen_rect.width - panel_width
+        else:
+            x_offset = 0
+        if position in ("bottomleft", "bottomright"):
+            y_offset = self.screen_rect.height - total_height
+        else:
+            y_offset = 0
+
+        # With a background, the panel is filled once and needs no alpha
+        panel_size = (max(panel_width, 1), max(panel_height, 1))
+        if background_enabled:
+            self.panel = pygame.Surface(panel_size)
+            self.panel.fill("black")
+        else:
+            self.panel = pygame.Surface(panel_size, pygame.SRCALPHA)
+
+        # Collect the blits of every line and submit them together
+        blits = []
+        for i, (text, source, w, h) in enumerate(measured_lines):
+            if right_aligned:
+                x = panel_width - w
+            else:
+                x = 0
+            y = i * line_size
+
+            if self.text_renderer == "atlas":
+                blits.extend(source.get_blits(text, (x, y)))
+            else:
+                blits.append((source, (x, y)))
+        self.panel.blits(blits, False)
+
+        self.panel_rect = pygame.Rect(
+            x_offset,
+            y_offset,
+            panel_width,
+            panel_height
+        )
+
+    def get_panel(
+            self,
+            position="topleft",
+            background_enabled=True,
+            **variables
+        ):
+        """Returns the panel of text lines, composing it only if needed.
+
+        The lines are composed into a panel, which is reused as long as the
+        lines, position, background flag, font, and renderer are the same as
+        on the previous frame. If a refresh rate is set, the variables are
+        only sampled when a refresh is due, and the panel is reused between
+        refreshes.
+
+        Args:
+            position (str, optional): The position of the debug text, which
+                also sets the alignment of the lines (default "topleft").
+            background_enabled (bool, optional): Whether to draw a background
+                behind the text (default True).
+            **variables: The variables to display on the overlay.
+
+        Raises:
+            ValueError: If an invalid position is provided.
+
+        Returns:
+            pygame.Surface: The panel, or None if there are no lines.
+        """
+
+        # Check for invalid arguments
+        positions = ("topleft", "topright", "bottomleft", "bottomright")
+        if position not in positions:
+            raise ValueError(
+                "Invalid position. Must be \"topleft\", \"topright\", " \
+                "\"bottomleft\", or \"bottomright\"."
+            )
+
+        # Between refreshes, reuse the panel as long as it was composed for
+        # the same position and background
+        refresh_due = self.is_refresh_due()
+        if not refresh_due and self.panel_key is not None and \
+                self.panel_key[1:3] == (position, background_enabled):
+            self.frames_skipped += 1
+        else:
+            # Create text lines for variables
+            text_lines = self.get_text_lines(**variables)
+
+            # Compose the panel only if its inputs changed since the last frame
+            panel_key = (
+                tuple(text_lines),
+                position,
+                background_enabled,
+                self.font,
+                self.text_renderer
+            )
+            if panel_key == self.panel_key:
+                self.frames_skipped += 1
+            else:
+                self.compose_panel(text_lines, position, background_enabled)
+                self.panel_key = panel_key
+
+        if not self.panel_key[0]:
+            return None
+
+        return self.panel
+
     def draw(self, position="topleft", background_enabled=True, **variables):
         """Draws the DebugOverlay on the Pygame screen.
 
+        See get_panel() for how the panel is reused between frames.
+
         Args:
             position (str, optional): The position of the debug text 
                 (default "topleft").
@@ -136,52 +396,24 @@ class DebugOverlay:
             ValueError: If an invalid position is provided.
 
         Returns:
-            None
+            list: The rects of the screen that were changed. In dirty rect
+                mode, these are the rects of the panel drawn this frame and
+                the previous frame; otherwise, the whole screen.
         """
 
         # Return if the overlay is not visible
         if not self.visible:
-            return
-
-        # Clear the overlay surface
-        self.overlay_surface.fill((0, 0, 0, 0))
-
-        # Create text surfaces for variables
-        text_surfaces = self.get_text_surfaces(**variables)
-
-        # Calculate the total height of the text surfaces
-        total_height = len(text_surfaces) * self.font.get_linesize()
-
-        # Determine the x and y offsets based on the position
-        if position == "topleft":
-            x_offset = 0
-            y_offset = 0
-        elif position == "topright":
-            y_offset = 0
-        elif position == "bottomleft":
-            x_offset = 0
-            y_offset = self.screen.get_height() - total_height
-        elif position == "bottomright":
-            y_offset = self.screen.get_height() - total_height
-        else:
-            raise ValueError(
-                "Invalid position. Must be \"topleft\", \"topright\", " \
-                "\"bottomleft\", or \"bottomright\"."
-            )
-
-        # Draw the text surfaces on the overlay surface
-        for text in text_surfaces:
-            if position == "topright" or position == "bottomright":
-                x_offset = self.screen.get_width() - text.get_width()
+            return self.get_dirty_rects([])
 
-            if background_enabled:
-                text_rect = text.get_rect()
-                x, y = x_offset + text_rect.left, y_offset + text_rect.top
-                w, h = text_rect.width, text_rect.height
-                pygame.draw.rect(self.overlay_surface, "black", (x, y, w, h))
+        # Draw the panel on the Pygame screen
+        panel = self.get_panel(position, background_enabled, **variables)
+        rects = []
+        if panel is not None:
+            self.screen.blit(panel, self.panel_rect)
+            rects.append(self.panel_rect)
 
-            self.overlay_surface.blit(text, (x_offset, y_offset))
-            y_offset += self.font.get_linesize()
+        # In dirty rect mode, return only the rects that changed
+        if self.dirty_rects_enabled:
+            return self.get_dirty_rects(rects)
 
-        # Draw the overlay surface on the Pygame screen
-        self.screen.blit(self.overlay_surface, (0, 0))
+        return [self.screen_rect.copy()]
@@ -0,0 +1,150 @@
+import string
+import pygame
+
+
+class GlyphAtlas:
+    """A pre-rendered atlas of glyphs for a single font and color.
+
+    Every character is rendered once into a single atlas surface. Lines of
+    text are then drawn as a batch of sub-blits from the atlas, so text that
+    changes every frame, such as numbers, does not need a full font render.
+    Glyphs are placed by their rendered width, so kerning is not applied;
+    monospaced fonts look the same as with font.render.
+
+    Args:
+        font (pygame.font.Font): The font to render the glyphs with.
+        color (str or tuple): The color to render the glyphs with.
+        characters (str, optional): The characters to pre-render (default
+            all printable ASCII characters).
+    """
+
+    def __init__(self, font, color, characters=None):
+        """Initializes the GlyphAtlas and renders the given characters.
+
+        Args:
+            font (pygame.font.Font): The font to render the glyphs with.
+            color (str or tuple): The color to render the glyphs with.
+            characters (str, optional): The characters to pre-render (default
+                all printable ASCII characters).
+
+        Returns:
+            None
+        """
+
+        # Member variables
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+
+        # Atlas surface and the area of each glyph within it
+        self.surface = None
+        self.glyphs = {}
+
+        # Render the initial set of characters
+        if characters is None:
+            characters = string.digits + string.ascii_letters + \
+                string.punctuation + " "
+        self.add_characters(characters)
+
+    def add_characters(self, characters):
+        """Adds characters to the atlas, rebuilding the atlas surface if any
+        of them are new.
+
+        Args:
+            characters (str): The characters to add.
+
+        Returns:
+            None
+        """
+
+        # Skip characters that are already in the atlas
+        new_characters = [
+            character for character in dict.fromkeys(characters)
+            if character not in self.glyphs
+        ]
+        if not new_characters:
+            return
+
+        # Render each glyph on its own
+        glyph_surfaces = {}
+        for character in list(self.glyphs) + new_characters:
+            glyph_surfaces[character] = self.font.render(
+                character,
+                True,
+                self.color
+            )
+
+        # Copy the glyphs side by side into a single atlas surface
+        width = sum(glyph.get_width() for glyph in glyph_surfaces.values())
+        self.surface = pygame.Surface(
+            (max(width, 1), self.height),
+            pygame.SRCALPHA
+        )
+        x = 0
+        self.glyphs = {}
+        for character, glyph in glyph_surfaces.items():
+            self.surface.blit(glyph, (x, 0))
+            self.glyphs[character] = pygame.Rect(
+                x,
+                0,
+                glyph.get_width(),
+                self.height
+            )
+            x += glyph.get_width()
+
+    def get_size(self, text):
+        """Returns the size of the given text when drawn from the atlas.
+
+        Args:
+            text (str): The text to measure.
+
+        Returns:
+            tuple: The width and height of the text.
+        """
+
+        # Make sure every character has a glyph
+        self.add_characters(text)
+
+        glyphs = self.glyphs
+        return sum(glyphs[character].width for character in text), self.height
+
+    def get_blits(self, text, dest):
+        """Returns the blits that draw the given text from the atlas, so they
+        can be submitted together with other blits.
+
+        Args:
+            text (str): The text to draw.
+            dest (tuple): The top-left position to draw the text at.
+
+        Returns:
+            list: The (source, dest, area) tuples, one per character.
+        """
+
+        # Make sure every character has a glyph
+        self.add_characters(text)
+
+        # Build one sub-blit per glyph
+        atlas = self.surface
+        glyphs = self.glyphs
+        x, y = dest
+        blits = []
+        for character in text:
+            area = glyphs[character]
+            blits.append((atlas, (x, y), area))
+            x += area.width
+
+        return blits
+
+    def draw(self, surface, text, dest):
+        """Draws the given text onto a surface from the atlas.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            text (str): The text to draw.
+            dest (tuple): The top-left position to draw the text at.
+
+        Returns:
+            None
+        """
+
+        surface.blits(self.get_blits(text, dest), False)
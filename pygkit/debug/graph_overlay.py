@@ -0,0 +1,323 @@
+from array import array
+import pygame
+from pygkit.debug.overlay import Overlay
+
+
+class GraphOverlay(Overlay):
+    """A scrolling bar graph of frame times drawn on the Pygame screen.
+
+    The last frame times are kept in a fixed-size ring buffer. Adding a frame
+    time scrolls the existing graph by one column and draws only the newest
+    column, instead of redrawing every bar. Frames over the time budget are
+    drawn in a different color, so spikes and stutter stand out.
+
+    Args:
+        num_samples (int, optional): The number of frame times to show
+            (default 240).
+        height (int, optional): The height of the graph in pixels
+            (default 60).
+        budget (float, optional): The frame time budget in milliseconds
+            (default 1000 / 60).
+        max_time (float, optional): The frame time at the top of the graph in
+            milliseconds (default twice the budget).
+        column_width (int, optional): The width of each bar in pixels
+            (default 1).
+    """
+
+    def __init__(
+            self,
+            num_samples=240,
+            height=60,
+            budget=1000 / 60,
+            max_time=None,
+            column_width=1
+        ):
+        """Initializes the GraphOverlay with an empty graph.
+
+        Args:
+            num_samples (int, optional): The number of frame times to show
+                (default 240).
+            height (int, optional): The height of the graph in pixels
+                (default 60).
+            budget (float, optional): The frame time budget in milliseconds
+                (default 1000 / 60).
+            max_time (float, optional): The frame time at the top of the graph
+                in milliseconds (default twice the budget).
+            column_width (int, optional): The width of each bar in pixels
+                (default 1).
+
+        Raises:
+            TypeError: If an argument has an invalid type.
+            ValueError: If an argument is not positive.
+
+        Returns:
+            None
+        """
+
+        super().__init__()
+
+        # Check for invalid arguments
+        for name, value in (
+            ("num_samples", num_samples),
+            ("height", height),
+            ("column_width", column_width)
+        ):
+            if not isinstance(value, int):
+                raise TypeError(f"{name} must be an integer")
+            if value <= 0:
+                raise ValueError(f"{name} must be greater than 0")
+        if not isinstance(budget, (int, float)):
+            raise TypeError("budget must be a number")
+        if budget <= 0:
+            raise ValueError("budget must be greater than 0")
+        if max_time is None:
+            max_time = budget * 2
+        if not isinstance(max_time, (int, float)):
+            raise TypeError("max_time must be a number")
+        if max_time <= 0:
+            raise ValueError("max_time must be greater than 0")
+
+        # Member variables
+        self.num_samples = num_samples
+        self.height = height
+        self.budget = budget
+        self.max_time = max_time
+        self.column_width = column_width
+
+        # Colors of the graph
+        self.normal_color = "green"
+        self.over_budget_color = "red"
+        self.budget_line_color = "grey"
+        self.background_color = (0, 0, 0, 160)
+
+        # Ring buffer of frame times in milliseconds
+        self.frame_times = array("f", bytes(4 * num_samples))
+        self.index = 0
+
+        # Number of frame times added since the graph surface was drawn
+        self.pending_columns = 0
+
+        # Surface holding the graph, scrolled as frame times are added
+        self.graph_surface = pygame.Surface(
+            (num_samples * column_width, height),
+            pygame.SRCALPHA
+        )
+        self.redraw()
+
+    def set_colors(self, **colors):
+        """Sets the colors used to draw the graph.
+
+        Args:
+            **colors: The colors to set, any of "normal_color",
+                "over_budget_color", "budget_line_color", and
+                "background_color".
+
+        Raises:
+            ValueError: If an invalid color name is provided.
+
+        Returns:
+            None
+        """
+
+        color_names = (
+            "normal_color",
+            "over_budget_color",
+            "budget_line_color",
+            "background_color"
+        )
+        for name, color in colors.items():
+            if name not in color_names:
+                raise ValueError(f"Invalid color \"{name}\"")
+            setattr(self, name, color)
+
+        # Redraw the whole graph in the new colors
+        self.redraw()
+
+    def draw_column(self, column, frame_time):
+        """Draws the bar of a single frame time on the graph surface.
+
+        Args:
+            column (int): The column to draw, counted from the left.
+            frame_time (float): The frame time in milliseconds.
+
+        Returns:
+            None
+        """
+
+        x = column * self.column_width
+        column_rect = (x, 0, self.column_width, self.height)
+
+        # Clear the column
+        self.graph_surface.fill(self.background_color, column_rect)
+
+        # Draw the bar, clipped to the top of the graph
+        bar_height = round(min(frame_time / self.max_time, 1) * self.height)
+        if bar_height > 0:
+            if frame_time > self.budget:
+                color = self.over_budget_color
+            else:
+                color = self.normal_color
+            self.graph_surface.fill(
+                color,
+                (x, self.height - bar_height, self.column_width, bar_height)
+            )
+
+        # Mark the budget
+        budget_height = round(self.budget / self.max_time * self.height)
+        budget_y = self.height - budget_height
+        if 0 <= budget_y < self.height:
+            self.graph_surface.fill(
+                self.budget_line_color,
+                (x, budget_y, self.column_width, 1)
+            )
+
+    def redraw(self):
+        """Redraws every column of the graph from the ring buffer.
+
+        Returns:
+            None
+        """
+
+        # The oldest frame time is at the current index of the ring buffer
+        for column in range(self.num_samples):
+            index = (self.index + column) % self.num_samples
+            self.draw_column(column, self.frame_times[index])
+
+        self.pending_columns = 0
+
+    def add_frame_time(self, frame_time):
+        """Adds a frame time to the graph. The graph surface is only drawn
+        when the graph is shown, so adding frame times while hidden is cheap.
+
+        Args:
+            frame_time (float): The frame time in milliseconds, such as the
+                value returned by pygame.time.Clock.get_time().
+
+        Returns:
+            None
+        """
+
+        # Store the frame time in the ring buffer
+        self.frame_times[self.index] = frame_time
+        self.index = (self.index + 1) % self.num_samples
+        if self.pending_columns < self.num_samples:
+            self.pending_columns += 1
+
+    def record_values(self, frame_time=None):
+        """Adds a frame time without drawing the graph. Called by
+        OverlayManager while the GraphOverlay is hidden, so the graph stays
+        current.
+
+        Args:
+            frame_time (float, optional): A frame time in milliseconds to add
+                (default None).
+
+        Returns:
+            None
+        """
+
+        if frame_time is not None:
+            self.add_frame_time(frame_time)
+
+    def update_graph(self):
+        """Draws the frame times added since the graph surface was last drawn.
+
+        The graph is scrolled left by one column per frame time, and only the
+        newest columns are drawn. If the whole graph scrolled by, it is
+        redrawn.
+
+        Returns:
+            None
+        """
+
+        pending_columns = self.pending_columns
+        if pending_columns == 0:
+            return
+        if pending_columns >= self.num_samples:
+            self.redraw()
+            return
+
+        # Scroll the graph and draw the newest columns
+        self.graph_surface.scroll(-self.column_width * pending_columns, 0)
+        first_column = self.num_samples - pending_columns
+        for column in range(first_column, self.num_samples):
+            index = (self.index + column) % self.num_samples
+            self.draw_column(column, self.frame_times[index])
+        self.pending_columns = 0
+
+    def get_over_budget_count(self):
+        """Returns the number of frames in the graph that were over budget.
+
+        Returns:
+            int: The number of frames over budget.
+        """
+
+        budget = self.budget
+        return sum(1 for frame_time in self.frame_times if frame_time > budget)
+
+    def get_panel(self, position="topright", frame_time=None):
+        """Returns the graph surface, adding a frame time first, and drawing
+        the frame times added since it was last drawn.
+
+        Args:
+            position (str, optional): The position of the graph. It does not
+                change the surface, and is accepted so the graph can be laid
+                out like other overlays (default "topright").
+            frame_time (float, optional): A frame time in milliseconds to add
+                (default None).
+
+        Returns:
+            pygame.Surface: The graph surface.
+        """
+
+        self.record_values(frame_time)
+        self.update_graph()
+
+        return self.graph_surface
+
+    def draw(self, position="topright", frame_time=None):
+        """Draws the GraphOverlay on the Pygame screen.
+
+        Args:
+            position (str, optional): The position of the graph
+                (default "topright").
+            frame_time (float, optional): A frame time in milliseconds to add
+                before drawing (default None).
+
+        Raises:
+            ValueError: If an invalid position is provided.
+
+        Returns:
+            list: The rects of the screen that were changed.
+        """
+
+        # Add the frame time even while hidden, so the graph stays current
+        self.record_values(frame_time)
+
+        # Return if the overlay is not visible
+        if not self.visible:
+            return []
+
+        graph_surface = self.get_panel(position)
+
+        # Determine the rect of the graph based on the position
+        graph_rect = graph_surface.get_rect()
+        screen_rect = self.screen_rect
+        if position == "topleft":
+            graph_rect.topleft = screen_rect.topleft
+        elif position == "topright":
+            graph_rect.topright = screen_rect.topright
+        elif position == "bottomleft":
+            graph_rect.bottomleft = screen_rect.bottomleft
+        elif position == "bottomright":
+            graph_rect.bottomright = screen_rect.bottomright
+        else:
+            raise ValueError(
+                "Invalid position. Must be \"topleft\", \"topright\", " \
+                "\"bottomleft\", or \"bottomright\"."
+            )
+
+        # Draw the graph surface on the Pygame screen
+        self.screen.blit(graph_surface, graph_rect)
+
+        return [graph_rect]
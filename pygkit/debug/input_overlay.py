@@ -1,5 +1,8 @@
 import pygame
-from pygkit.debug import DebugOverlay
+from pygkit.debug.debug_overlay import DebugOverlay
+from pygkit.utility.input_state import InputState
+from pygkit.utility.joystick_registry import JoystickRegistry
+from pygkit.utility.key_names import get_key_name
 
 
 class InputOverlay(DebugOverlay):
@@ -20,6 +23,9 @@ class InputOverlay(DebugOverlay):
         expected_joystick_axes (list, optional): A list of lists, where each
             inner list contains two integers representing the joystick number
             and axis number to monitor.
+        event_driven (bool, optional): If True, the input state is updated
+            from the events passed to process_events instead of polling every
+            input on every frame.
     """
         
     def __init__(
@@ -28,7 +34,8 @@ class InputOverlay(DebugOverlay):
             expected_mouse_buttons=None,
             show_mouse_position=False,
             expected_joystick_buttons=None,
-            expected_joystick_axes=None
+            expected_joystick_axes=None,
+            event_driven=False
         ):
         """
         Initializes a new InputOverlay object.
@@ -47,11 +54,14 @@ class InputOverlay(DebugOverlay):
             expected_joystick_axes (list of tuple): A list of tuples, where each
                 tuple contains two integers representing the joystick number and
                 axis number to monitor.
+            event_driven (bool): If True, the input state is updated from the
+                events passed to process_events instead of polling every input
+                on every frame.
 
         Raises:
             TypeError: If expected_keys is not a list of Pygame key constants,
                 expected_mouse_buttons is not a list of integers, or
-                show_mouse_position is not a boolean.
+                show_mouse_position or event_driven is not a boolean.
             ValueError: If the length of the inner list in
                 expected_joystick_buttons or expected_joystick_axes is not equal
                 to 2.
@@ -77,6 +87,8 @@ class InputOverlay(DebugOverlay):
                 )
         if not isinstance(show_mouse_position, bool):
             raise TypeError("show_mouse_position must be a boolean")
+        if not isinstance(event_driven, bool):
+            raise TypeError("event_driven must be a boolean")
         joystick_button_error = "expected_joystick_axes must be a list of " \
             "lists, with each inner list containing two integers, the first " \
             "being the joystick number and the second being the button number"
@@ -112,6 +124,7 @@ class InputOverlay(DebugOverlay):
         self.expected_keys = expected_keys
         self.expected_mouse_buttons = expected_mouse_buttons
         self.show_mouse_position = show_mouse_position
+        self.event_driven = event_driven
 
         # Turn contents into tuples for compatibilty with set
         self.expected_joystick_buttons = []
@@ -130,63 +143,117 @@ class InputOverlay(DebugOverlay):
         self.current_mouse_buttons = set()
         self.current_joystick_buttons = set()
 
-        # Setup keyboard keys to check
-        if self.expected_keys:
-            self.keys_to_check = self.expected_keys
-        else:
-            self.keys_to_check = []
-            for key in dir(pygame):
-                if key.startswith("K_"):
-                    self.keys_to_check.append(getattr(pygame, key))
+        # Setup joysticks to check, following joysticks being connected and
+        # disconnected
+        self.joystick_registry = JoystickRegistry()
+        self.joysticks = self.joystick_registry.joysticks
+
+        # Snapshot of every button, polling only the expected joystick
+        # buttons if there are any
+        self.input_state = InputState(self.joystick_registry, event_driven)
+        if self.expected_joystick_buttons:
+            self.input_state.watch_joystick_buttons(
+                self.expected_joystick_buttons
+            )
+
+    def process_events(self, events):
+        """
+        Update the input state from a list of events, and handle window
+        resize events.
+
+        In event driven mode, this should be called once per frame with the
+        events from pygame.event.get(), so the cost of keeping the input
+        state up to date depends only on how many inputs changed. Joysticks
+        connected or disconnected are tracked in either mode.
 
-        # Setup joystick buttons to check
-        pygame.joystick.init()
-        self.joysticks = []
-        for x in range(pygame.joystick.get_count()):
-            self.joysticks.append(pygame.joystick.Joystick(x))
+        Args:
+            events (list): The Pygame events to process.
+
+        Returns:
+            None
+        """
+
+        # Handle window resize events
+        super().process_events(events)
+
+        # Track connected and disconnected joysticks
+        self.joystick_registry.process_events(events)
+
+        # Key, mouse, and joystick buttons are polled unless event driven
+        if self.event_driven:
+            self.input_state.process_events(events)
+
+    def set_axis_filter(self, deadzone=0.0, quantization=None):
+        """
+        Set the filter applied to the expected joystick axes.
+
+        A deadzone and quantization keep small jitter in the axis values from
+        changing the displayed text.
+
+        Args:
+            deadzone (float, optional): Axis values closer to 0 than this are
+                shown as 0 (default 0.0).
+            quantization (float, optional): Axis values are rounded to a
+                multiple of this step (default None, no rounding).
+
+        Raises:
+            TypeError: If deadzone or quantization is not a number.
+            ValueError: If deadzone is negative or quantization is not
+                positive.
+
+        Returns:
+            None
+        """
+
+        self.joystick_registry.set_axis_filter(deadzone, quantization)
 
     def update_current_inputs(self):
         """
         Update the current input state.
 
         This method updates the current state of all input devices being
-        monitored.
+        monitored. The input state finds the pressed buttons in one batched
+        operation per device, and in event driven mode it is already kept up
+        to date by process_events, so nothing is polled.
         """
 
+        # Update the snapshot of every button
+        input_state = self.input_state
+        input_state.update()
+
         # Update keyboard inputs
-        pressed_keys = pygame.key.get_pressed()
-        for key_code in self.keys_to_check:
-            if pressed_keys[key_code]:
-                self.current_keys.add(key_code)
-            else:
-                self.current_keys.discard(key_code)
-        
+        if self.expected_keys:
+            self.current_keys = {
+                key_code for key_code in self.expected_keys
+                if input_state.pressed[key_code]
+            }
+        else:
+            self.current_keys = set(input_state.get_pressed_keys())
+
         # Update mouse inputs
-        pressed_mouse_buttons = pygame.mouse.get_pressed(num_buttons=5)
-        for button_code in range(len(pressed_mouse_buttons)):
-            if pressed_mouse_buttons[button_code]:
-                self.current_mouse_buttons.add(button_code)
-            else:
-                self.current_mouse_buttons.discard(button_code)
+        self.current_mouse_buttons = {
+            button_code
+            for button_code, pressed in enumerate(input_state.mouse_pressed)
+            if pressed
+        }
 
         # Update joystick inputs
-        for i, joystick in enumerate(self.joysticks):
-            for button_code in range(joystick.get_numbuttons()):
-                id = (i, button_code)
-                if joystick.get_button(button_code):
-                    self.current_joystick_buttons.add(id)
-                else:
-                    self.current_joystick_buttons.discard(id)
+        self.current_joystick_buttons = set()
+        for i, buttons in input_state.joystick_pressed.items():
+            button_code = buttons.find(1)
+            while button_code != -1:
+                self.current_joystick_buttons.add((i, button_code))
+                button_code = buttons.find(1, button_code + 1)
 
-    def get_text_surfaces(self):
+    def get_text_lines(self):
         """
-        Get a list of text surfaces to display.
+        Get a list of text lines to display.
 
-        This method returns a list of text surfaces to display based on the
+        This method returns a list of text lines to display based on the
         current input state.
 
         Returns:
-            list: A list of Pygame text surfaces.
+            list: A list of (text, color) tuples.
         """
 
         # Update current inputs
@@ -198,20 +265,19 @@ class InputOverlay(DebugOverlay):
         else:
             inputs_to_draw = list(self.current_keys)
 
-        # Create text surfaces
-        text_surfaces = []
+        # Create text lines
+        text_lines = []
 
-        # Create surfaces for keyboard inputs
+        # Create lines for keyboard inputs
         for input_code in inputs_to_draw:
-            input_name = pygame.key.name(input_code)
+            input_name = get_key_name(input_code)
             if input_code in self.current_keys:
                 input_color = self.font_color
             else:
                 input_color = "grey"
-            text = self.font.render(input_name.title(), True, input_color)
-            text_surfaces.append(text)
+            text_lines.append((input_name, input_color))
 
-        # Create surfaces for mouse buttons
+        # Create lines for mouse buttons
         if self.expected_mouse_buttons:
             buttons_to_draw = self.expected_mouse_buttons
         else:
@@ -222,17 +288,15 @@ class InputOverlay(DebugOverlay):
                 button_color = self.font_color
             else:
                 button_color = "grey"
-            text = self.font.render(button_name, True, button_color)
-            text_surfaces.append(text)
+            text_lines.append((button_name, button_color))
 
-        # If show_mouse_position is True, create a surf for the mouse position
+        # If show_mouse_position is True, create a line for the mouse position
         if self.show_mouse_position:
             mouse_pos = pygame.mouse.get_pos()
             mouse_pos_str = f"Mouse Position: ({mouse_pos[0]}, {mouse_pos[1]})"
-            text = self.font.render(mouse_pos_str, True, self.font_color)
-            text_surfaces.append(text)
+            text_lines.append((mouse_pos_str, self.font_color))
 
-        # Create surfaces for joystick buttons
+        # Create lines for joystick buttons
         if self.expected_joystick_buttons:
             buttons_to_draw = self.expected_joystick_buttons
         else:
@@ -243,17 +307,18 @@ class InputOverlay(DebugOverlay):
                 button_color = self.font_color
             else:
                 button_color = "grey"
-            text = self.font.render(button_name, True, button_color)
-            text_surfaces.append(text)
+            text_lines.append((button_name, button_color))
         
-        # Create surfaces for expected joystick axes
+        # Create lines for expected joystick axes
         if self.expected_joystick_axes:
             for axis_code in self.expected_joystick_axes:
-                value = self.joysticks[axis_code[0]].get_axis(axis_code[1])
+                value = self.joystick_registry.get_axis(*axis_code)
                 joy_id = axis_code[0]
                 ax_id = axis_code[1]
-                axis_name = f"Joystick {joy_id} Axis {ax_id}: {value:.2f}"
-                text = self.font.render(axis_name, True, self.font_color)
-                text_surfaces.append(text)
+                if value is None:
+                    axis_name = f"Joystick {joy_id} Axis {ax_id}: N/A"
+                else:
+                    axis_name = f"Joystick {joy_id} Axis {ax_id}: {value:.2f}"
+                text_lines.append((axis_name, self.font_color))
         
-        return text_surfaces
+        return text_lines
@@ -0,0 +1,218 @@
+import pygame
+
+
+class Overlay:
+    """Base class for overlays drawn on the Pygame screen.
+
+    Keeps track of the screen and its size, and whether the overlay is
+    visible.
+    """
+
+    def __init__(self):
+        """Initializes the Overlay with the current Pygame screen.
+
+        Returns:
+            None
+        """
+
+        super().__init__()
+
+        # Screen variable, and its rect, updated when the window is resized
+        self.screen = pygame.display.get_surface()
+        self.screen_rect = self.screen.get_rect()
+
+        # Flag indicating whether the overlay is visible
+        self.visible = True
+
+    def process_events(self, events):
+        """Handles window resize events.
+
+        Args:
+            events (list): The Pygame events to process.
+
+        Returns:
+            None
+        """
+
+        for event in events:
+            if event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                self.handle_resize()
+                break
+
+    def handle_resize(self):
+        """Updates the screen after the window was resized or the display mode
+        was set. Called by process_events(), or directly after
+        pygame.display.set_mode().
+
+        Returns:
+            None
+        """
+
+        self.screen = pygame.display.get_surface()
+        self.screen_rect = self.screen.get_rect()
+
+    def toggle_visible(self, enabled=None):
+        """Toggles the visibility of the overlay.
+
+        Args:
+            enabled (bool, optional): Whether to enable the overlay
+                (default None).
+
+        Returns:
+            None
+        """
+
+        # Toggle the visibility if enabled is None, or set it to the given
+        # value
+        if enabled is None:
+            self.visible = not self.visible
+        else:
+            self.visible = enabled
+
+
+class DirtyRectsMixin:
+    """Adds dirty rect mode to an overlay.
+
+    In dirty rect mode, draw() returns only the rects that changed, including
+    the rects drawn on the previous frame so the old overlay gets erased.
+    """
+
+    def __init__(self):
+        """Initializes dirty rect mode as disabled.
+
+        Returns:
+            None
+        """
+
+        super().__init__()
+
+        # Flag indicating whether draw() returns only the changed rects
+        # instead of the whole screen
+        self.dirty_rects_enabled = False
+
+        # Rects drawn on the previous frame in dirty rect mode
+        self.previous_rects = []
+
+    def set_dirty_rects(self, enabled):
+        """Sets whether the overlay uses dirty rect mode.
+
+        Args:
+            enabled (bool): Whether to enable dirty rect mode.
+
+        Raises:
+            TypeError: If enabled is not a boolean.
+
+        Returns:
+            None
+        """
+
+        if not isinstance(enabled, bool):
+            raise TypeError("Dirty rects flag must be a boolean")
+        self.dirty_rects_enabled = enabled
+        self.previous_rects = []
+
+    def get_dirty_rects(self, rects):
+        """Returns the rects changed this frame, including the rects drawn on
+        the previous frame so the old overlay gets erased.
+
+        Args:
+            rects (list): The rects drawn this frame.
+
+        Returns:
+            list: The rects changed this frame.
+        """
+
+        dirty_rects = self.previous_rects + rects
+        self.previous_rects = rects
+
+        return dirty_rects
+
+
+class RefreshRateMixin:
+    """Adds a refresh rate limit to an overlay.
+
+    Between refreshes, draw() reuses what was drawn on the last refresh, so
+    the overlay costs almost nothing on most frames.
+    """
+
+    def __init__(self):
+        """Initializes the refresh rate as unlimited.
+
+        Returns:
+            None
+        """
+
+        super().__init__()
+
+        # Refresh rate limits, either in refreshes per second or in frames
+        # between refreshes (default None, refresh every frame)
+        self.refresh_hz = None
+        self.refresh_frames = None
+
+        # Time of the last refresh, and frames drawn since then
+        self.last_refresh_time = None
+        self.frames_since_refresh = 0
+
+    def set_refresh_rate(self, refresh_hz=None, every_n_frames=None):
+        """Limits how often the overlay samples its values and refreshes.
+        Calling this with no arguments refreshes on every frame again.
+
+        Args:
+            refresh_hz (int or float, optional): The number of refreshes per
+                second (default None).
+            every_n_frames (int, optional): The number of frames between
+                refreshes (default None).
+
+        Raises:
+            ValueError: If both limits are provided, or a limit is not
+                positive.
+            TypeError: If a limit has an invalid type.
+
+        Returns:
+            None
+        """
+
+        # Check for invalid arguments
+        if refresh_hz is not None and every_n_frames is not None:
+            raise ValueError(
+                "Only one of refresh_hz and every_n_frames can be provided"
+            )
+        if refresh_hz is not None:
+            if not isinstance(refresh_hz, (int, float)):
+                raise TypeError("refresh_hz must be a number")
+            if refresh_hz <= 0:
+                raise ValueError("refresh_hz must be greater than 0")
+        if every_n_frames is not None:
+            if not isinstance(every_n_frames, int):
+                raise TypeError("every_n_frames must be an integer")
+            if every_n_frames <= 0:
+                raise ValueError("every_n_frames must be greater than 0")
+
+        self.refresh_hz = refresh_hz
+        self.refresh_frames = every_n_frames
+
+        # Refresh on the next frame
+        self.last_refresh_time = None
+        self.frames_since_refresh = 0
+
+    def is_refresh_due(self):
+        """Checks whether the overlay should refresh on this frame.
+
+        Returns:
+            bool: True if the overlay should refresh, False otherwise.
+        """
+
+        # Always refresh on the first frame, then check the limits
+        now = pygame.time.get_ticks()
+        if self.last_refresh_time is not None:
+            if self.refresh_frames is not None:
+                self.frames_since_refresh += 1
+                if self.frames_since_refresh < self.refresh_frames:
+                    return False
+            if self.refresh_hz is not None:
+                if now - self.last_refresh_time < 1000 / self.refresh_hz:
+                    return False
+
+        self.last_refresh_time = now
+        self.frames_since_refresh = 0
+        return True
@@ -0,0 +1,324 @@
+import pygame
+from pygkit.debug.overlay import Overlay
+from pygkit.utility.key_names import KeyCombo, parse_key
+
+
+class OverlayManager(Overlay):
+    """A manager that lays out several overlays and composites them at once.
+
+    Overlays are drawn onto one shared surface the size of the screen, which
+    is then drawn on the screen in a single composite. Overlays with a panel,
+    such as DebugOverlay, InputOverlay, and GraphOverlay, are stacked at their
+    anchor so they never overlap. Overlays drawn in screen space, such as
+    RectOverlay, are drawn beneath the panels. Only the areas drawn on are
+    cleared and composited, unless there are too many of them.
+
+        manager = OverlayManager()
+        manager.add_overlay(debug_overlay, "topleft", toggle_key=pygame.K_1)
+        manager.add_overlay(rect_overlay, toggle_key="ctrl+r")
+
+        # In the game loop
+        manager.process_events(events)
+        manager.draw({debug_overlay: {"fps": clock.get_fps()}})
+
+    Args:
+        margin (int, optional): The space between the panels and the edges of
+            the screen in pixels (default 0).
+        spacing (int, optional): The space between stacked panels in pixels
+            (default 4).
+    """
+
+    # Anchors panels can be stacked at
+    anchors = ("topleft", "topright", "bottomleft", "bottomright")
+
+    # Above this many drawn areas, the whole surface is cleared and
+    # composited instead of each area
+    max_areas = 64
+
+    def __init__(self, margin=0, spacing=4):
+        """Initializes the OverlayManager with no overlays.
+
+        Args:
+            margin (int, optional): The space between the panels and the edges
+                of the screen in pixels (default 0).
+            spacing (int, optional): The space between stacked panels in
+                pixels (default 4).
+
+        Raises:
+            TypeError: If margin or spacing is not an integer.
+            ValueError: If margin or spacing is negative.
+
+        Returns:
+            None
+        """
+
+        super().__init__()
+
+        # Check for invalid arguments
+        for name, value in (("margin", margin), ("spacing", spacing)):
+            if not isinstance(value, int):
+                raise TypeError(f"{name} must be an integer")
+            if value < 0:
+                raise ValueError(f"{name} must not be negative")
+
+        # Member variables
+        self.margin = margin
+        self.spacing = spacing
+
+        # Overlays in drawing order, and their anchors, toggle keys, and draw
+        # options
+        self.overlays = []
+        self.overlay_anchors = {}
+        self.toggle_keys = {}
+        self.overlay_options = {}
+
+        # Surface shared by every overlay, allocated on the first draw
+        self.overlay_surface = None
+
+        # Areas of the shared surface drawn on the previous frame, or None if
+        # the whole surface was drawn on
+        self.previous_rects = []
+
+    def add_overlay(
+            self,
+            overlay,
+            anchor="topleft",
+            toggle_key=None,
+            **options
+        ):
+        """Adds an overlay to the manager.
+
+        Args:
+            overlay: The overlay to add, such as a DebugOverlay, InputOverlay,
+                GraphOverlay, or RectOverlay.
+            anchor (str, optional): The corner to stack the panel of the
+                overlay at. Ignored for overlays drawn in screen space, such as
+                RectOverlay (default "topleft").
+            toggle_key (int, KeyCombo, or str, optional): The key that toggles
+                the visibility of the overlay, as a Pygame key constant, a
+                KeyCombo, or a key name such as "f3" or "ctrl+d"
+                (default None).
+            **options: The options to draw the overlay with, such as
+                background_enabled or rect_width.
+
+        Raises:
+            ValueError: If the overlay was already added, or the anchor or
+                toggle key is invalid.
+
+        Returns:
+            None
+        """
+
+        # Check for invalid arguments
+        if overlay in self.overlay_anchors:
+            raise ValueError("overlay was already added")
+        if anchor not in self.anchors:
+            raise ValueError(
+                "Invalid anchor. Must be \"topleft\", \"topright\", " \
+                "\"bottomleft\", or \"bottomright\"."
+            )
+        if isinstance(toggle_key, str):
+            key_name = toggle_key
+            toggle_key = parse_key(key_name)
+            if toggle_key is None:
+                raise ValueError(f"Invalid toggle key \"{key_name}\"")
+
+        self.overlays.append(overlay)
+        self.overlay_anchors[overlay] = anchor
+        self.overlay_options[overlay] = options
+        if toggle_key is not None:
+            self.toggle_keys[overlay] = toggle_key
+
+    def remove_overlay(self, overlay):
+        """Removes an overlay from the manager.
+
+        Args:
+            overlay: The overlay to remove.
+
+        Raises:
+            ValueError: If the overlay was not added.
+
+        Returns:
+            None
+        """
+
+        if overlay not in self.overlay_anchors:
+            raise ValueError("overlay was not added")
+
+        self.overlays.remove(overlay)
+        del self.overlay_anchors[overlay]
+        del self.overlay_options[overlay]
+        self.toggle_keys.pop(overlay, None)
+
+    def process_events(self, events):
+        """Passes events to the overlays that handle them, toggles the
+        overlays whose toggle key was pressed, and handles window resize
+        events.
+
+        Args:
+            events (list): The Pygame events to process.
+
+        Returns:
+            None
+        """
+
+        # Reallocate the shared surface on the next draw after a resize
+        super().process_events(events)
+
+        # Let the overlays follow the events, such as InputOverlay
+        for overlay in self.overlays:
+            process_events = getattr(overlay, "process_events", None)
+            if process_events is not None:
+                process_events(events)
+
+        # Toggle the overlays whose toggle key was pressed
+        if not self.toggle_keys:
+            return
+        for event in events:
+            if event.type != pygame.KEYDOWN:
+                continue
+            for overlay, toggle_key in self.toggle_keys.items():
+                if isinstance(toggle_key, KeyCombo):
+                    pressed = toggle_key.matches(event)
+                else:
+                    pressed = event.key == toggle_key
+                if pressed:
+                    overlay.toggle_visible()
+
+    def handle_resize(self):
+        """Updates the screen after a resize. The shared surface is
+        reallocated at the new size on the next draw.
+
+        Returns:
+            None
+        """
+
+        super().handle_resize()
+        self.overlay_surface = None
+
+    def get_overlay_surface(self):
+        """Returns the surface shared by every overlay, allocating it if
+        needed.
+
+        Returns:
+            pygame.Surface: The shared surface.
+        """
+
+        if self.overlay_surface is None:
+            self.overlay_surface = pygame.Surface(
+                self.screen_rect.size,
+                pygame.SRCALPHA
+            )
+            self.previous_rects = None
+
+        return self.overlay_surface
+
+    def draw(self, variables=None):
+        """Draws every visible overlay on the shared surface, and composites it
+        on the Pygame screen.
+
+        Args:
+            variables (dict, optional): Extra keyword arguments for each
+                overlay on this frame, by overlay, such as the variables of a
+                DebugOverlay or the frame time of a GraphOverlay
+                (default None).
+
+        Returns:
+            list: The rects of the screen that were changed, including the
+                rects drawn on the previous frame.
+        """
+
+        if variables is None:
+            variables = {}
+        surface = self.get_overlay_surface()
+
+        # Clear what was drawn on the previous frame
+        if self.previous_rects is None:
+            surface.fill((0, 0, 0, 0))
+        else:
+            for rect in self.previous_rects:
+                surface.fill((0, 0, 0, 0), rect)
+
+        # Draw the overlays in screen space first, beneath the panels
+        rects = []
+        panels = []
+        for overlay in self.overlays:
+            options = self.overlay_options[overlay]
+            if overlay in variables:
+                options = {**options, **variables[overlay]}
+
+            # Hidden overlays only record their values, such as the frame
+            # times of a GraphOverlay
+            if not self.visible or not overlay.visible:
+                record_values = getattr(overlay, "record_values", None)
+                if record_values is not None:
+                    record_values(**options)
+                continue
+
+            if hasattr(overlay, "draw_rects"):
+                overlay.update_rects(**options)
+                rects.extend(overlay.draw_rects(surface))
+            else:
+                anchor = self.overlay_anchors[overlay]
+                panel = overlay.get_panel(anchor, **options)
+                if panel is not None:
+                    panels.append((anchor, panel))
+
+        # Stack the panels at their anchors
+        rects.extend(self.draw_panels(surface, panels))
+
+        # Composite only the areas drawn on, unless there are too many
+        if len(rects) > self.max_areas:
+            self.screen.blit(surface, (0, 0))
+        else:
+            self.screen.blits([(surface, rect, rect) for rect in rects], False)
+
+        # The areas drawn on the previous frame changed too
+        if self.previous_rects is None or len(rects) > self.max_areas:
+            changed_rects = [self.screen_rect.copy()]
+        else:
+            changed_rects = self.previous_rects + rects
+
+        # Next frame, clear the whole surface if too much was drawn
+        if len(rects) > self.max_areas:
+            self.previous_rects = None
+        else:
+            self.previous_rects = rects
+
+        return changed_rects
+
+    def draw_panels(self, surface, panels):
+        """Draws panels on a surface, stacked at their anchors.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            panels (list): The (anchor, panel) tuples to draw, in stacking
+                order.
+
+        Returns:
+            list: The rects of the surface that were drawn on.
+        """
+
+        # Distance of the next panel from the edge, at each anchor
+        offsets = dict.fromkeys(self.anchors, self.margin)
+        width, height = surface.get_size()
+
+        rects = []
+        for anchor, panel in panels:
+            rect = panel.get_rect()
+            if anchor.startswith("top"):
+                rect.top = offsets[anchor]
+            else:
+                rect.bottom = height - offsets[anchor]
+            if anchor.endswith("left"):
+                rect.left = self.margin
+            else:
+                rect.right = width - self.margin
+            offsets[anchor] += rect.height + self.spacing
+
+            # Panels cover the screen space overlays beneath them
+            surface.fill((0, 0, 0, 0), rect)
+            surface.blit(panel, rect)
+            rects.append(rect)
+
+        return rects
@@ -0,0 +1,273 @@
+import functools
+from array import array
+from time import perf_counter_ns
+from pygkit.debug.debug_overlay import DebugOverlay
+
+
+class ProfilerSection:
+    """A timed section of a Profiler, used as a context manager.
+
+    The duration of each run is stored in a preallocated ring buffer, so
+    timing a section does not allocate memory. Sections are not re-entrant;
+    nesting a section inside itself records only the inner run.
+
+    Args:
+        name (str): The name of the section.
+        buffer_size (int): The number of runs to keep.
+    """
+
+    __slots__ = ("name", "samples", "index", "count", "start")
+
+    def __init__(self, name, buffer_size):
+        """Initializes the ProfilerSection with an empty ring buffer.
+
+        Args:
+            name (str): The name of the section.
+            buffer_size (int): The number of runs to keep.
+
+        Returns:
+            None
+        """
+
+        # Member variables
+        self.name = name
+
+        # Ring buffer of run durations in nanoseconds
+        self.samples = array("q", bytes(8 * buffer_size))
+        self.index = 0
+        self.count = 0
+
+        # Start time of the current run
+        self.start = 0
+
+    def __enter__(self):
+        """Starts timing a run of the section.
+
+        Returns:
+            ProfilerSection: This section.
+        """
+
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops timing the run and stores its duration.
+
+        Args:
+            exc_type (type): The type of the exception raised, if any.
+            exc_value (Exception): The exception raised, if any.
+            traceback (traceback): The traceback of the exception, if any.
+
+        Returns:
+            bool: False, so exceptions are not suppressed.
+        """
+
+        # Store the duration inline, since this runs on every section exit
+        duration = perf_counter_ns() - self.start
+        samples = self.samples
+        samples[self.index] = duration
+        self.index += 1
+        if self.index == len(samples):
+            self.index = 0
+        if self.count < len(samples):
+            self.count += 1
+
+        return False
+
+    def get_stats(self):
+        """Returns the rolling statistics of the section.
+
+        Returns:
+            dict: The number of runs kept, and the mean, 95th percentile, and
+                maximum run durations in milliseconds.
+        """
+
+        # Return zeros if the section has not run yet
+        if self.count == 0:
+            return {"count": 0, "mean": 0.0, "p95": 0.0, "max": 0.0}
+
+        # The buffer is only partly filled until it wraps around
+        samples = sorted(self.samples[:self.count])
+        p95_index = min(self.count - 1, int(self.count * 0.95))
+
+        return {
+            "count": self.count,
+            "mean": sum(samples) / self.count / 1e6,
+            "p95": samples[p95_index] / 1e6,
+            "max": samples[-1] / 1e6
+        }
+
+    def reset(self):
+        """Clears the ring buffer.
+
+        Returns:
+            None
+        """
+
+        self.index = 0
+        self.count = 0
+
+
+class Profiler:
+    """A low-overhead profiler that times named sections of a frame.
+
+    Sections are timed with a context manager or a decorator:
+
+        with profiler.section("physics"):
+            world.step()
+
+        @profiler.profile("draw")
+        def draw():
+            ...
+
+    For the lowest overhead in hot loops, keep the section returned by
+    section() and reuse it instead of looking it up by name every frame.
+
+    Args:
+        buffer_size (int, optional): The number of runs kept per section
+            (default 240).
+    """
+
+    def __init__(self, buffer_size=240):
+        """Initializes the Profiler with no sections.
+
+        Args:
+            buffer_size (int, optional): The number of runs kept per section
+                (default 240).
+
+        Raises:
+            TypeError: If buffer_size is not an integer.
+            ValueError: If buffer_size is not positive.
+
+        Returns:
+            None
+        """
+
+        # Check for invalid arguments
+        if not isinstance(buffer_size, int):
+            raise TypeError("buffer_size must be an integer")
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be greater than 0")
+
+        # Member variables
+        self.buffer_size = buffer_size
+        self.sections = {}
+
+    def section(self, name):
+        """Returns the section with the given name, creating it if needed.
+
+        Args:
+            name (str): The name of the section.
+
+        Returns:
+            ProfilerSection: The section, usable as a context manager.
+        """
+
+        section = self.sections.get(name)
+        if section is None:
+            section = ProfilerSection(name, self.buffer_size)
+            self.sections[name] = section
+
+        return section
+
+    def profile(self, name=None):
+        """Returns a decorator that times every call of a function.
+
+        Args:
+            name (str, optional): The name of the section (default the name
+                of the function).
+
+        Returns:
+            function: The decorator.
+        """
+
+        def decorator(function):
+            section = self.section(name or function.__qualname__)
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with section:
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def get_stats(self):
+        """Returns the rolling statistics of every section.
+
+        Returns:
+            dict: The statistics of each section, by name.
+        """
+
+        return {
+            name: section.get_stats()
+            for name, section in self.sections.items()
+        }
+
+    def reset(self):
+        """Clears the ring buffers of every section.
+
+        Returns:
+            None
+        """
+
+        for section in self.sections.values():
+            section.reset()
+
+
+class ProfilerOverlay(DebugOverlay):
+    """A DebugOverlay that displays the statistics of a Profiler.
+
+    Each section is shown with its rolling mean, 95th percentile, and maximum
+    duration in milliseconds. Combine with set_refresh_rate to keep the cost
+    of the overlay itself low.
+
+    Args:
+        profiler (Profiler): The profiler to display.
+    """
+
+    def __init__(self, profiler):
+        """Initializes the ProfilerOverlay with the given profiler.
+
+        Args:
+            profiler (Profiler): The profiler to display.
+
+        Raises:
+            TypeError: If profiler is not a Profiler.
+
+        Returns:
+            None
+        """
+
+        super().__init__()
+
+        # Check for invalid arguments
+        if not isinstance(profiler, Profiler):
+            raise TypeError("profiler must be a Profiler")
+
+        # Member variables
+        self.profiler = profiler
+
+    def get_text_lines(self, **variables):
+        """Returns a list of text lines for each section, followed by the given
+        variables.
+
+        Args:
+            **variables: Extra variables to display on the overlay.
+
+        Returns:
+            list: The list of (text, color) tuples.
+        """
+
+        # Create a text line for each section
+        text_lines = []
+        for name, stats in self.profiler.get_stats().items():
+            text = f"{name}: mean {stats['mean']:.2f} ms, " \
+                f"p95 {stats['p95']:.2f} ms, max {stats['max']:.2f} ms"
+            text_lines.append((text, self.font_color))
+
+        # Add the extra variables after the sections
+        text_lines.extend(super().get_text_lines(**variables))
+
+        return text_lines
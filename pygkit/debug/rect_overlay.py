@@ -1,56 +1,140 @@
+import copy
+import math
+import weakref
 import pygame
+from pygkit.debug.overlay import (
+    DirtyRectsMixin,
+    Overlay,
+    RefreshRateMixin
+)
+from pygkit.utility.broad_phase import SpatialHash
 
 
-class RectOverlay:
+class RectOverlay(DirtyRectsMixin, RefreshRateMixin, Overlay):
     """A class for drawing rectangles around sprites.
     
     Args:
         sprite_groups (list, optional): A list of sprite groups to draw
             rectangles around (default None).
+        broad_phase (BroadPhase, optional): The broad-phase index used to
+            find colliding sprites (default SpatialHash()).
+        narrow_phase (str, optional): The test used to confirm the candidate
+            pairs, "rect", "circle", or "mask" (default "rect").
     """
 
-    def __init__(self, sprite_groups=None):
+    # Narrow-phase tests the candidate pairs can be confirmed with
+    narrow_phases = ("rect", "circle", "mask")
+
+    # Above this many pixels, the static layer is not cached, and the visible
+    # static sprites are drawn on each refresh instead
+    max_static_layer_area = 4 * 1920 * 1080
+
+    # If building the broad-phase index for each enabled pair of dynamic
+    # sprite groups indexes at most this many times as many sprites as a
+    # single build over all of them, the collision matrix is sparse, and each
+    # pair gets its own build instead of filtering the candidate pairs of
+    # the single build
+    sparse_matrix_ratio = 3
+
+    def __init__(
+            self,
+            sprite_groups=None,
+            broad_phase=None,
+            narrow_phase="rect"
+        ):
         """Initializes the RectOverlay with the given Pygame screen.
         
         Args:
             sprite_groups (list, optional): A list of sprite groups to draw
                 rectangles around (default None).
-                
+            broad_phase (BroadPhase, optional): The broad-phase index used to
+                find colliding sprites (default SpatialHash()).
+            narrow_phase (str, optional): The test used to confirm the
+                candidate pairs, "rect", "circle", or "mask" (default "rect").
+
+        Raises:
+            ValueError: If the narrow phase is invalid.
+
         Returns:
             None
         """
 
+        super().__init__()
+
         # Member variables
+        if sprite_groups is None:
+            sprite_groups = []
         self.sprite_groups = sprite_groups
 
-        # Screen variable
-        self.screen = pygame.display.get_surface()
+        # Broad-phase index, rebuilt from the sprite rects every frame
+        if broad_phase is None:
+            broad_phase = SpatialHash()
+        self.broad_phase = broad_phase
 
-        # Flag indicating whether the RectOverlay is visible
-        self.visible = True
+        # Sprite groups whose sprites never move, the sprites and broad-phase
+        # index of each, as (sprites, index) tuples by sprite group, and the
+        # colliding sprite pairs between them, as (pairs, count) tuples by
+        # (group_a, group_b) tuple
+        self.static_groups = set()
+        self.static_caches = {}
+        self.static_pair_cache = {}
 
-        # Surface used to draw the RectOverlay, set to the size of the screen
-        self.overlay_surface = pygame.Surface(
-            pygame.display.get_surface().get_size(),
-            pygame.SRCALPHA
-        )
+        # Surface the rectangles of the static sprites are drawn on once, the
+        # area it covers at the camera zoom, and the (color, width, zoom) it
+        # was drawn with
+        self.static_layer = None
+        self.static_layer_rect = None
+        self.static_layer_key = None
 
-    def toggle_visible(self, enabled=None):
-        """Toggles the visibility of the DebugOverlay.
+        # Camera offset in world coordinates, camera zoom, and whether only
+        # sprites in the viewport are tested for collisions
+        self.camera_offset = (0, 0)
+        self.camera_zoom = 1
+        self.cull_collisions = False
 
-        Args:
-            enabled (bool, optional): Whether to enable the overlay 
-                (default None).
+        # Narrow-phase test, and the masks built from sprite images for the
+        # mask test, as (image, mask) tuples by sprite
+        self.narrow_phase = None
+        self.set_narrow_phase(narrow_phase)
+        self.mask_cache = weakref.WeakKeyDictionary()
+
+        # Sprite group pairs checked for collisions, as (group_a, group_b)
+        # tuples in both orders, or None to check every pair
+        self.collision_matrix = None
+
+        # Colliding sprite pairs found on the last refresh, and the number of
+        # them by (i, j) tuple of sprite group indexes, with i <= j
+        self.collision_pairs = []
+        self.collision_counts = {}
+
+        # Rectangles sampled on the last refresh, as (color, rect) tuples,
+        # and the width they are drawn with
+        self.sampled_rects = None
+        self.sampled_width = 1
+
+        # Static layer and the area of the screen it was placed at on the last
+        # refresh, as a (layer, rect) tuple, or None if it is not drawn
+        self.sampled_layer = None
+
+        # Number of frames that reused the last refresh instead of testing
+        # for collisions
+        self.frames_skipped = 0
+
+        # Surface used to draw the RectOverlay, set to the size of the screen
+        # when first needed, so overlays drawn by an OverlayManager or in
+        # dirty rect mode never allocate it
+        self.overlay_surface = None
+
+    def handle_resize(self):
+        """Updates the screen after a resize. The overlay surface is
+        reallocated at the new size on the next draw.
 
         Returns:
             None
         """
 
-        # Toggle the visibility if enabled is None, or set it to the given value
-        if enabled is None:
-            self.visible = not self.visible
-        else:
-            self.visible = enabled
+        super().handle_resize()
+        self.overlay_surface = None
 
     def add_sprite_group(self, sprite_group):
         """Adds a sprite group to the RectOverlay.
@@ -78,14 +162,1193 @@ class RectOverlay:
         # Remove the sprite group from the list of sprite groups
         self.sprite_groups.remove(sprite_group)
 
+        # Remove the sprite group from the collision matrix
+        if self.collision_matrix is not None:
+            self.collision_matrix = {
+                pair for pair in self.collision_matrix
+                if sprite_group not in pair
+            }
+
+        # Forget the sprite group if it was static
+        if sprite_group in self.static_groups:
+            self.static_groups.discard(sprite_group)
+            self.invalidate_static(sprite_group)
+
+    def set_broad_phase(self, broad_phase):
+        """Sets the broad-phase index used to find colliding sprites.
+
+        Args:
+            broad_phase (BroadPhase): The broad-phase index to use, such as
+                SpatialHash or SweepAndPrune.
+
+        Returns:
+            None
+        """
+
+        self.broad_phase = broad_phase
+        self.invalidate_static()
+
+    def set_static(self, sprite_group, static=True):
+        """Sets whether the sprites of a sprite group never move.
+
+        The broad-phase index of a static sprite group is built once, and only
+        the other sprites are tested against it on each refresh. Collisions
+        between static sprite groups are only tested once. The rectangles of
+        the static sprites are drawn once on a cached layer, and only the
+        colliding ones are redrawn on each refresh. Everything is rebuilt
+        when the sprites of a static sprite group change. Call
+        invalidate_static() after moving a static sprite.
+
+        Args:
+            sprite_group (pygame.sprite.Group): The sprite group to set.
+            static (bool, optional): Whether the sprites never move
+                (default True).
+
+        Raises:
+            ValueError: If the sprite group was not added.
+
+        Returns:
+            None
+        """
+
+        if sprite_group not in self.sprite_groups:
+            raise ValueError("sprite group was not added")
+
+        if static:
+            self.static_groups.add(sprite_group)
+        else:
+            self.static_groups.discard(sprite_group)
+        self.invalidate_static(sprite_group)
+
+    def invalidate_static(self, sprite_group=None):
+        """Rebuilds the cached broad-phase index, collisions, and layer of a
+        static sprite group on the next refresh.
+
+        Args:
+            sprite_group (pygame.sprite.Group, optional): The sprite group to
+                rebuild, or None to rebuild every static sprite group
+                (default None).
+
+        Returns:
+            None
+        """
+
+        if sprite_group is None:
+            self.static_caches = {}
+            self.static_pair_cache = {}
+        else:
+            self.static_caches.pop(sprite_group, None)
+            self.static_pair_cache = {
+                pair: cached
+                for pair, cached in self.static_pair_cache.items()
+                if sprite_group not in pair
+            }
+        self.static_layer = None
+        self.static_layer_key = None
+
+    def get_static_cache(self, sprite_group):
+        """Returns the sprites and broad-phase index of a static sprite
+        group, rebuilding them if its sprites changed.
+
+        Args:
+            sprite_group (pygame.sprite.Group): The static sprite group.
+
+        Returns:
+            tuple: The list of sprites, and the broad-phase index built from
+                their bounds.
+        """
+
+        sprites = sprite_group.sprites()
+        cached = self.static_caches.get(sprite_group)
+        if cached is not None and cached[0] == sprites:
+            return cached
+
+        # Build a copy of the broad-phase index for this sprite group only
+        self.invalidate_static(sprite_group)
+        index = copy.copy(self.broad_phase)
+        index.build([self.get_bounds(sprite) for sprite in sprites])
+        self.static_caches[sprite_group] = (sprites, index)
+
+        return sprites, index
+
+    def update_static_layer(self, color, width):
+        """Draws the rectangles of the static sprites on the static layer at
+        the camera zoom, unless they are already drawn with the same color,
+        width, and zoom. If the layer would be too large, it is not drawn.
+
+        Args:
+            color (str): The color of the rectangles.
+            width (int): The width of the rectangles.
+
+        Returns:
+            None
+        """
+
+        # Check the static sprite groups for changes first
+        sprites = []
+        for sprite_group in self.sprite_groups:
+            if sprite_group in self.static_groups:
+                sprites.extend(self.get_static_cache(sprite_group)[0])
+
+        key = (color, width, self.camera_zoom)
+        if self.static_layer_key == key:
+            return
+        self.static_layer = None
+        self.static_layer_key = key
+        if not sprites:
+            return
+
+        # Draw the rectangles on a surface covering only the static sprites,
+        # in world coordinates scaled by the zoom
+        rects = [
+            self.world_to_screen(sprite.rect, (0, 0))
+            for sprite in sprites
+        ]
+        area = rects[0].unionall(rects[1:])
+        if area.width * area.height > self.max_static_layer_area:
+            return
+        layer = pygame.Surface(area.size, pygame.SRCALPHA)
+        for rect in rects:
+            pygame.draw.rect(layer, color, rect.move(-area.x, -area.y), width)
+
+        self.static_layer = layer
+        self.static_layer_rect = area
+
+    def set_camera(self, offset=(0, 0), zoom=1, cull_collisions=False):
+        """Sets the camera the sprite rects are drawn through.
+
+        Sprite rects are in world coordinates, and are drawn at
+        (rect.topleft - offset) * zoom on the screen. Only sprites in the
+        viewport, the area of the world on the screen, are drawn. Call this
+        whenever the camera moves.
+
+            overlay.set_camera(camera.offset, camera.zoom)
+
+        Args:
+            offset (tuple, optional): The world coordinates of the top left
+                corner of the screen (default (0, 0)).
+            zoom (int or float, optional): The number of screen pixels per
+                world pixel (default 1).
+            cull_collisions (bool, optional): Whether to test only the sprites
+                in the viewport for collisions (default False).
+
+        Raises:
+            TypeError: If offset is not a pair of numbers, zoom is not a
+                number, or cull_collisions is not a boolean.
+            ValueError: If zoom is not positive.
+
+        Returns:
+            None
+        """
+
+        # Check for invalid arguments, such as True passed as a zoom of 1
+        try:
+            offset_x, offset_y = offset
+        except (TypeError, ValueError):
+            raise TypeError("offset must be a pair of numbers") from None
+        for value in (offset_x, offset_y):
+            if isinstance(value, bool) or \
+                    not isinstance(value, (int, float)):
+                raise TypeError("offset must be a pair of numbers")
+        if isinstance(zoom, bool) or not isinstance(zoom, (int, float)):
+            raise TypeError("zoom must be a number")
+        if zoom <= 0:
+            raise ValueError("zoom must be greater than 0")
+        if not isinstance(cull_collisions, bool):
+            raise TypeError("cull_collisions must be a boolean")
+
+        self.camera_offset = (offset_x, offset_y)
+        self.camera_zoom = zoom
+        self.cull_collisions = cull_collisions
+
+    def get_viewport(self):
+        """Returns the area of the world on the screen.
+
+        Returns:
+            pygame.Rect: The viewport in world coordinates.
+        """
+
+        zoom = self.camera_zoom
+        left = math.floor(self.camera_offset[0])
+        top = math.floor(self.camera_offset[1])
+
+        return pygame.Rect(
+            left,
+            top,
+            math.ceil(self.screen_rect.width / zoom) + 1,
+            math.ceil(self.screen_rect.height / zoom) + 1
+        )
+
+    def world_to_screen(self, rect, offset=None):
+        """Converts a rect in world coordinates to screen coordinates, using
+        the camera.
+
+        Args:
+            rect (pygame.Rect): The rect in world coordinates.
+            offset (tuple, optional): The camera offset to use instead of the
+                camera offset of the RectOverlay (default None).
+
+        Returns:
+            pygame.Rect: A new rect in screen coordinates.
+        """
+
+        if offset is None:
+            offset = self.camera_offset
+        zoom = self.camera_zoom
+
+        # Scale the edges, so neighbouring rects stay aligned
+        offset_x = math.floor(offset[0] * zoom)
+        offset_y = math.floor(offset[1] * zoom)
+        if zoom == 1:
+            return rect.move(-offset_x, -offset_y)
+        left = math.floor(rect.left * zoom)
+        top = math.floor(rect.top * zoom)
+
+        return pygame.Rect(
+            left - offset_x,
+            top - offset_y,
+            math.floor(rect.right * zoom) - left,
+            math.floor(rect.bottom * zoom) - top
+        )
+
+    def cull(self, sprites, viewport):
+        """Returns the sprites whose rects overlap the viewport.
+
+        Args:
+            sprites (list): The sprites to cull.
+            viewport (pygame.Rect): The viewport in world coordinates.
+
+        Returns:
+            list: The sprites in the viewport.
+        """
+
+        indexes = viewport.collidelistall([sprite.rect for sprite in sprites])
+
+        return [sprites[index] for index in indexes]
+
+    def set_collision_matrix(self, group_pairs=None):
+        """Sets which sprite group pairs are checked for collisions.
+
+        Sprite groups that can never interact, such as scenery against
+        scenery, can be left out so their sprites are never tested against
+        each other. A sprite group is only checked against itself if it is
+        paired with itself. Sprite groups added later are not checked until
+        they are paired. Calling this with no arguments checks every pair
+        again.
+
+            overlay.set_collision_matrix([
+                (players, enemies),
+                (players, scenery),
+                (enemies, enemies)
+            ])
+
+        Args:
+            group_pairs (list, optional): The (group_a, group_b) tuples of the
+                sprite group pairs to check (default None).
+
+        Raises:
+            ValueError: If a sprite group was not added.
+
+        Returns:
+            None
+        """
+
+        if group_pairs is None:
+            self.collision_matrix = None
+            return
+
+        collision_matrix = set()
+        for group_a, group_b in group_pairs:
+            for sprite_group in (group_a, group_b):
+                if sprite_group not in self.sprite_groups:
+                    raise ValueError("sprite group was not added")
+            collision_matrix.add((group_a, group_b))
+            collision_matrix.add((group_b, group_a))
+        self.collision_matrix = collision_matrix
+
+    def set_group_pair(self, sprite_group_a, sprite_group_b, enabled=True):
+        """Sets whether one sprite group pair is checked for collisions. If no
+        collision matrix is set, every other pair stays checked.
+
+        Args:
+            sprite_group_a (pygame.sprite.Group): The first sprite group.
+            sprite_group_b (pygame.sprite.Group): The second sprite group, or
+                the first one again for collisions within it.
+            enabled (bool, optional): Whether to check the pair
+                (default True).
+
+        Raises:
+            ValueError: If a sprite group was not added.
+
+        Returns:
+            None
+        """
+
+        for sprite_group in (sprite_group_a, sprite_group_b):
+            if sprite_group not in self.sprite_groups:
+                raise ValueError("sprite group was not added")
+
+        # Start from every pair of the current sprite groups
+        if self.collision_matrix is None:
+            self.collision_matrix = {
+                (group_a, group_b)
+                for group_a in self.sprite_groups
+                for group_b in self.sprite_groups
+            }
+
+        pairs = {
+            (sprite_group_a, sprite_group_b),
+            (sprite_group_b, sprite_group_a)
+        }
+        if enabled:
+            self.collision_matrix |= pairs
+        else:
+            self.collision_matrix -= pairs
+
+    def get_group_pairs(self):
+        """Returns the sprite group pairs checked for collisions.
+
+        Returns:
+            list: The (i, j) tuples of sprite group indexes, with i <= j.
+        """
+
+        sprite_groups = self.sprite_groups
+        count = len(sprite_groups)
+        group_pairs = []
+        for i in range(count):
+            for j in range(i, count):
+                if self.collision_matrix is None or (
+                    (sprite_groups[i], sprite_groups[j])
+                    in self.collision_matrix
+                ):
+                    group_pairs.append((i, j))
+
+        return group_pairs
+
+    def set_narrow_phase(self, narrow_phase):
+        """Sets the test used to confirm the candidate pairs returned by the
+        broad-phase index.
+
+        The "rect" test uses colliderect, the "circle" test uses
+        pygame.sprite.collide_circle, and the "mask" test uses
+        pygame.sprite.collide_mask, with the masks of the sprite images cached
+        until the images are replaced.
+
+        Args:
+            narrow_phase (str): The narrow-phase test, "rect", "circle", or
+                "mask".
+
+        Raises:
+            ValueError: If the narrow phase is invalid.
+
+        Returns:
+            None
+        """
+
+        if narrow_phase not in self.narrow_phases:
+            raise ValueError(
+                "Invalid narrow phase. Must be \"rect\", \"circle\", or " \
+                "\"mask\"."
+            )
+        self.narrow_phase = narrow_phase
+        self.invalidate_static()
+
+    def get_mask(self, sprite):
+        """Returns the mask of a sprite for the mask test.
+
+        The mask attribute of the sprite is used if it has one. Otherwise, a
+        mask is built from the image of the sprite and cached until the sprite
+        gets a new image. Images drawn on in place keep their cached mask.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite to get the mask of.
+
+        Returns:
+            pygame.mask.Mask: The mask of the sprite, or None if the sprite has
+                neither a mask nor an image.
+        """
+
+        # Use the mask of the sprite if it has one
+        mask = getattr(sprite, "mask", None)
+        if mask is not None:
+            return mask
+
+        # Otherwise, build one from the image, unless it is cached
+        image = getattr(sprite, "image", None)
+        if image is None:
+            return None
+        cached = self.mask_cache.get(sprite)
+        if cached is not None and cached[0] is image:
+            return cached[1]
+        mask = pygame.mask.from_surface(image)
+        self.mask_cache[sprite] = (image, mask)
+
+        return mask
+
+    def get_bounds(self, sprite):
+        """Returns the rect the narrow-phase test of a sprite fits in, which
+        is passed to the broad-phase index.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite to get the bounds of.
+
+        Returns:
+            pygame.Rect: The bounds of the sprite.
+        """
+
+        # The circle test can reach past the corners of the rect
+        if self.narrow_phase == "circle":
+            rect = sprite.rect
+            radius = getattr(sprite, "radius", None)
+            if radius is None:
+                radius = math.hypot(rect.width, rect.height) / 2
+
+            # Touching circles collide, so the bounds reach one pixel past
+            # the circle on each side of its center
+            size = math.ceil(radius) * 2 + 1
+            bounds = pygame.Rect(0, 0, size, size)
+            bounds.center = rect.center
+            return bounds
+
+        return sprite.rect
+
+    def is_colliding(self, sprite_a, sprite_b):
+        """Checks whether two sprites collide using the narrow-phase test.
+
+        Args:
+            sprite_a (pygame.sprite.Sprite): The first sprite.
+            sprite_b (pygame.sprite.Sprite): The second sprite.
+
+        Returns:
+            bool: True if the sprites collide, False otherwise.
+        """
+
+        rect_a = sprite_a.rect
+        rect_b = sprite_b.rect
+        if self.narrow_phase == "circle":
+            return pygame.sprite.collide_circle(sprite_a, sprite_b)
+        if not rect_a.colliderect(rect_b):
+            return False
+        if self.narrow_phase == "rect":
+            return True
+
+        # Fall back to the rect test for sprites without a mask or image
+        mask_a = self.get_mask(sprite_a)
+        mask_b = self.get_mask(sprite_b)
+        if mask_a is None or mask_b is None:
+            return True
+        offset = (rect_b.x - rect_a.x, rect_b.y - rect_a.y)
+
+        return mask_a.overlap(mask_b, offset) is not None
+
+    def find_collisions(self):
+        """Finds the colliding sprite pairs, and counts them by sprite group
+        pair.
+
+        Only the candidate pairs returned by the broad-phase index are tested
+        with the narrow-phase test. If a collision matrix is set, only the
+        sprite group pairs it enables are checked. Static sprite groups are
+        only tested against the other sprite groups. The results are kept in
+        collision_pairs and collision_counts until the next call.
+
+        Returns:
+            list: The (sprite_a, sprite_b) tuples of the colliding sprites.
+        """
+
+        if self.collision_matrix is None and not self.static_groups:
+            pairs, counts = self.test_all_groups()
+        else:
+            pairs, counts = self.test_group_pairs()
+
+        self.collision_pairs = pairs
+        self.collision_counts = counts
+
+        return pairs
+
+    def test_all_groups(self):
+        """Tests every sprite in the sprite groups against every other sprite.
+
+        The bounds of all sprites are collected once and passed to the
+        broad-phase index in a single build.
+
+        Returns:
+            tuple: The list of colliding sprite pairs, and the dict of their
+                counts by sprite group pair.
+        """
+
+        group_sprites = self.get_group_sprites(range(len(self.sprite_groups)))
+        sprites, sprite_indexes = self.build_index(group_sprites)
+        pairs = []
+        counts = {}
+        self.test_dynamic_groups(sprites, sprite_indexes, {}, pairs, counts)
+
+        return pairs, counts
+
+    def test_group_pairs(self):
+        """Tests the sprites of each sprite group pair enabled in the collision
+        matrix against each other, skipping the disabled pairs entirely.
+
+        The broad-phase index is built once from the sprites of every dynamic
+        sprite group, like test_all_groups(), and only the candidate pairs in
+        enabled group pairs are tested. If the collision matrix is sparse,
+        each enabled pair of dynamic sprite groups builds the index from the
+        sprites of its two groups instead. The cached index of each static
+        sprite group is matched against the index of the dynamic sprites, and
+        pairs of static sprite groups reuse their cached results. Sprite pairs
+        found by more than one group pair are only tested once.
+
+        Returns:
+            tuple: The list of colliding sprite pairs, and the dict of their
+                counts by sprite group pair.
+        """
+
+        sprite_groups = self.sprite_groups
+
+        # Sort the enabled pairs into pairs of dynamic groups, dynamic groups
+        # paired with each static group, and pairs of static groups
+        dynamic_pairs = []
+        static_queries = {}
+        static_pairs = []
+        for i, j in self.get_group_pairs():
+            static_a = sprite_groups[i] in self.static_groups
+            static_b = sprite_groups[j] in self.static_groups
+            if static_a and static_b:
+                static_pairs.append((i, j))
+            elif static_a:
+                static_queries.setdefault(i, []).append(j)
+            elif static_b:
+                static_queries.setdefault(j, []).append(i)
+            else:
+                dynamic_pairs.append((i, j))
+
+        # Collect the sprites of each dynamic group only if one of its pairs
+        # is enabled
+        dynamic_indexes = set()
+        for pair in dynamic_pairs:
+            dynamic_indexes.update(pair)
+        for indexes in static_queries.values():
+            dynamic_indexes.update(indexes)
+        group_sprites = self.get_group_sprites(sorted(dynamic_indexes))
+
+        results = {}
+        pairs = []
+        counts = {}
+
+        # Test the dynamic groups with a single build, unless the collision
+        # matrix is sparse
+        sprites = None
+        if not self.is_sparse(dynamic_pairs, group_sprites):
+            # Only filter the candidate pairs if some pairs of the dynamic
+            # groups are disabled
+            enabled = None
+            count = len(group_sprites)
+            if len(dynamic_pairs) < count * (count + 1) // 2:
+                enabled = set(dynamic_pairs)
+            sprites, sprite_indexes = self.build_index(group_sprites)
+            self.test_dynamic_groups(
+                sprites,
+                sprite_indexes,
+                results,
+                pairs,
+                counts,
+                enabled
+            )
+        else:
+            for i, j in dynamic_pairs:
+                self.test_dynamic_pair(
+                    i,
+                    j,
+                    group_sprites,
+                    results,
+                    pairs,
+                    counts
+                )
+
+        # Match the cached index of each static group against the index of
+        # the dynamic sprites
+        if static_queries:
+            if sprites is None:
+                sprites, sprite_indexes = self.build_index({
+                    index: group_sprites[index]
+                    for indexes in static_queries.values()
+                    for index in indexes
+                })
+            for static_index, indexes in static_queries.items():
+                self.test_static_group(
+                    static_index,
+                    indexes,
+                    sprites,
+                    sprite_indexes,
+                    results,
+                    pairs,
+                    counts
+                )
+
+        # Reuse the collisions between static sprite groups
+        viewport = None
+        if self.cull_collisions:
+            viewport = self.get_viewport()
+        for i, j in static_pairs:
+            count = self.test_static_pair(
+                sprite_groups[i],
+                sprite_groups[j],
+                results,
+                pairs,
+                viewport
+            )
+            if count:
+                counts[(i, j)] = count
+
+        return pairs, counts
+
+    def is_sparse(self, dynamic_pairs, group_sprites):
+        """Checks whether so few pairs of dynamic sprite groups are enabled
+        that building the broad-phase index for each pair is cheaper than a
+        single build over all of them.
+
+        Args:
+            dynamic_pairs (list): The enabled (i, j) tuples of dynamic sprite
+                group indexes.
+            group_sprites (dict): The list of sprites of each dynamic sprite
+                group, by sprite group index.
+
+        Returns:
+            bool: True if each pair should get its own build, False otherwise.
+        """
+
+        if self.collision_matrix is None or not dynamic_pairs:
+            return False
+
+        single_build = sum(len(sprites) for sprites in group_sprites.values())
+        pair_builds = 0
+        for i, j in dynamic_pairs:
+            pair_builds += len(group_sprites[i])
+            if i != j:
+                pair_builds += len(group_sprites[j])
+
+        return pair_builds <= self.sparse_matrix_ratio * single_build
+
+    def get_group_sprites(self, group_indexes):
+        """Returns the sprites of sprite groups, only those in the viewport if
+        culling.
+
+        Args:
+            group_indexes (list): The indexes of the sprite groups.
+
+        Returns:
+            dict: The list of sprites of each sprite group, by sprite group
+                index.
+        """
+
+        viewport = None
+        if self.cull_collisions:
+            viewport = self.get_viewport()
+
+        group_sprites = {}
+        for group_index in group_indexes:
+            sprites = list(self.sprite_groups[group_index])
+            if viewport is not None:
+                sprites = self.cull(sprites, viewport)
+            group_sprites[group_index] = sprites
+
+        return group_sprites
+
+    def build_index(self, group_sprites):
+        """Builds the broad-phase index once from the sprites of several
+        sprite groups.
+
+        Args:
+            group_sprites (dict): The list of sprites of each sprite group, by
+                sprite group index.
+
+        Returns:
+            tuple: The list of sprites the index was built from, each only
+                once even if it is in more than one group, and the dict of
+                the tuple of indexes of the groups each sprite is in.
+        """
+
+        sprites = []
+        sprite_indexes = {}
+        for group_index, group in group_sprites.items():
+            for sprite in group:
+                indexes = sprite_indexes.get(sprite)
+                if indexes is None:
+                    sprite_indexes[sprite] = (group_index,)
+                    sprites.append(sprite)
+                else:
+                    sprite_indexes[sprite] = indexes + (group_index,)
+
+        self.broad_phase.build([self.get_bounds(sprite) for sprite in sprites])
+
+        return sprites, sprite_indexes
+
+    def test_dynamic_groups(
+            self,
+            sprites,
+            sprite_indexes,
+            results,
+            pairs,
+            counts,
+            enabled=None
+        ):
+        """Tests the candidate pairs of the broad-phase index built by
+        build_index(). This must be the first test of the refresh.
+
+        Args:
+            sprites (list): The sprites the index was built from.
+            sprite_indexes (dict): The indexes of the groups each sprite is
+                in.
+            results (dict): The results of the sprite pairs tested on this
+                refresh, by (sprite_a, sprite_b) tuple.
+            pairs (list): The colliding sprite pairs found on this refresh.
+            counts (dict): The number of colliding sprite pairs found on this
+                refresh, by (i, j) tuple of sprite group indexes.
+            enabled (set, optional): The (i, j) tuples of the group pairs to
+                test, with i <= j, or None to test every pair (default None).
+
+        Returns:
+            None
+        """
+
+        # Group pairs counted for each combination of groups two sprites are
+        # in, found once per combination
+        group_keys = {}
+
+        # Each candidate pair is only returned once, so the pairs are tested
+        # directly, and only the colliding ones are added to the results for
+        # the tests that follow
+        for a, b in self.broad_phase.get_pairs():
+            sprite_a = sprites[a]
+            sprite_b = sprites[b]
+            membership = (sprite_indexes[sprite_a], sprite_indexes[sprite_b])
+
+            # Skip the sprites whose group pairs are all disabled before the
+            # narrow-phase test
+            if enabled is not None:
+                keys = group_keys.get(membership)
+                if keys is None:
+                    keys = self.get_group_keys(membership, enabled)
+                    group_keys[membership] = keys
+                if not keys:
+                    continue
+            if not self.is_colliding(sprite_a, sprite_b):
+                continue
+            if enabled is None:
+                keys = group_keys.get(membership)
+                if keys is None:
+                    keys = self.get_group_keys(membership, enabled)
+                    group_keys[membership] = keys
+            self.add_pair(sprite_a, sprite_b, results, pairs)
+
+            # Count the pair once for each pair of groups the sprites are in
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+
+    def get_group_keys(self, membership, enabled=None):
+        """Returns the group pairs a sprite pair counts for, once for each
+        pair of groups the two sprites are in.
+
+        Args:
+            membership (tuple): The tuples of indexes of the groups each of
+                the two sprites is in.
+            enabled (set, optional): The (i, j) tuples of the group pairs to
+                count, with i <= j, or None to count every pair
+                (default None).
+
+        Returns:
+            list: The (i, j) tuples of sprite group indexes, with i <= j.
+        """
+
+        keys = []
+        for group_a in membership[0]:
+            for group_b in membership[1]:
+                key = (min(group_a, group_b), max(group_a, group_b))
+                if enabled is None or key in enabled:
+                    keys.append(key)
+
+        return keys
+
+    def test_dynamic_pair(self, i, j, group_sprites, results, pairs, counts):
+        """Tests the sprites of two dynamic sprite groups against each other,
+        or the sprites of one against themselves, with the broad-phase index
+        built from the sprites of the two groups.
+
+        Args:
+            i (int): The index of the first sprite group.
+            j (int): The index of the second sprite group, or i again.
+            group_sprites (dict): The list of sprites of each sprite group, by
+                sprite group index.
+            results (dict): The results of the sprite pairs tested on this
+                refresh, by (sprite_a, sprite_b) tuple.
+            pairs (list): The colliding sprite pairs found on this refresh.
+            counts (dict): The number of colliding sprite pairs found on this
+                refresh, by (i, j) tuple of sprite group indexes.
+
+        Returns:
+            None
+        """
+
+        # Build the broad-phase index from both groups, and only return the
+        # candidate pairs between them
+        if i == j:
+            sprites = group_sprites[i]
+            self.broad_phase.build(
+                [self.get_bounds(sprite) for sprite in sprites]
+            )
+            candidates = self.broad_phase.get_pairs()
+        else:
+            sprites = group_sprites[i] + group_sprites[j]
+            self.broad_phase.build(
+                [self.get_bounds(sprite) for sprite in sprites]
+            )
+            candidates = self.broad_phase.get_pairs_between(
+                len(group_sprites[i])
+            )
+
+        count = 0
+        for a, b in candidates:
+            if self.test_pair(sprites[a], sprites[b], results, pairs):
+                count += 1
+        if count:
+            counts[(i, j)] = count
+
+    def test_static_group(
+            self,
+            static_index,
+            dynamic_indexes,
+            sprites,
+            sprite_indexes,
+            results,
+            pairs,
+            counts
+        ):
+        """Tests the dynamic sprites in the broad-phase index built by
+        build_index() against the sprites of a static sprite group, matching
+        the two indexes instead of rebuilding the cached one.
+
+        Args:
+            static_index (int): The index of the static sprite group.
+            dynamic_indexes (list): The indexes of the dynamic sprite groups
+                paired with the static sprite group.
+            sprites (list): The sprites the index was built from.
+            sprite_indexes (dict): The indexes of the groups each sprite is
+                in.
+            results (dict): The results of the sprite pairs tested on this
+                refresh, by (sprite_a, sprite_b) tuple.
+            pairs (list): The colliding sprite pairs found on this refresh.
+            counts (dict): The number of colliding sprite pairs found on this
+                refresh, by (i, j) tuple of sprite group indexes.
+
+        Returns:
+            None
+        """
+
+        # Group pair counted for each dynamic group paired with the static
+        # group
+        group_keys = {
+            index: (min(static_index, index), max(static_index, index))
+            for index in dynamic_indexes
+        }
+
+        # Each candidate pair is only returned once for this static group, so
+        # the pairs are tested directly
+        static_sprites, index = self.get_static_cache(
+            self.sprite_groups[static_index]
+        )
+        for i, k in self.broad_phase.get_pairs_with(index):
+            sprite = sprites[i]
+            static_sprite = static_sprites[k]
+            if sprite is static_sprite:
+                continue
+            keys = [
+                group_keys[group_index]
+                for group_index in sprite_indexes[sprite]
+                if group_index in group_keys
+            ]
+            if not keys or not self.is_colliding(sprite, static_sprite):
+                continue
+            self.add_pair(sprite, static_sprite, results, pairs)
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+
+    def test_static_pair(
+            self,
+            group_a,
+            group_b,
+            results,
+            pairs,
+            viewport=None
+        ):
+        """Tests two static sprite groups against each other, or a static
+        sprite group against itself, reusing the results until either sprite
+        group changes.
+
+        Args:
+            group_a (pygame.sprite.Group): The first static sprite group.
+            group_b (pygame.sprite.Group): The second static sprite group.
+            results (dict): The results of the sprite pairs tested on this
+                refresh, by (sprite_a, sprite_b) tuple.
+            pairs (list): The colliding sprite pairs found on this refresh.
+            viewport (pygame.Rect, optional): The viewport to only report the
+                pairs of, or None to report every pair (default None).
+
+        Returns:
+            int: The number of colliding sprite pairs between the groups.
+        """
+
+        sprites_a, index_a = self.get_static_cache(group_a)
+        sprites_b = self.get_static_cache(group_b)[0]
+
+        # Test the sprite groups only if either changed
+        cached = self.static_pair_cache.get((group_a, group_b))
+        if cached is None:
+            colliding = []
+            if group_a is group_b:
+                for a, b in index_a.get_pairs():
+                    sprite_a = sprites_a[a]
+                    sprite_b = sprites_a[b]
+                    if self.is_colliding(sprite_a, sprite_b):
+                        colliding.append((sprite_a, sprite_b))
+            else:
+                for sprite_b in sprites_b:
+                    for k in index_a.query(self.get_bounds(sprite_b)):
+                        sprite_a = sprites_a[k]
+                        if sprite_a is not sprite_b and self.is_colliding(
+                                sprite_a,
+                                sprite_b
+                            ):
+                            colliding.append((sprite_a, sprite_b))
+            cached = colliding
+            self.static_pair_cache[(group_a, group_b)] = cached
+
+        # Only report the cached pairs in the viewport if culling
+        if viewport is not None:
+            cached = [
+                (sprite_a, sprite_b) for sprite_a, sprite_b in cached
+                if viewport.colliderect(sprite_a.rect)
+                or viewport.colliderect(sprite_b.rect)
+            ]
+
+        # Add the cached pairs to the results of this refresh
+        for sprite_a, sprite_b in cached:
+            self.add_pair(sprite_a, sprite_b, results, pairs)
+
+        return len(cached)
+
+    def test_pair(self, sprite_a, sprite_b, results, pairs):
+        """Tests a candidate sprite pair with the narrow-phase test, unless it
+        was already tested on this refresh.
+
+        Args:
+            sprite_a (pygame.sprite.Sprite): The first sprite.
+            sprite_b (pygame.sprite.Sprite): The second sprite.
+            results (dict): The results of the sprite pairs tested on this
+                refresh, by (sprite_a, sprite_b) tuple.
+            pairs (list): The colliding sprite pairs found on this refresh,
+                which the pair is added to if it collides.
+
+        Returns:
+            bool: True if the sprites collide, False otherwise.
+        """
+
+        if sprite_a is sprite_b:
+            return False
+
+        # Reuse the result if another group pair tested these sprites
+        if id(sprite_a) > id(sprite_b):
+            sprite_a, sprite_b = sprite_b, sprite_a
+        key = (sprite_a, sprite_b)
+        colliding = results.get(key)
+        if colliding is None:
+            colliding = self.is_colliding(sprite_a, sprite_b)
+            results[key] = colliding
+            if colliding:
+                pairs.append(key)
+
+        return colliding
+
+    def add_pair(self, sprite_a, sprite_b, results, pairs):
+        """Adds a colliding sprite pair to the results of this refresh, unless
+        another group pair already found it.
+
+        Args:
+            sprite_a (pygame.sprite.Sprite): The first sprite.
+            sprite_b (pygame.sprite.Sprite): The second sprite.
+            results (dict): The results of the sprite pairs tested on this
+                refresh, by (sprite_a, sprite_b) tuple.
+            pairs (list): The colliding sprite pairs found on this refresh.
+
+        Returns:
+            None
+        """
+
+        if id(sprite_a) > id(sprite_b):
+            sprite_a, sprite_b = sprite_b, sprite_a
+        key = (sprite_a, sprite_b)
+        if key not in results:
+            results[key] = True
+            pairs.append(key)
+
+    def get_collision_count(self, sprite_group_a, sprite_group_b):
+        """Returns the number of colliding sprite pairs between two sprite
+        groups found on the last refresh.
+
+        Args:
+            sprite_group_a (pygame.sprite.Group): The first sprite group.
+            sprite_group_b (pygame.sprite.Group): The second sprite group, or
+                the first one again for collisions within it.
+
+        Raises:
+            ValueError: If a sprite group was not added.
+
+        Returns:
+            int: The number of colliding sprite pairs.
+        """
+
+        group_a = self.sprite_groups.index(sprite_group_a)
+        group_b = self.sprite_groups.index(sprite_group_b)
+        key = (min(group_a, group_b), max(group_a, group_b))
+
+        return self.collision_counts.get(key, 0)
+
+    def get_colliding_sprites(self):
+        """Returns the sprites that collide with at least one other sprite.
+
+        Returns:
+            set: The set of colliding sprites.
+        """
+
+        colliding = set()
+        for sprite_a, sprite_b in self.find_collisions():
+            colliding.add(sprite_a)
+            colliding.add(sprite_b)
+
+        return colliding
+
+    def sample_rects(self, normal_color, collision_color, rect_width):
+        """Samples the rectangle and color of each sprite in the sprite groups.
+
+        Args:
+            normal_color (str): The color to use for non-colliding sprites.
+            collision_color (str): The color to use for colliding sprites.
+            rect_width (int): The width of the rectangles to draw.
+
+        Returns:
+            None
+        """
+
+        # Find the colliding sprites using the broad-phase index
+        colliding_sprites = self.get_colliding_sprites()
+
+        # Draw the static sprites on the static layer, if it changed, and
+        # place the layer on the screen
+        self.sampled_layer = None
+        if self.static_groups:
+            self.update_static_layer(normal_color, rect_width)
+        if self.static_groups and self.static_layer is not None:
+            zoom = self.camera_zoom
+            layer_rect = self.static_layer_rect.move(
+                -math.floor(self.camera_offset[0] * zoom),
+                -math.floor(self.camera_offset[1] * zoom)
+            )
+            if layer_rect.colliderect(self.screen_rect):
+                self.sampled_layer = (self.static_layer, layer_rect)
+
+        # Loop through each sprite in the viewport in each sprite group
+        viewport = self.get_viewport()
+        self.sampled_rects = []
+        for sprite_group in self.sprite_groups:
+            static = sprite_group in self.static_groups
+
+            # Find the static sprites in the viewport with their index
+            if static:
+                sprites, index = self.get_static_cache(sprite_group)
+                sprites = [sprites[i] for i in sorted(index.query(viewport))]
+                layered = self.static_layer is not None
+            else:
+                sprites = sprite_group.sprites()
+                layered = False
+
+            for sprite in self.cull(sprites, viewport):
+
+                # If the sprite is colliding, use the collision color
+                if sprite in colliding_sprites:
+                    color = collision_color
+                # Static sprites that are not colliding are on the static layer
+                elif layered:
+                    continue
+                # If the sprite is not colliding, use the normal color
+                else:
+                    color = normal_color
+
+                self.sampled_rects.append(
+                    (color, self.world_to_screen(sprite.rect))
+                )
+
+        self.sampled_width = rect_width
+
+    def update_rects(
+            self,
+            normal_color="green",
+            collision_color="red",
+            rect_width=1
+        ):
+        """Samples the rectangles and their colors if a refresh is due.
+
+        Args:
+            normal_color (str, optional): The color to use for non-
+                    colliding sprites (default "green").
+            collision_color (str, optional): The color to use for colliding
+                sprites (default "red").
+            rect_width (int, optional): The width of the rectangles to draw
+                (default 1).
+
+        Returns:
+            bool: True if the rectangles were sampled, False if the rectangles
+                from the last refresh are reused.
+        """
+
+        if self.is_refresh_due() or self.sampled_rects is None:
+            self.sample_rects(normal_color, collision_color, rect_width)
+            return True
+
+        self.frames_skipped += 1
+        return False
+
+    def draw_rects(self, surface):
+        """Draws the rectangles sampled on the last refresh onto a surface.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+
+        Returns:
+            list: The rects of the surface that were drawn on.
+        """
+
+        # Draw the static layer beneath the other rectangles
+        rects = []
+        if self.sampled_layer is not None:
+            rects.append(surface.blit(*self.sampled_layer))
+
+        for color, rect in self.sampled_rects:
+            rects.append(
+                pygame.draw.rect(surface, color, rect, self.sampled_width)
+            )
+
+        return rects
+
     def draw(self, normal_color="green", collision_color="red", rect_width=1):
         """Draws the RectOverlay on the screen.
 
-        This method clears the overlay surface, and then iterates through each
-        sprite in the sprite groups. It checks for collisions between the sprite
-        and other sprites in the groups. If a collision is detected, a red
-        rectangle is drawn around the sprite; otherwise, a green rectangle is
-        drawn. Finally, the overlay surface is drawn on the screen.
+        This method finds the colliding sprites using the broad-phase index.
+        Each sprite in the sprite groups that collides with another sprite
+        gets a red rectangle drawn around it on the overlay surface;
+        otherwise, a green rectangle is drawn. Finally, the overlay surface is
+        drawn on the screen. In dirty rect mode, the rectangles are drawn
+        straight onto the screen instead. If a refresh rate is set, the
+        rectangles and colors are only sampled when a refresh is due, and the
+        rectangles from the last refresh are drawn in between. Only sprites in
+        the viewport of the camera are drawn.
 
         Args:
             normal_color (str, optional): The color to use for non-
@@ -96,57 +1359,38 @@ class RectOverlay:
                 (default 1).
 
         Returns:
-            None
+            list: The rects of the screen that were changed. In dirty rect
+                mode, these are the rectangles drawn this frame and the
+                previous frame; otherwise, the whole screen.
         """
 
         # Return if the overlay is not visible
         if not self.visible:
-            return
+            return self.get_dirty_rects([])
 
-        # Clear the overlay surface
-        self.overlay_surface.fill((0, 0, 0, 0))
+        # Sample the rectangles and their colors only when a refresh is due
+        refreshed = self.update_rects(
+            normal_color,
+            collision_color,
+            rect_width
+        )
 
-        # Loop through each sprite in each sprite group
-        for sprite_group in self.sprite_groups:
-            for sprite in sprite_group:
-
-                # Initialize the colliding flag as False
-                colliding = False
-
-                # Loop through each group to check for collisions
-                for group in self.sprite_groups:
-                    collisions = pygame.sprite.spritecollide(
-                        sprite,
-                        group,
-                        False
-                    )
-
-                    # Loop through the collisions
-                    for collision in collisions: 
-                        if collision != sprite:
-                            colliding = True
-                            break
-
-                    # If the colliding flag is True, break the outer loop
-                    if colliding:
-                        break
-
-                # If the sprite is colliding, draw a red rectangle around it
-                if colliding:
-                    pygame.draw.rect(
-                        self.overlay_surface,
-                        collision_color,
-                        sprite.rect,
-                        rect_width
-                    )
-                # If the sprite is not colliding, draw a green rectangle
-                else:
-                    pygame.draw.rect(
-                        self.overlay_surface,
-                        normal_color,
-                        sprite.rect,
-                        rect_width
-                    )
+        # In dirty rect mode, draw straight to the screen
+        if self.dirty_rects_enabled:
+            return self.get_dirty_rects(self.draw_rects(self.screen))
+
+        # Otherwise, redraw the overlay surface only after a refresh
+        if self.overlay_surface is None:
+            self.overlay_surface = pygame.Surface(
+                self.screen_rect.size,
+                pygame.SRCALPHA
+            )
+            refreshed = True
+        if refreshed:
+            self.overlay_surface.fill((0, 0, 0, 0))
+            self.draw_rects(self.overlay_surface)
 
         # Draw the overlay surface to the screen
         self.screen.blit(self.overlay_surface, (0, 0))
+
+        return [self.screen_rect.copy()]
@@ -0,0 +1,132 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """A bounded least-recently-used cache of rendered text surfaces.
+
+    Surfaces are keyed on the font, color, and text they were rendered with,
+    so text that does not change between frames is only rendered once.
+
+    Args:
+        max_size (int, optional): The maximum number of surfaces to keep
+            (default 256).
+    """
+
+    def __init__(self, max_size=256):
+        """Initializes an empty TextCache with the given size limit.
+
+        Args:
+            max_size (int, optional): The maximum number of surfaces to keep
+                (default 256).
+
+        Returns:
+            None
+        """
+
+        # Check for invalid arguments
+        self.check_max_size(max_size)
+
+        # Member variables
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+
+    def check_max_size(self, max_size):
+        """Checks that the given size limit is valid.
+
+        Args:
+            max_size (int): The size limit to check.
+
+        Raises:
+            TypeError: If max_size is not an integer.
+            ValueError: If max_size is negative.
+
+        Returns:
+            None
+        """
+
+        if not isinstance(max_size, int):
+            raise TypeError("Cache size must be an integer")
+        if max_size < 0:
+            raise ValueError("Cache size must not be negative")
+
+    def set_max_size(self, max_size):
+        """Sets the maximum number of surfaces to keep, evicting the least
+        recently used surfaces if the cache is now too large.
+
+        Args:
+            max_size (int): The maximum number of surfaces to keep.
+
+        Returns:
+            None
+        """
+
+        self.check_max_size(max_size)
+        self.max_size = max_size
+
+        # Evict surfaces until the cache fits
+        while len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+
+    def clear(self):
+        """Removes all surfaces from the cache and resets the statistics.
+
+        Returns:
+            None
+        """
+
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """Returns a rendered text surface, reusing a cached one if possible.
+
+        Args:
+            font (pygame.font.Font): The font to render with.
+            text (str): The text to render.
+            color (str or tuple): The color to render with.
+
+        Returns:
+            pygame.Surface: The rendered text surface.
+        """
+
+        # Colors such as pygame.Color are not hashable, so use a tuple
+        if not isinstance(color, (str, tuple)):
+            color = tuple(color)
+        key = (font, color, text)
+
+        # Return the cached surface if there is one
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        # Otherwise, render the text and cache it
+        self.misses += 1
+        surface = font.render(text, True, color)
+        if self.max_size > 0:
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+
+        return surface
+
+    def get_stats(self):
+        """Returns the statistics of the cache.
+
+        Returns:
+            dict: The number of hits, misses, cached surfaces, and the size
+                limit of the cache.
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.surfaces),
+            "max_size": self.max_size
+        }
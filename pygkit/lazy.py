@@ -0,0 +1,61 @@
+import importlib
+
+
+def lazy_attributes(namespace, lazy_imports, lazy_modules=None):
+    """Builds the module __getattr__() and __dir__() functions of a package
+    that imports its public names on first use, so importing the package
+    stays cheap.
+
+    Args:
+        namespace (dict): The globals of the package.
+        lazy_imports (dict): The submodule defining each public name,
+            relative to the package.
+        lazy_modules (dict, optional): The submodule each name refers to,
+            relative to the package (default None).
+
+    Returns:
+        tuple: The __getattr__() and __dir__() functions of the package.
+    """
+
+    package = namespace["__name__"]
+    if lazy_modules is None:
+        lazy_modules = {}
+
+    def __getattr__(name):
+        """Imports a public name, or a submodule, on first use.
+
+        Args:
+            name (str): The name to import.
+
+        Raises:
+            AttributeError: If the name is not public.
+
+        Returns:
+            The imported object or submodule.
+        """
+
+        if name in lazy_modules:
+            value = importlib.import_module(lazy_modules[name], package)
+        elif name in lazy_imports:
+            module = importlib.import_module(lazy_imports[name], package)
+            value = getattr(module, name)
+        else:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            )
+
+        # Keep the object, so later lookups do not go through __getattr__
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        """Returns the names of the package, including those not imported
+        yet.
+
+        Returns:
+            list: The names of the package.
+        """
+
+        return sorted(set(namespace) | set(lazy_imports) | set(lazy_modules))
+
+    return __getattr__, __dir__
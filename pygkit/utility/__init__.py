@@ -1 +1,20 @@
-from .config_manager import ConfigManager
\ No newline at end of file
+from ..lazy import lazy_attributes
+
+# Submodule defining each public name. Submodules are only imported when one
+# of their names is first used, so importing the package stays cheap.
+lazy_imports = {
+    "BroadPhase": ".broad_phase",
+    "SpatialHash": ".broad_phase",
+    "SweepAndPrune": ".broad_phase",
+    "ConfigManager": ".config_manager",
+    "InputState": ".input_state",
+    "JoystickRegistry": ".joystick_registry",
+    "KeyCombo": ".key_names",
+    "get_key_code": ".key_names",
+    "get_key_name": ".key_names",
+    "parse_key": ".key_names"
+}
+
+__all__ = list(lazy_imports)
+
+__getattr__, __dir__ = lazy_attributes(globals(), lazy_imports)
@@ -0,0 +1,486 @@
+import bisect
+
+
+class BroadPhase:
+    """Base class for broad-phase collision indexes.
+
+    A broad-phase index is built from a list of rects and returns pairs of
+    indexes whose rects might overlap. Candidate pairs still need to be
+    confirmed by a narrow-phase test such as pygame.Rect.colliderect.
+    """
+
+    def __init__(self):
+        """Initializes an empty BroadPhase.
+
+        Returns:
+            None
+        """
+
+        # Rects the index was last built from
+        self.rects = []
+
+    def build(self, rects):
+        """Builds the index from the given rects.
+
+        Args:
+            rects (list): A list of pygame.Rect objects.
+
+        Returns:
+            None
+        """
+
+        self.rects = rects
+
+    def get_pairs(self):
+        """Returns the candidate pairs of the last built index.
+
+        Returns:
+            set: A set of (i, j) tuples with i < j, where i and j are indexes
+                into the list of rects passed to build.
+        """
+
+        # Test every rect against every other rect
+        count = len(self.rects)
+        return {(i, j) for i in range(count) for j in range(i + 1, count)}
+
+    def get_pairs_between(self, split):
+        """Returns the candidate pairs of the last built index between two
+        lists of rects, skipping the pairs within each list.
+
+        The index is built from both lists joined together, and split is the
+        length of the first one.
+
+        Args:
+            split (int): The index of the first rect of the second list.
+
+        Returns:
+            set: A set of (i, j) tuples with i < split <= j, where i and j are
+                indexes into the list of rects passed to build.
+        """
+
+        # Test every rect of the first list against every rect of the second
+        count = len(self.rects)
+        return {(i, j) for i in range(split) for j in range(split, count)}
+
+    def query(self, rect):
+        """Returns the rects of the last built index that might overlap a
+        rect, so the index can be built once and queried many times.
+
+        Args:
+            rect (pygame.Rect): The rect to query.
+
+        Returns:
+            set: A set of indexes into the list of rects passed to build.
+        """
+
+        # Every rect might overlap
+        return set(range(len(self.rects)))
+
+    def get_pairs_with(self, other):
+        """Returns the candidate pairs between the last built index and
+        another built index, so an index kept from an earlier frame can be
+        tested against this one without building it again.
+
+        Args:
+            other (BroadPhase): The other index, a copy of this one built from
+                other rects.
+
+        Returns:
+            set: A set of (i, k) tuples, where i is an index into the list of
+                rects passed to build, and k an index into the list of rects
+                the other index was built from.
+        """
+
+        # Query the other index with every rect
+        return {
+            (i, k)
+            for i, rect in enumerate(self.rects)
+            for k in other.query(rect)
+        }
+
+
+class SpatialHash(BroadPhase):
+    """A uniform grid broad-phase index.
+
+    Each rect is inserted into every grid cell it touches, and only rects
+    sharing a cell are returned as candidate pairs. Works best when the cell
+    size is about the size of a typical sprite.
+
+    Args:
+        cell_size (int, optional): The width and height of a grid cell in
+            pixels (default 64).
+    """
+
+    def __init__(self, cell_size=64):
+        """Initializes the SpatialHash with the given cell size.
+
+        Args:
+            cell_size (int, optional): The width and height of a grid cell in
+                pixels (default 64).
+
+        Raises:
+            TypeError: If cell_size is not an integer.
+            ValueError: If cell_size is not positive.
+
+        Returns:
+            None
+        """
+
+        super().__init__()
+
+        # Check for invalid arguments
+        if not isinstance(cell_size, int):
+            raise TypeError("cell_size must be an integer")
+        if cell_size <= 0:
+            raise ValueError("cell_size must be greater than 0")
+
+        # Member variables
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def build(self, rects):
+        """Builds the grid from the given rects.
+
+        Args:
+            rects (list): A list of pygame.Rect objects.
+
+        Returns:
+            None
+        """
+
+        super().build(rects)
+
+        # Insert each rect into every cell it touches
+        cell_size = self.cell_size
+        cells = {}
+        for index, rect in enumerate(rects):
+            left = rect.left // cell_size
+            right = (rect.right - 1) // cell_size
+            top = rect.top // cell_size
+            bottom = (rect.bottom - 1) // cell_size
+            for cell_x in range(left, right + 1):
+                for cell_y in range(top, bottom + 1):
+                    cell = cells.get((cell_x, cell_y))
+                    if cell is None:
+                        cells[(cell_x, cell_y)] = [index]
+                    else:
+                        cell.append(index)
+
+        self.cells = cells
+
+    def get_pairs(self):
+        """Returns the candidate pairs of the last built grid.
+
+        Returns:
+            set: A set of (i, j) tuples with i < j, where i and j are indexes
+                into the list of rects passed to build.
+        """
+
+        # Pair up every rect that shares a cell with another rect
+        pairs = set()
+        for cell in self.cells.values():
+            count = len(cell)
+            if count < 2:
+                continue
+            for a in range(count):
+                i = cell[a]
+                for b in range(a + 1, count):
+                    j = cell[b]
+                    if i < j:
+                        pairs.add((i, j))
+                    else:
+                        pairs.add((j, i))
+
+        return pairs
+
+    def get_pairs_between(self, split):
+        """Returns the candidate pairs of the last built grid between two
+        lists of rects, skipping the pairs within each list.
+
+        Args:
+            split (int): The index of the first rect of the second list.
+
+        Returns:
+            set: A set of (i, j) tuples with i < split <= j, where i and j are
+                indexes into the list of rects passed to build.
+        """
+
+        # Pair up the rects of each list that share a cell
+        pairs = set()
+        for cell in self.cells.values():
+            if len(cell) < 2:
+                continue
+            first = [i for i in cell if i < split]
+            if not first or len(first) == len(cell):
+                continue
+            second = [j for j in cell if j >= split]
+            for i in first:
+                for j in second:
+                    pairs.add((i, j))
+
+        return pairs
+
+    def query(self, rect):
+        """Returns the rects of the last built grid that share a cell with a
+        rect.
+
+        Args:
+            rect (pygame.Rect): The rect to query.
+
+        Returns:
+            set: A set of indexes into the list of rects passed to build.
+        """
+
+        # Collect the rects of every cell the rect touches
+        cell_size = self.cell_size
+        cells = self.cells
+        indexes = set()
+        for cell_x in range(
+                rect.left // cell_size,
+                (rect.right - 1) // cell_size + 1
+            ):
+            for cell_y in range(
+                    rect.top // cell_size,
+                    (rect.bottom - 1) // cell_size + 1
+                ):
+                cell = cells.get((cell_x, cell_y))
+                if cell is not None:
+                    indexes.update(cell)
+
+        return indexes
+
+    def get_pairs_with(self, other):
+        """Returns the candidate pairs between the last built grid and another
+        built grid.
+
+        Args:
+            other (BroadPhase): The other index, a copy of this one built from
+                other rects.
+
+        Returns:
+            set: A set of (i, k) tuples, where i is an index into the list of
+                rects passed to build, and k an index into the list of rects
+                the other index was built from.
+        """
+
+        # Grids with different cells cannot be matched cell by cell
+        if not isinstance(other, SpatialHash) \
+                or other.cell_size != self.cell_size:
+            return super().get_pairs_with(other)
+
+        # Pair up the rects of the two grids that share a cell
+        other_cells = other.cells
+        pairs = set()
+        for key, cell in self.cells.items():
+            other_cell = other_cells.get(key)
+            if other_cell is None:
+                continue
+            for i in cell:
+                for k in other_cell:
+                    pairs.add((i, k))
+
+        return pairs
+
+
+class SweepAndPrune(BroadPhase):
+    """A sweep-and-prune broad-phase index.
+
+    Rects are sorted along the x axis and swept from left to right, so only
+    rects overlapping on the x axis are tested against each other. Works best
+    when sprites are spread out horizontally.
+    """
+
+    def __init__(self):
+        """Initializes an empty SweepAndPrune.
+
+        Returns:
+            None
+        """
+
+        super().__init__()
+
+        # Rect indexes sorted by their left edge, and the sorted left edges
+        self.order = []
+        self.lefts = []
+
+    def build(self, rects):
+        """Sorts the given rects along the x axis.
+
+        Args:
+            rects (list): A list of pygame.Rect objects.
+
+        Returns:
+            None
+        """
+
+        super().build(rects)
+
+        # Sort the rect indexes by their left edge
+        self.order = sorted(range(len(rects)), key=lambda i: rects[i].left)
+        self.lefts = [rects[i].left for i in self.order]
+
+    def get_pairs(self):
+        """Returns the candidate pairs of the last sorted rects.
+
+        Returns:
+            set: A set of (i, j) tuples with i < j, where i and j are indexes
+                into the list of rects passed to build.
+        """
+
+        rects = self.rects
+        pairs = set()
+        active = []
+
+        # Sweep from left to right, keeping a list of rects still open
+        for i in self.order:
+            rect = rects[i]
+            left = rect.left
+
+            # Drop rects that end before this one starts
+            active = [j for j in active if rects[j].right > left]
+
+            # Pair this rect with every open rect that overlaps on the y axis
+            for j in active:
+                other = rects[j]
+                if other.top < rect.bottom and rect.top < other.bottom:
+                    pairs.add((i, j) if i < j else (j, i))
+
+            active.append(i)
+
+        return pairs
+
+    def get_pairs_between(self, split):
+        """Returns the candidate pairs of the last sorted rects between two
+        lists of rects, skipping the pairs within each list.
+
+        Args:
+            split (int): The index of the first rect of the second list.
+
+        Returns:
+            set: A set of (i, j) tuples with i < split <= j, where i and j are
+                indexes into the list of rects passed to build.
+        """
+
+        rects = self.rects
+        pairs = set()
+        active_first = []
+        active_second = []
+
+        # Sweep from left to right, keeping a list of open rects for each list
+        for i in self.order:
+            rect = rects[i]
+            left = rect.left
+
+            # Drop rects that end before this one starts
+            active_first = [j for j in active_first if rects[j].right > left]
+            active_second = [j for j in active_second if rects[j].right > left]
+
+            # Pair this rect with the open rects of the other list that overlap
+            # on the y axis
+            if i < split:
+                others = active_second
+            else:
+                others = active_first
+            for j in others:
+                other = rects[j]
+                if other.top < rect.bottom and rect.top < other.bottom:
+                    pairs.add((i, j) if i < j else (j, i))
+
+            if i < split:
+                active_first.append(i)
+            else:
+                active_second.append(i)
+
+        return pairs
+
+    def query(self, rect):
+        """Returns the rects of the last sorted rects that overlap a rect.
+
+        Args:
+            rect (pygame.Rect): The rect to query.
+
+        Returns:
+            set: A set of indexes into the list of rects passed to build.
+        """
+
+        rects = self.rects
+        left = rect.left
+        top = rect.top
+        bottom = rect.bottom
+
+        # Only rects starting before this one ends can overlap it
+        end = bisect.bisect_left(self.lefts, rect.right)
+        indexes = set()
+        for i in self.order[:end]:
+            other = rects[i]
+            if other.right > left \
+                    and other.top < bottom \
+                    and top < other.bottom:
+                indexes.add(i)
+
+        return indexes
+
+    def get_pairs_with(self, other):
+        """Returns the candidate pairs between the last sorted rects and the
+        rects sorted by another SweepAndPrune, sweeping both at once.
+
+        Args:
+            other (BroadPhase): The other index, a copy of this one built from
+                other rects.
+
+        Returns:
+            set: A set of (i, k) tuples, where i is an index into the list of
+                rects passed to build, and k an index into the list of rects
+                the other index was built from.
+        """
+
+        if not isinstance(other, SweepAndPrune):
+            return super().get_pairs_with(other)
+
+        rects = self.rects
+        order = self.order
+        lefts = self.lefts
+        other_rects = other.rects
+        other_order = other.order
+        other_lefts = other.lefts
+        count = len(order)
+        other_count = len(other_order)
+        pairs = set()
+        active = []
+        other_active = []
+
+        # Sweep both sorted lists from left to right at once, keeping a list
+        # of open rects for each, and pair each rect with the open rects of
+        # the other list that overlap on the y axis
+        n = 0
+        m = 0
+        while n < count or m < other_count:
+            if m == other_count \
+                    or (n < count and lefts[n] <= other_lefts[m]):
+                i = order[n]
+                n += 1
+                rect = rects[i]
+                left = rect.left
+                other_active = [
+                    k for k in other_active if other_rects[k].right > left
+                ]
+                for k in other_active:
+                    other_rect = other_rects[k]
+                    if other_rect.top < rect.bottom \
+                            and rect.top < other_rect.bottom:
+                        pairs.add((i, k))
+                active.append(i)
+            else:
+                k = other_order[m]
+                m += 1
+                other_rect = other_rects[k]
+                left = other_rect.left
+                active = [i for i in active if rects[i].right > left]
+                for i in active:
+                    rect = rects[i]
+                    if rect.top < other_rect.bottom \
+                            and other_rect.top < rect.bottom:
+                        pairs.add((i, k))
+                other_active.append(k)
+
+        return pairs
@@ -1,15 +1,99 @@
-import pygame
 import configparser
+import hashlib
+import locale
+import marshal
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from collections import namedtuple
+from collections.abc import ItemsView, ValuesView
+
+# Placeholder stored for a section that has not been parsed yet, with the file
+# it came from, the text of the default section of that file, and its text
+UnloadedSection = namedtuple(
+    "UnloadedSection",
+    ("file", "default_text", "section_text")
+)
+
+# The key_names module, imported on first use because it needs Pygame
+key_names = None
+
+
+def get_key_names():
+    """Returns the key_names module, importing it the first time it is needed
+    so importing this module does not import Pygame.
+
+    Returns:
+        module: The pygkit.utility.key_names module.
+    """
+
+    global key_names
+
+    if key_names is None:
+        from pygkit.utility import key_names as module
+        key_names = module
+
+    return key_names
 
 
 class ConfigManager(dict):
-    """A class for managing settings from a config file."""
+    """A class for managing settings from a config file.
+
+    The parsed settings can be cached in a compiled snapshot next to each
+    config file. The snapshot is keyed on the path, modification time, size,
+    and hash of the config file, so warm starts skip parsing and type
+    conversion entirely, and any change to the file is picked up on the next
+    load.
+
+    In lazy mode, the file is only scanned for section headers when it is
+    loaded. Each section is parsed and converted the first time it is
+    accessed, so the cost of loading scales with the sections actually used.
+
+    The loaded files can be watched for changes, either by polling once per
+    frame or on a background thread. Only the sections whose text changed are
+    parsed again, and callbacks are called for each changed value, always on
+    the thread that calls check_for_changes().
+
+    Args:
+        file (str): The path to the config file.
+        cache (bool or str, optional): Whether to use a compiled cache, or the
+            path of the cache file (default False). If True, the cache of each
+            loaded file is stored next to it with a ".cache" extension added.
+            If a path is given, it is used for this config file, and the
+            caches of the files loaded later are named after it.
+        lazy (bool, optional): Whether to parse each section on first access
+            (default False).
+    """
+
+    # Sections that contain keyboard controls
+    keyboard_sections = ("key", "keys", "keyboard")
 
-    def __init__(self, file):
+    # Version of the compiled cache format
+    cache_version = 3
+
+    # Section header, matched like configparser does at the start of a line
+    section_header = re.compile(r"^\[(?P<header>.+)\]", re.MULTILINE)
+
+    # Thread pool shared by every background load, created on first use
+    executor = None
+    executor_lock = threading.Lock()
+
+    def __init__(self, file, cache=False, lazy=False):
         """Initializes the ConfigManager with the given config file.
 
         Args:
             file (str): The path to the config file.
+            cache (bool or str, optional): Whether to use a compiled cache, or
+                the path of the cache file (default False).
+            lazy (bool, optional): Whether to parse each section on first
+                access (default False).
+
+        Raises:
+            TypeError: If cache or lazy has an invalid type.
+            ValueError: If both cache and lazy are enabled.
 
         Returns:
             None
@@ -17,11 +101,115 @@ class ConfigManager(dict):
 
         super().__init__()
 
+        # Check for invalid arguments
+        if not isinstance(cache, (bool, str)):
+            raise TypeError("cache must be a bool or a string")
+        if not isinstance(lazy, bool):
+            raise TypeError("lazy must be a bool")
+
+        # Writing the cache needs every section, so it cannot be lazy
+        if cache and lazy:
+            raise ValueError("cache and lazy cannot both be enabled")
+        self.lazy = lazy
+
+        # Loaded files, in load order
+        self.files = []
+
+        # Watcher state, and the callbacks for changed values by
+        # (section, key)
+        self.watch_interval = None
+        self.last_check_time = None
+        self.watched_files = {}
+        self.watch_thread = None
+        self.watch_stop_event = None
+        self.change_queue = queue.SimpleQueue()
+        self.callbacks = {}
+
+        # Whether to use a compiled cache, or the path of the cache of this
+        # config file
+        self.cache = cache
+        self.file = file
+
         # Load the settings
         self.load_settings(file)
 
+    @classmethod
+    def get_executor(cls):
+        """Returns the thread pool used to load config files in the
+        background, creating it if needed.
+
+        Returns:
+            concurrent.futures.ThreadPoolExecutor: The thread pool.
+        """
+
+        # Importing concurrent.futures is slow, so only do it when needed
+        import concurrent.futures
+
+        with ConfigManager.executor_lock:
+            if ConfigManager.executor is None:
+                ConfigManager.executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(4, os.cpu_count() or 1),
+                    thread_name_prefix="ConfigManager"
+                )
+
+        return ConfigManager.executor
+
+    @classmethod
+    def load_async(cls, file, **options):
+        """Loads a config file on a background thread, so the game can keep
+        running while the file is read and parsed.
+
+        The result is a future. Poll it with done() from the game loop, wait
+        for it with result(), or await it under asyncio with
+        asyncio.wrap_future().
+
+        Args:
+            file (str): The path to the config file.
+            **options: The other arguments of ConfigManager, such as cache or
+                lazy.
+
+        Returns:
+            concurrent.futures.Future: The future of the loaded ConfigManager.
+        """
+
+        return cls.get_executor().submit(cls, file, **options)
+
+    @classmethod
+    def load_many_async(cls, files, **options):
+        """Loads several config files at once on background threads.
+
+        Args:
+            files (list): The paths to the config files.
+            **options: The other arguments of ConfigManager, such as cache or
+                lazy.
+
+        Returns:
+            list: The futures of the loaded ConfigManagers, in the order of
+                the files.
+        """
+
+        return [cls.load_async(file, **options) for file in files]
+
+    @classmethod
+    def load_many(cls, files, **options):
+        """Loads several config files at once on background threads, and waits
+        for all of them.
+
+        Args:
+            files (list): The paths to the config files.
+            **options: The other arguments of ConfigManager, such as cache or
+                lazy.
+
+        Returns:
+            list: The loaded ConfigManagers, in the order of the files.
+        """
+
+        futures = cls.load_many_async(files, **options)
+        return [future.result() for future in futures]
+
     def load_settings(self, file):
-        """Loads the settings from a config file.
+        """Loads the settings from a config file, or from the compiled cache if
+        it is up to date.
 
         Args:
             file (str): The path to the config file.
@@ -30,58 +218,967 @@ class ConfigManager(dict):
             None
         """
 
-        # Read the file
-        config = configparser.ConfigParser()
-        config.read(file)
-        print(config.sections())
+        if file not in self.files:
+            self.files.append(file)
+
+        # In lazy mode, only index the sections
+        if self.lazy:
+            self.index_sections(file)
+            return
+
+        # Without a cache, parse the file directly
+        cache_file = self.get_cache_file(file)
+        if cache_file is None:
+            config = configparser.ConfigParser()
+            config.read(file)
+            self.update(self.convert_config(config))
+            return
+
+        # A missing file has no settings, like configparser
+        try:
+            stat = os.stat(file)
+        except OSError:
+            return
+
+        # Use the cache without reading the file if it was built from this
+        # file, and the file was not modified
+        source = os.path.abspath(file)
+        snapshot = self.read_cache(cache_file)
+        if snapshot is not None \
+                and snapshot["source"] == source \
+                and snapshot["mtime"] == stat.st_mtime_ns \
+                and snapshot["size"] == stat.st_size:
+            self.update(self.unpack_settings(snapshot["settings"]))
+            return
 
-        # Iterate through the file
-        for section in config.sections():
-            # Create the section keys
-            self[section] = {}
+        # Otherwise, compare the hash, since the file may have been touched
+        # or copied without changing
+        with open(file, "rb") as config_file:
+            data = config_file.read()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if snapshot is not None and snapshot["hash"] == digest:
+            settings = self.unpack_settings(snapshot["settings"])
+        else:
+            config = configparser.ConfigParser()
+            config.read_string(
+                data.decode(locale.getpreferredencoding(False)),
+                file
+            )
+            settings = self.convert_config(config)
+
+        self.update(settings)
+        self.write_cache(cache_file, {
+            "source": source,
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": digest,
+            "settings": self.pack_settings(settings)
+        })
+
+    def index_sections(self, file):
+        """Splits a config file into the text of each section, without parsing
+        them.
+
+        Args:
+            file (str): The path to the config file.
 
-            # If the section is for keyboard controls, convert to Pygame keys
-            keyboard_sections = ["key", "keys", "keyboard"]
-            if section in keyboard_sections:
-                for key, value in config.items(section):
-                    self[section][key] = self.convert_to_key(value)
+        Raises:
+            configparser.DuplicateSectionError: If a section appears more than
+                once.
 
-            # Otherwise, check the value type & convert, then add to dict
+        Returns:
+            None
+        """
+
+        # A missing file has no settings, like configparser
+        try:
+            with open(file) as config_file:
+                text = config_file.read()
+        except OSError:
+            return
+
+        # Sections loaded earlier stay loaded, unless the new file has them
+        default_text, sections = self.split_sections(text, file)
+        for name, section_text in sections.items():
+            super().__setitem__(
+                name,
+                UnloadedSection(file, default_text, section_text)
+            )
+
+    def split_sections(self, text, file):
+        """Splits the text of a config file at each section header.
+
+        Args:
+            text (str): The text of the config file.
+            file (str): The path to the config file, used in errors.
+
+        Raises:
+            configparser.DuplicateSectionError: If a section appears more than
+                once.
+
+        Returns:
+            tuple: The text of the default section, and the text of each other
+                section by name.
+        """
+
+        matches = list(self.section_header.finditer(text))
+        sections = {}
+        default_text = ""
+        for i, match in enumerate(matches):
+            name = match.group("header")
+            if i + 1 < len(matches):
+                end = matches[i + 1].start()
             else:
-                for key, value in config.items(section):
-                    # Check if int
-                    if value.isdigit():
-                        self[section][key] = int(value)
-
-                    # Check if float
-                    elif "." in value and value.replace(".", "", 1).isdigit():
-                        self[section][key] = float(value)
-
-                    # Check if bool
-                    elif value.lower() == "true":
-                        self[section][key] = True
-                    elif value.lower() == "false":
-                        self[section][key] = False
-
-                    # If not int, float, or bool, assume str
-                    else:
-                        self[section][key] = str(value)
-    
-    def convert_to_key(self, key):
-        """Converts a string key to a Pygame key constant. If the key is not
-        recognized, it will return None.
+                end = len(text)
+
+            # Default values apply to every section, so keep them separately
+            if name == configparser.DEFAULTSECT:
+                default_text += text[match.start():end]
+                continue
+
+            if name in sections:
+                line = text.count("\n", 0, match.start()) + 1
+                raise configparser.DuplicateSectionError(name, file, line)
+            sections[name] = text[match.start():end]
+
+        return default_text, sections
+
+    def parse_section(self, section, default_text, section_text, file):
+        """Parses and converts the text of a single section.
 
         Args:
-            key (str): The key to convert
+            section (str): The name of the section.
+            default_text (str): The text of the default section of its file.
+            section_text (str): The text of the section.
+            file (str): The path to the config file, used in errors.
+
+        Returns:
+            dict: The converted values of the section.
+        """
+
+        config = configparser.ConfigParser()
+        config.read_string(default_text + section_text, file)
+        return self.convert_section(section, config.items(section))
+
+    def load_section(self, section):
+        """Parses and converts a section if it has not been loaded yet.
+
+        Args:
+            section (str): The name of the section.
+
+        Raises:
+            KeyError: If there is no such section.
+
+        Returns:
+            dict: The converted values of the section.
+        """
+
+        # Parse the section on its own, with the default values of its file
+        values = super().__getitem__(section)
+        if type(values) is UnloadedSection:
+            values = self.parse_section(
+                section,
+                values.default_text,
+                values.section_text,
+                values.file
+            )
+            super().__setitem__(section, values)
+
+        return values
+
+    def load_all_sections(self):
+        """Parses and converts every section that has not been loaded yet.
+
+        Returns:
+            None
+        """
+
+        if not self.lazy:
+            return
+
+        for section in list(super().keys()):
+            self.load_section(section)
+
+    def __getitem__(self, section):
+        """Returns the values of a section, loading it if needed.
+
+        Args:
+            section (str): The name of the section.
+
+        Raises:
+            KeyError: If there is no such section.
+
+        Returns:
+            dict: The values of the section.
+        """
+
+        values = super().__getitem__(section)
+        if type(values) is UnloadedSection:
+            return self.load_section(section)
+
+        return values
+
+    def __iter__(self):
+        """Returns an iterator over the section names.
+
+        Overriding this makes dict(), update(), and unpacking read the
+        sections through __getitem__(), so they load lazy sections instead of
+        copying their placeholders.
+
+        Returns:
+            iterator: The iterator over the section names.
+        """
+
+        return super().__iter__()
+
+    def __eq__(self, other):
+        """Returns whether the settings are equal to another dict. Every
+        section is loaded first.
+
+        Args:
+            other (dict): The dict to compare to.
+
+        Returns:
+            bool: True if the settings are equal, False otherwise.
+        """
+
+        self.load_all_sections()
+        if isinstance(other, ConfigManager):
+            other.load_all_sections()
+
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        """Returns whether the settings are not equal to another dict. Every
+        section is loaded first.
+
+        Args:
+            other (dict): The dict to compare to.
+
+        Returns:
+            bool: True if the settings are not equal, False otherwise.
+        """
+
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+
+        return not equal
+
+    def __or__(self, other):
+        """Returns a new dict with the settings merged with another dict.
+        Every section is loaded first.
+
+        Args:
+            other (dict): The dict to merge in.
+
+        Returns:
+            dict: The merged settings.
+        """
+
+        self.load_all_sections()
+        return super().__or__(other)
+
+    def __ror__(self, other):
+        """Returns a new dict with another dict merged with the settings.
+        Every section is loaded first.
+
+        Args:
+            other (dict): The dict to merge into.
+
+        Returns:
+            dict: The merged settings.
+        """
+
+        self.load_all_sections()
+        return super().__ror__(other)
+
+    def __repr__(self):
+        """Returns the representation of the settings. Every section is loaded
+        first.
+
+        Returns:
+            str: The representation of the settings.
+        """
+
+        self.load_all_sections()
+        return super().__repr__()
+
+    def __reduce_ex__(self, protocol):
+        """Returns the data used to copy or pickle the settings. Every section
+        is loaded first.
+
+        Args:
+            protocol (int): The pickle protocol.
+
+        Returns:
+            tuple: The data used to rebuild the settings.
+        """
+
+        self.load_all_sections()
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self):
+        """Returns the attributes to copy or pickle, without the watcher,
+        which cannot be copied.
+
+        Returns:
+            dict: The attributes.
+        """
+
+        state = dict(self.__dict__)
+        for name in ("watch_thread", "watch_stop_event", "change_queue"):
+            del state[name]
+        state["watch_interval"] = None
+
+        return state
+
+    def __setstate__(self, state):
+        """Restores the attributes of a copied or unpickled ConfigManager,
+        which is not watching for changes.
+
+        Args:
+            state (dict): The attributes.
+
+        Returns:
+            None
+        """
+
+        self.__dict__.update(state)
+        self.watch_thread = None
+        self.watch_stop_event = None
+        self.change_queue = queue.SimpleQueue()
+
+    def copy(self):
+        """Returns a shallow copy of the settings as a dict. Every section is
+        loaded first.
+
+        Returns:
+            dict: The copy of the settings.
+        """
+
+        self.load_all_sections()
+        return super().copy()
+
+    def get(self, section, default=None):
+        """Returns the values of a section, loading it if needed.
+
+        Args:
+            section (str): The name of the section.
+            default (optional): The value to return if there is no such
+                section (default None).
+
+        Returns:
+            dict: The values of the section, or the default.
+        """
+
+        if section in self:
+            return self[section]
+
+        return default
+
+    def pop(self, section, *default):
+        """Removes a section and returns its values, loading it if needed.
+
+        Args:
+            section (str): The name of the section.
+            *default: The value to return if there is no such section.
+
+        Raises:
+            KeyError: If there is no such section and no default.
+
+        Returns:
+            dict: The values of the section, or the default.
+        """
+
+        if section in self:
+            self.load_section(section)
+
+        return super().pop(section, *default)
+
+    def popitem(self):
+        """Removes the last section and returns it, loading it if needed.
+
+        Raises:
+            KeyError: If there are no sections.
+
+        Returns:
+            tuple: The name and values of the section.
+        """
+
+        if self:
+            self.load_section(next(reversed(super().keys())))
+
+        return super().popitem()
+
+    def setdefault(self, section, default=None):
+        """Returns the values of a section, loading it if needed, or sets it to
+        a default if there is no such section.
+
+        Args:
+            section (str): The name of the section.
+            default (optional): The values to set if there is no such section
+                (default None).
+
+        Returns:
+            dict: The values of the section.
+        """
+
+        if section in self:
+            return self[section]
+
+        return super().setdefault(section, default)
+
+    def values(self):
+        """Returns a view of the section values. In lazy mode, sections are
+        loaded as the view is iterated.
+
+        Returns:
+            ValuesView: The section values.
+        """
+
+        if not self.lazy:
+            return super().values()
+
+        return ValuesView(self)
+
+    def items(self):
+        """Returns a view of the sections. In lazy mode, sections are loaded
+        as the view is iterated.
+
+        Returns:
+            ItemsView: The (name, values) pairs of the sections.
+        """
+
+        if not self.lazy:
+            return super().items()
+
+        return ItemsView(self)
+
+    def add_callback(self, section, key, callback):
+        """Adds a callback that is called when a value changes on reload.
+
+        Args:
+            section (str): The name of the section.
+            key (str): The key of the value, or None for every key in the
+                section.
+            callback (function): The function to call, with the section, key,
+                old value, and new value. The old value is None for new keys,
+                and the new value is None for removed keys.
 
         Returns:
-            pygame.key: The converted key
+            None
         """
 
-        # If it's a single character, make it lowercase
-        if len(key) == 1:
-            return getattr(pygame, "K_" + key.lower())
+        self.callbacks.setdefault((section, key), []).append(callback)
+
+    def remove_callback(self, section, key, callback):
+        """Removes a callback added with add_callback().
+
+        Args:
+            section (str): The name of the section.
+            key (str): The key of the value, or None for every key in the
+                section.
+            callback (function): The function to remove.
+
+        Raises:
+            ValueError: If the callback was not added.
+
+        Returns:
+            None
+        """
+
+        callbacks = self.callbacks.get((section, key), [])
+        if callback not in callbacks:
+            raise ValueError("callback was not added")
+        callbacks.remove(callback)
+
+    def watch(self, interval=1.0, background=False):
+        """Starts watching the loaded files for changes.
+
+        When polling, call check_for_changes() once per frame. It only checks
+        the modification times once per interval. On a background thread, the
+        files are checked and parsed on the thread, and check_for_changes()
+        only applies the results, so the game loop never waits on file I/O.
+
+        Args:
+            interval (float, optional): The number of seconds between checks
+                (default 1.0).
+            background (bool, optional): Whether to check on a background
+                thread (default False).
+
+        Raises:
+            TypeError: If an argument has an invalid type.
+            ValueError: If interval is negative.
+
+        Returns:
+            None
+        """
+
+        # Check for invalid arguments
+        if not isinstance(interval, (int, float)):
+            raise TypeError("interval must be a number")
+        if interval < 0:
+            raise ValueError("interval must not be negative")
+        if not isinstance(background, bool):
+            raise TypeError("background must be a bool")
+
+        # Restart if already watching
+        self.stop_watching()
+        self.watch_interval = interval
+        self.last_check_time = time.monotonic()
+
+        # Remember the current state of each file to compare against
+        self.watched_files = {}
+        for file in self.files:
+            self.scan_file(file)
+
+        if background:
+            self.watch_stop_event = threading.Event()
+            self.watch_thread = threading.Thread(
+                target=self.watch_files,
+                args=(self.watch_stop_event, interval),
+                name="ConfigManager watcher",
+                daemon=True
+            )
+            self.watch_thread.start()
+
+    def stop_watching(self):
+        """Stops watching the loaded files for changes.
+
+        Returns:
+            None
+        """
+
+        if self.watch_thread is not None:
+            self.watch_stop_event.set()
+            self.watch_thread.join()
+            self.watch_thread = None
+            self.watch_stop_event = None
+
+        self.watch_interval = None
+
+    def watch_files(self, stop_event, interval):
+        """Checks the watched files until stopped. Runs on the background
+        thread, and passes changes to the main thread through a queue.
+
+        Args:
+            stop_event (threading.Event): The event that stops the thread.
+            interval (float): The number of seconds between checks.
+
+        Returns:
+            None
+        """
+
+        while not stop_event.wait(interval):
+            for file in list(self.files):
+                changes = self.scan_file(file)
+                if changes is not None:
+                    self.change_queue.put((file, changes))
+
+    def scan_file(self, file):
+        """Checks whether a watched file changed, and parses the sections whose
+        text changed. Does not change the settings, so it is safe to run on
+        another thread.
+
+        Args:
+            file (str): The path to the config file.
+
+        Returns:
+            tuple: The changed sections with their new values by name, and the
+                names of the removed sections, or None if nothing changed.
+        """
+
+        # Check the modification time first, since it is cheap, and keep the
+        # previous state if the file is missing, such as while an editor is
+        # saving it. A file missing from the start has no sections until it
+        # is created
+        try:
+            stat = os.stat(file)
+        except OSError:
+            if file not in self.watched_files:
+                self.watched_files[file] = (None, "", {})
+            return None
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        previous = self.watched_files.get(file)
+        if previous is not None and previous[0] == file_key:
+            return None
+
+        # Split the file, and keep the previous state if it cannot be read
+        try:
+            with open(file) as config_file:
+                text = config_file.read()
+            default_text, sections = self.split_sections(text, file)
+        except (OSError, UnicodeDecodeError, configparser.Error):
+            return None
+        self.watched_files[file] = (file_key, default_text, sections)
+
+        # The first scan only remembers the state
+        if previous is None:
+            return None
+
+        # Parse only the sections whose text changed
+        _, previous_default_text, previous_sections = previous
+        changed_sections = {}
+        for name, section_text in sections.items():
+            if default_text == previous_default_text \
+                    and previous_sections.get(name) == section_text:
+                continue
+            try:
+                changed_sections[name] = self.parse_section(
+                    name,
+                    default_text,
+                    section_text,
+                    file
+                )
+            except configparser.Error:
+                continue
+        removed_sections = [
+            name for name in previous_sections if name not in sections
+        ]
+
+        if not changed_sections and not removed_sections:
+            return None
+
+        return changed_sections, removed_sections
+
+    def check_for_changes(self):
+        """Applies changes to the watched files, and calls the callbacks of
+        the changed values. Call this once per frame while watching.
+
+        Returns:
+            list: The (section, key, old value, new value) tuples of the
+                changed values.
+        """
+
+        # Return if not watching
+        if self.watch_interval is None:
+            return []
+
+        # When polling, check the files once per interval
+        if self.watch_thread is None:
+            now = time.monotonic()
+            if now - self.last_check_time >= self.watch_interval:
+                self.last_check_time = now
+                for file in self.files:
+                    changes = self.scan_file(file)
+                    if changes is not None:
+                        self.change_queue.put((file, changes))
+
+        # Apply the changes found since the last call. Files loaded later
+        # override earlier ones, so a change only applies if no later file
+        # has the section
+        changed_values = []
+        while True:
+            try:
+                file, (changed_sections, removed_sections) = \
+                    self.change_queue.get_nowait()
+            except queue.Empty:
+                break
+            for name, values in changed_sections.items():
+                if self.get_section_file(name) == file:
+                    changed_values.extend(self.apply_section(name, values))
+            for name in removed_sections:
+                if self.get_section_file(name, file) is None:
+                    values = self.load_section_from_files(name)
+                    if values is not None or name in self:
+                        changed_values.extend(
+                            self.apply_section(name, values)
+                        )
+
+        # Call the callbacks of the changed values
+        for section, key, old_value, new_value in changed_values:
+            for callback_key in ((section, key), (section, None)):
+                for callback in self.callbacks.get(callback_key, ()):
+                    callback(section, key, old_value, new_value)
+
+        return changed_values
+
+    def get_section_file(self, section, after=None):
+        """Returns the last watched file that has a section, which is the one
+        its values come from.
+
+        Args:
+            section (str): The name of the section.
+            after (str, optional): Only look at the files loaded after this
+                one (default None).
+
+        Returns:
+            str: The path to the file, or None if no watched file has the
+                section.
+        """
+
+        files = self.files
+        if after is not None:
+            files = files[files.index(after) + 1:]
+
+        for file in reversed(files):
+            watched = self.watched_files.get(file)
+            if watched is not None and section in watched[2]:
+                return file
+
+        return None
+
+    def load_section_from_files(self, section):
+        """Parses a section again from the last watched file that has it,
+        after it was removed from a file loaded later.
 
-        # Otherwise, make it uppercase
+        Args:
+            section (str): The name of the section.
+
+        Returns:
+            dict: The converted values of the section, or None if no watched
+                file has it.
+        """
+
+        file = self.get_section_file(section)
+        if file is None:
+            return None
+        _, default_text, sections = self.watched_files[file]
+
+        try:
+            return self.parse_section(
+                section,
+                default_text,
+                sections[section],
+                file
+            )
+        except configparser.Error:
+            return None
+
+    def apply_section(self, section, values):
+        """Replaces the values of a section, and returns the values that
+        changed.
+
+        Args:
+            section (str): The name of the section.
+            values (dict): The new values, or None to remove the section.
+
+        Returns:
+            list: The (section, key, old value, new value) tuples of the
+                changed values.
+        """
+
+        # Load the old values of a lazy section, so they can be compared
+        old_values = self[section] if section in self else {}
+        if values is None:
+            del self[section]
+            values = {}
         else:
-            return getattr(pygame, "K_" + key.upper(), None)
\ No newline at end of file
+            self[section] = values
+
+        return [
+            (section, key, old_values.get(key), values.get(key))
+            for key in {**old_values, **values}
+            if old_values.get(key) != values.get(key)
+        ]
+
+    def convert_config(self, config):
+        """Converts every section of a parsed config to a dict of typed values.
+
+        Args:
+            config (configparser.ConfigParser): The parsed config.
+
+        Returns:
+            dict: The settings of each section, by section name.
+        """
+
+        return {
+            section: self.convert_section(section, config.items(section))
+            for section in config.sections()
+        }
+
+    def convert_section(self, section, items):
+        """Converts the values of a section to their types.
+
+        Args:
+            section (str): The name of the section.
+            items (list): The (key, value) string pairs of the section.
+
+        Returns:
+            dict: The converted values, by key.
+        """
+
+        # If the section is for keyboard controls, convert to Pygame keys
+        if section in self.keyboard_sections:
+            return {key: self.convert_to_key(value) for key, value in items}
+
+        # Otherwise, check the value type & convert
+        return {key: self.convert_value(value) for key, value in items}
+
+    def convert_value(self, value):
+        """Converts a string value to an int, float, or bool if it looks like
+        one. Otherwise, it is returned as a string.
+
+        Args:
+            value (str): The value to convert.
+
+        Returns:
+            int, float, bool, or str: The converted value.
+        """
+
+        # Check if int
+        if value.isdigit():
+            return int(value)
+
+        # Check if float
+        if "." in value and value.replace(".", "", 1).isdigit():
+            return float(value)
+
+        # Check if bool
+        lower_value = value.lower()
+        if lower_value == "true":
+            return True
+        if lower_value == "false":
+            return False
+
+        # If not int, float, or bool, assume str
+        return str(value)
+
+    def pack_settings(self, settings):
+        """Converts the key combos in the settings to plain tuples, so they can
+        be stored in the compiled cache.
+
+        Args:
+            settings (dict): The settings of each section.
+
+        Returns:
+            dict: The settings, with key combos as tuples.
+        """
+
+        return {
+            section: {
+                key: tuple(value) if isinstance(value, tuple) else value
+                for key, value in values.items()
+            } if section in self.keyboard_sections else values
+            for section, values in settings.items()
+        }
+
+    def unpack_settings(self, settings):
+        """Converts the tuples in the keyboard sections of cached settings back
+        to key combos.
+
+        Args:
+            settings (dict): The settings of each section, from the cache.
+
+        Returns:
+            dict: The settings, with key combos restored.
+        """
+
+        KeyCombo = get_key_names().KeyCombo
+
+        for section in self.keyboard_sections:
+            values = settings.get(section)
+            if values is None:
+                continue
+            for key, value in values.items():
+                if isinstance(value, tuple):
+                    values[key] = KeyCombo(*value)
+
+        return settings
+
+    def get_cache_header(self):
+        """Returns the header identifying the compiled cache format.
+
+        Key constants and the marshal format can change between versions of
+        Pygame and Python, so a cache written by another version is ignored.
+
+        Returns:
+            tuple: The cache header.
+        """
+
+        # Import Pygame only when caching, so importing this module is cheap
+        import pygame
+
+        return (
+            self.cache_version,
+            marshal.version,
+            sys.version_info[:2],
+            pygame.version.ver
+        )
+
+    def get_cache_file(self, file):
+        """Returns the path of the compiled cache of a config file.
+
+        Args:
+            file (str): The path to the config file.
+
+        Returns:
+            str: The path of the cache, or None if caching is disabled.
+        """
+
+        if not self.cache:
+            return None
+        if self.cache is True:
+            return file + ".cache"
+        if file == self.file:
+            return self.cache
+
+        # Name the caches of the other files after the given cache, so they
+        # are stored in the same place without sharing it
+        source = os.path.abspath(file).encode()
+        digest = hashlib.blake2b(source, digest_size=8).hexdigest()
+        return f"{self.cache}.{digest}"
+
+    def read_cache(self, cache_file):
+        """Reads a compiled cache.
+
+        Args:
+            cache_file (str): The path of the cache.
+
+        Returns:
+            dict: The cached snapshot, or None if there is no valid cache.
+        """
+
+        try:
+            with open(cache_file, "rb") as cache:
+                header, snapshot = marshal.load(cache)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if header != self.get_cache_header():
+            return None
+
+        return snapshot
+
+    def write_cache(self, cache_file, snapshot):
+        """Writes a compiled cache. The cache is written to a temporary file
+        first, so a crash never leaves a partial cache behind.
+
+        Args:
+            cache_file (str): The path of the cache.
+            snapshot (dict): The snapshot to cache.
+
+        Returns:
+            None
+        """
+
+        temporary_file = \
+            f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporary_file, "wb") as cache:
+                marshal.dump((self.get_cache_header(), snapshot), cache)
+            os.replace(temporary_file, cache_file)
+
+        # Caching is best effort, so the settings still load from a read-only
+        # location
+        except OSError:
+            try:
+                os.remove(temporary_file)
+            except OSError:
+                pass
+
+    def convert_to_key(self, key):
+        """Converts a string key to a Pygame key constant, or to a KeyCombo if
+        modifiers are given, such as "ctrl+s". Names are matched regardless of
+        case and spacing, so "SPACE", "space", and "Left Shift" all work. If
+        the key is not recognized, it will return None.
+
+        Args:
+            key (str): The key to convert
+
+        Returns:
+            int or KeyCombo: The converted key
+        """
+
+        return get_key_names().parse_key(key)
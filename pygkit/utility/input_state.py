@@ -0,0 +1,356 @@
+import pygame
+from pygkit.utility.joystick_registry import JoystickRegistry
+from pygkit.utility.key_names import KEY_NAMES
+
+
+class InputState:
+    """A compact snapshot of the keyboard, mouse, and joystick buttons.
+
+    The state of each device is kept as a byte string with one byte per
+    button, so the buttons pressed and released since the last frame are
+    found with a single batched operation per device instead of a Python loop
+    over every button. After each call to update, the keyboard state can be
+    read the same way as pygame.key.get_pressed:
+
+        if input_state.just_pressed[pygame.K_SPACE]:
+            player.jump()
+
+    Args:
+        joysticks (JoystickRegistry, optional): The registry of joysticks to
+            track (default a new JoystickRegistry).
+        event_driven (bool, optional): If True, the state is updated from the
+            events passed to process_events instead of polling every button
+            (default False).
+    """
+
+    # Number of scancodes in the keyboard state
+    NUM_SCANCODES = 512
+
+    # Number of buttons in the mouse state
+    NUM_MOUSE_BUTTONS = 5
+
+    # Mouse button numbers in events mapped to the button codes returned by
+    # pygame.mouse.get_pressed, skipping the scroll wheel buttons 4 and 5
+    MOUSE_BUTTON_CODES = {1: 0, 2: 1, 3: 2, 6: 3, 7: 4}
+
+    # Scancode of each keycode, and keycode of each scancode, shared by all
+    # instances and built on first use
+    scancodes = None
+    keycodes = None
+
+    def __init__(self, joysticks=None, event_driven=False):
+        """Initializes the InputState with nothing pressed.
+
+        Args:
+            joysticks (JoystickRegistry, optional): The registry of joysticks
+                to track (default a new JoystickRegistry).
+            event_driven (bool, optional): If True, the state is updated from
+                the events passed to process_events instead of polling every
+                button (default False).
+
+        Raises:
+            TypeError: If joysticks is not a JoystickRegistry, or event_driven
+                is not a boolean.
+
+        Returns:
+            None
+        """
+
+        # Check for invalid arguments
+        if joysticks is not None:
+            if not isinstance(joysticks, JoystickRegistry):
+                raise TypeError("joysticks must be a JoystickRegistry")
+        if not isinstance(event_driven, bool):
+            raise TypeError("event_driven must be a boolean")
+
+        # Member variables
+        if joysticks is None:
+            joysticks = JoystickRegistry()
+        self.joysticks = joysticks
+        self.event_driven = event_driven
+
+        # Buttons to poll on each joystick, by joystick number (default None,
+        # poll every button)
+        self.watched_joystick_buttons = None
+
+        # Raw state of each device, with one byte per button. Joysticks are
+        # keyed by instance id, so their state survives other joysticks
+        # being removed
+        self.keys = bytearray(self.NUM_SCANCODES)
+        self.mouse_buttons = bytearray(self.NUM_MOUSE_BUTTONS)
+        self.joystick_buttons = {}
+        self.previous_joystick_buttons = {}
+
+        # Keycodes seen in key events, by scancode
+        self.event_keycodes = {}
+
+        # Keyboard state of the current frame, readable by keycode
+        empty = bytes(self.NUM_SCANCODES)
+        self.pressed = pygame.key.ScancodeWrapper(empty)
+        self.just_pressed = pygame.key.ScancodeWrapper(empty)
+        self.just_released = pygame.key.ScancodeWrapper(empty)
+
+        # Mouse state of the current frame, readable by button code
+        empty = bytes(self.NUM_MOUSE_BUTTONS)
+        self.mouse_pressed = empty
+        self.mouse_just_pressed = empty
+        self.mouse_just_released = empty
+
+        # Joystick state of the current frame, readable by joystick number
+        # and then button number
+        self.joystick_pressed = {}
+        self.joystick_just_pressed = {}
+        self.joystick_just_released = {}
+
+    def watch_joystick_buttons(self, buttons):
+        """Limits polling to the given joystick buttons.
+
+        Joysticks without watched buttons are not polled at all. Passing None
+        polls every button of every joystick again.
+
+        Args:
+            buttons (list): A list of (joystick number, button number) tuples,
+                or None.
+
+        Returns:
+            None
+        """
+
+        if buttons is None:
+            self.watched_joystick_buttons = None
+            return
+
+        self.watched_joystick_buttons = {}
+        for joystick_number, button in buttons:
+            self.watched_joystick_buttons.setdefault(
+                joystick_number,
+                []
+            ).append(button)
+
+    def diff(self, current, previous):
+        """Finds the buttons pressed and released between two states.
+
+        Each state has one byte per button, set to 0 or 1, so the states can
+        be compared as integers with one bitwise operation each.
+
+        Args:
+            current (bytes): The current state.
+            previous (bytes): The previous state.
+
+        Returns:
+            tuple: The just pressed and just released states, as bytes.
+        """
+
+        size = len(current)
+        current_bits = int.from_bytes(current, "little")
+        previous_bits = int.from_bytes(previous[:size], "little")
+        changed_bits = current_bits ^ previous_bits
+
+        return (
+            (changed_bits & current_bits).to_bytes(size, "little"),
+            (changed_bits & previous_bits).to_bytes(size, "little")
+        )
+
+    def update(self):
+        """Updates the state for a new frame.
+
+        Unless event driven, this polls every button first. It then compares
+        each device with the previous frame to find the buttons just pressed
+        and just released. It should be called once per frame.
+
+        Returns:
+            None
+        """
+
+        # Poll every button unless the state is updated from events
+        if not self.event_driven:
+            self.keys[:] = bytes(pygame.key.get_pressed())
+            self.mouse_buttons[:] = bytes(
+                pygame.mouse.get_pressed(num_buttons=self.NUM_MOUSE_BUTTONS)
+            )
+            self.poll_joysticks()
+
+        # Update the keyboard state
+        keys = bytes(self.keys)
+        just_pressed, just_released = self.diff(keys, bytes(self.pressed))
+        self.pressed = pygame.key.ScancodeWrapper(keys)
+        self.just_pressed = pygame.key.ScancodeWrapper(just_pressed)
+        self.just_released = pygame.key.ScancodeWrapper(just_released)
+
+        # Update the mouse state
+        mouse_buttons = bytes(self.mouse_buttons)
+        just_pressed, just_released = self.diff(
+            mouse_buttons,
+            self.mouse_pressed
+        )
+        self.mouse_pressed = mouse_buttons
+        self.mouse_just_pressed = just_pressed
+        self.mouse_just_released = just_released
+
+        # Update the joystick state, dropping disconnected joysticks
+        joystick_buttons = {}
+        previous_joystick_buttons = {}
+        joystick_pressed = {}
+        joystick_just_pressed = {}
+        joystick_just_released = {}
+        for i, instance_id in enumerate(self.joysticks.instance_ids):
+            buttons = self.joystick_buttons.get(instance_id)
+            if buttons is None:
+                continue
+            joystick_buttons[instance_id] = buttons
+            buttons = bytes(buttons)
+            just_pressed, just_released = self.diff(
+                buttons,
+                self.previous_joystick_buttons.get(instance_id, b"")
+            )
+            previous_joystick_buttons[instance_id] = buttons
+            joystick_pressed[i] = buttons
+            joystick_just_pressed[i] = just_pressed
+            joystick_just_released[i] = just_released
+        self.joystick_buttons = joystick_buttons
+        self.previous_joystick_buttons = previous_joystick_buttons
+        self.joystick_pressed = joystick_pressed
+        self.joystick_just_pressed = joystick_just_pressed
+        self.joystick_just_released = joystick_just_released
+
+    def poll_joysticks(self):
+        """Polls the buttons of each joystick, using the cached button counts
+        and touching only the watched buttons if any are set.
+
+        Returns:
+            None
+        """
+
+        joysticks = self.joysticks
+        watched_buttons = self.watched_joystick_buttons
+        for i, joystick in enumerate(joysticks.joysticks):
+            num_buttons = joysticks.get_num_buttons(i)
+            if watched_buttons is None:
+                buttons = bytearray(
+                    map(joystick.get_button, range(num_buttons))
+                )
+            else:
+                buttons = bytearray(num_buttons)
+                for button in watched_buttons.get(i, ()):
+                    if button < num_buttons:
+                        buttons[button] = joystick.get_button(button)
+            self.joystick_buttons[joysticks.instance_ids[i]] = buttons
+
+    def process_events(self, events):
+        """Updates the raw state from a list of events.
+
+        In event driven mode, this should be called with the events from
+        pygame.event.get() before update, so only the buttons that changed
+        are touched.
+
+        Args:
+            events (list): The Pygame events to process.
+
+        Returns:
+            None
+        """
+
+        for event in events:
+            # Update keyboard buttons
+            if event.type == pygame.KEYDOWN:
+                scancode = self.get_scancode(event)
+                self.keys[scancode] = 1
+                self.event_keycodes[scancode] = event.key
+            elif event.type == pygame.KEYUP:
+                self.keys[self.get_scancode(event)] = 0
+
+            # Released buttons are not reported while the window is unfocused
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self.keys[:] = bytes(self.NUM_SCANCODES)
+                self.mouse_buttons[:] = bytes(self.NUM_MOUSE_BUTTONS)
+
+            # Update mouse buttons, skipping the scroll wheel buttons
+            elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                button_code = self.MOUSE_BUTTON_CODES.get(event.button)
+                if button_code is not None:
+                    is_down = event.type == pygame.MOUSEBUTTONDOWN
+                    self.mouse_buttons[button_code] = is_down
+
+            # Update joystick buttons
+            elif event.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+                i = self.joysticks.get_number(event.instance_id)
+                if i is None:
+                    continue
+                buttons = self.joystick_buttons.get(event.instance_id)
+                if buttons is None:
+                    buttons = bytearray(self.joysticks.get_num_buttons(i))
+                    self.joystick_buttons[event.instance_id] = buttons
+                if event.button < len(buttons):
+                    buttons[event.button] = event.type == pygame.JOYBUTTONDOWN
+
+    def get_scancode(self, event):
+        """Returns the scancode of a key event. Events posted by the game,
+        such as pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a), may have
+        no scancode, so it is looked up from the keycode instead.
+
+        Args:
+            event (pygame.event.Event): The key event.
+
+        Returns:
+            int: The scancode of the key.
+        """
+
+        scancode = getattr(event, "scancode", None)
+        if scancode is not None:
+            return scancode
+
+        # Build the table of scancodes once
+        if InputState.scancodes is None:
+            InputState.scancodes = \
+                pygame.key.ScancodeWrapper(range(self.NUM_SCANCODES))
+
+        return InputState.scancodes[event.key]
+
+    def get_keycode(self, scancode):
+        """Returns the keycode of the given scancode.
+
+        Args:
+            scancode (int): The scancode to look up.
+
+        Returns:
+            int: The keycode, or None if it is not known.
+        """
+
+        # Prefer the keycode reported by key events
+        keycode = self.event_keycodes.get(scancode)
+        if keycode is not None:
+            return keycode
+
+        # Otherwise, build the table of every Pygame key constant once
+        if InputState.keycodes is None:
+            if InputState.scancodes is None:
+                InputState.scancodes = \
+                    pygame.key.ScancodeWrapper(range(self.NUM_SCANCODES))
+            InputState.keycodes = {}
+            for keycode in KEY_NAMES:
+                InputState.keycodes.setdefault(
+                    InputState.scancodes[keycode], keycode
+                )
+
+        return InputState.keycodes.get(scancode)
+
+    def get_pressed_keys(self):
+        """Returns the keycodes of the keys pressed on the current frame.
+
+        Only the pressed keys are visited, so the cost does not depend on the
+        number of keys.
+
+        Returns:
+            list: The keycodes of the pressed keys.
+        """
+
+        keys = bytes(self.pressed)
+        pressed_keys = []
+        scancode = keys.find(1)
+        while scancode != -1:
+            keycode = self.get_keycode(scancode)
+            if keycode is not None:
+                pressed_keys.append(keycode)
+            scancode = keys.find(1, scancode + 1)
+
+        return pressed_keys
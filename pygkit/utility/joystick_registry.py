@@ -0,0 +1,220 @@
+import pygame
+
+
+class JoystickRegistry:
+    """A registry of connected joysticks that follows hot-plugging.
+
+    Joysticks are keyed by their instance id, and numbered in the order they
+    were connected. The number of buttons and axes of each joystick is cached
+    when it connects, so it is not queried every frame. Axis values can be
+    filtered with a deadzone and quantized, so small jitter does not change
+    the reported value.
+
+    Args:
+        deadzone (float, optional): Axis values closer to 0 than this are
+            reported as 0 (default 0.0).
+        quantization (float, optional): Axis values are rounded to a multiple
+            of this step (default None, no rounding).
+    """
+
+    def __init__(self, deadzone=0.0, quantization=None):
+        """Initializes the JoystickRegistry with the connected joysticks.
+
+        Args:
+            deadzone (float, optional): Axis values closer to 0 than this are
+                reported as 0 (default 0.0).
+            quantization (float, optional): Axis values are rounded to a
+                multiple of this step (default None, no rounding).
+
+        Returns:
+            None
+        """
+
+        # Axis filter
+        self.set_axis_filter(deadzone, quantization)
+
+        # Joysticks and their cached button and axis counts, by instance id
+        self.devices = {}
+        self.capabilities = {}
+
+        # Joysticks and instance ids in connection order, indexed by number
+        self.joysticks = []
+        self.instance_ids = []
+
+        # Add the joysticks that are already connected
+        pygame.joystick.init()
+        for device_index in range(pygame.joystick.get_count()):
+            self.add_joystick(device_index)
+
+    def set_axis_filter(self, deadzone=0.0, quantization=None):
+        """Sets the filter applied to axis values.
+
+        Args:
+            deadzone (float, optional): Axis values closer to 0 than this are
+                reported as 0 (default 0.0).
+            quantization (float, optional): Axis values are rounded to a
+                multiple of this step (default None, no rounding).
+
+        Raises:
+            TypeError: If deadzone or quantization is not a number.
+            ValueError: If deadzone is negative or quantization is not
+                positive.
+
+        Returns:
+            None
+        """
+
+        # Check for invalid arguments
+        if not isinstance(deadzone, (int, float)):
+            raise TypeError("deadzone must be a number")
+        if deadzone < 0:
+            raise ValueError("deadzone must not be negative")
+        if quantization is not None:
+            if not isinstance(quantization, (int, float)):
+                raise TypeError("quantization must be a number")
+            if quantization <= 0:
+                raise ValueError("quantization must be greater than 0")
+
+        self.deadzone = deadzone
+        self.quantization = quantization
+
+    def process_events(self, events):
+        """Adds and removes joysticks as they are connected and disconnected.
+
+        Args:
+            events (list): The Pygame events to process.
+
+        Returns:
+            None
+        """
+
+        for event in events:
+            if event.type == pygame.JOYDEVICEADDED:
+                self.add_joystick(event.device_index)
+            elif event.type == pygame.JOYDEVICEREMOVED:
+                self.remove_joystick(event.instance_id)
+
+    def add_joystick(self, device_index):
+        """Adds a connected joystick and caches its button and axis counts.
+
+        Args:
+            device_index (int): The device index of the joystick.
+
+        Returns:
+            None
+        """
+
+        # Skip joysticks that are already registered
+        joystick = pygame.joystick.Joystick(device_index)
+        instance_id = joystick.get_instance_id()
+        if instance_id in self.devices:
+            return
+
+        self.devices[instance_id] = joystick
+        self.capabilities[instance_id] = (
+            joystick.get_numbuttons(),
+            joystick.get_numaxes()
+        )
+        self.joysticks.append(joystick)
+        self.instance_ids.append(instance_id)
+
+    def remove_joystick(self, instance_id):
+        """Removes a disconnected joystick. Joysticks connected after it move
+        down by one number.
+
+        Args:
+            instance_id (int): The instance id of the joystick.
+
+        Returns:
+            None
+        """
+
+        # Skip joysticks that are not registered
+        if instance_id not in self.devices:
+            return
+
+        number = self.instance_ids.index(instance_id)
+        del self.devices[instance_id]
+        del self.capabilities[instance_id]
+        del self.joysticks[number]
+        del self.instance_ids[number]
+
+    def get_number(self, instance_id):
+        """Returns the number of the joystick with the given instance id.
+
+        Args:
+            instance_id (int): The instance id of the joystick.
+
+        Returns:
+            int: The joystick number, or None if it is not connected.
+        """
+
+        if instance_id not in self.devices:
+            return None
+
+        return self.instance_ids.index(instance_id)
+
+    def get_num_buttons(self, number):
+        """Returns the cached number of buttons of a joystick.
+
+        Args:
+            number (int): The joystick number.
+
+        Returns:
+            int: The number of buttons, or 0 if it is not connected.
+        """
+
+        if not 0 <= number < len(self.instance_ids):
+            return 0
+
+        return self.capabilities[self.instance_ids[number]][0]
+
+    def get_num_axes(self, number):
+        """Returns the cached number of axes of a joystick.
+
+        Args:
+            number (int): The joystick number.
+
+        Returns:
+            int: The number of axes, or 0 if it is not connected.
+        """
+
+        if not 0 <= number < len(self.instance_ids):
+            return 0
+
+        return self.capabilities[self.instance_ids[number]][1]
+
+    def get_axis(self, number, axis):
+        """Returns the filtered value of a joystick axis.
+
+        Args:
+            number (int): The joystick number.
+            axis (int): The axis number.
+
+        Returns:
+            float: The filtered axis value, or None if the joystick is not
+                connected or has no such axis.
+        """
+
+        if not 0 <= axis < self.get_num_axes(number):
+            return None
+
+        return self.filter_axis(self.joysticks[number].get_axis(axis))
+
+    def filter_axis(self, value):
+        """Applies the deadzone and quantization to an axis value.
+
+        Args:
+            value (float): The raw axis value.
+
+        Returns:
+            float: The filtered axis value.
+        """
+
+        if abs(value) < self.deadzone:
+            return 0.0
+        if self.quantization is not None:
+            value = round(value / self.quantization) * self.quantization
+
+        # Avoid reporting -0.0 for small negative values
+        return value or 0.0
@@ -0,0 +1,277 @@
+from collections import namedtuple
+import pygame
+
+# Alternative names for keys, by normalized name
+KEY_ALIASES = {
+    "esc": "escape",
+    "enter": "return",
+    "ret": "return",
+    "spacebar": "space",
+    "del": "delete",
+    "ins": "insert",
+    "bksp": "backspace",
+    "pgup": "pageup",
+    "pgdn": "pagedown",
+    "uparrow": "up",
+    "downarrow": "down",
+    "leftarrow": "left",
+    "rightarrow": "right",
+    "leftshift": "lshift",
+    "rightshift": "rshift",
+    "leftctrl": "lctrl",
+    "rightctrl": "rctrl",
+    "leftcontrol": "lctrl",
+    "rightcontrol": "rctrl",
+    "leftalt": "lalt",
+    "rightalt": "ralt",
+    "numpadenter": "kpenter",
+    "keypadenter": "kpenter"
+}
+
+# Modifier masks, by normalized name
+MODIFIERS = {
+    "shift": pygame.KMOD_SHIFT,
+    "lshift": pygame.KMOD_LSHIFT,
+    "leftshift": pygame.KMOD_LSHIFT,
+    "rshift": pygame.KMOD_RSHIFT,
+    "rightshift": pygame.KMOD_RSHIFT,
+    "ctrl": pygame.KMOD_CTRL,
+    "control": pygame.KMOD_CTRL,
+    "lctrl": pygame.KMOD_LCTRL,
+    "leftctrl": pygame.KMOD_LCTRL,
+    "rctrl": pygame.KMOD_RCTRL,
+    "rightctrl": pygame.KMOD_RCTRL,
+    "alt": pygame.KMOD_ALT,
+    "option": pygame.KMOD_ALT,
+    "lalt": pygame.KMOD_LALT,
+    "leftalt": pygame.KMOD_LALT,
+    "ralt": pygame.KMOD_RALT,
+    "rightalt": pygame.KMOD_RALT,
+    "gui": pygame.KMOD_GUI,
+    "meta": pygame.KMOD_GUI,
+    "cmd": pygame.KMOD_GUI,
+    "command": pygame.KMOD_GUI,
+    "super": pygame.KMOD_GUI,
+    "win": pygame.KMOD_GUI
+}
+
+# Display names of the modifier masks
+MODIFIER_NAMES = {
+    pygame.KMOD_SHIFT: "Shift",
+    pygame.KMOD_LSHIFT: "Left Shift",
+    pygame.KMOD_RSHIFT: "Right Shift",
+    pygame.KMOD_CTRL: "Ctrl",
+    pygame.KMOD_LCTRL: "Left Ctrl",
+    pygame.KMOD_RCTRL: "Right Ctrl",
+    pygame.KMOD_ALT: "Alt",
+    pygame.KMOD_LALT: "Left Alt",
+    pygame.KMOD_RALT: "Right Alt",
+    pygame.KMOD_GUI: "Meta"
+}
+
+
+def normalize_key_name(name):
+    """Normalizes a key name, so different spellings of the same name match.
+
+    Names are lowercased, and spaces, underscores, and hyphens are removed
+    from names longer than one character. "Left Shift", "left_shift", and
+    "LEFTSHIFT" all become "leftshift".
+
+    Args:
+        name (str): The name to normalize.
+
+    Returns:
+        str: The normalized name.
+    """
+
+    # Single characters are keys themselves, such as "-" or " "
+    if len(name) == 1:
+        return "space" if name == " " else name.lower()
+
+    name = name.strip().lower()
+    for separator in (" ", "_", "-"):
+        name = name.replace(separator, "")
+
+    return name
+
+
+def build_key_tables():
+    """Builds the tables of key codes by normalized name, and display names by
+    key code, from the Pygame key constants.
+
+    Returns:
+        tuple: The key codes by normalized name, and the display names by key
+            code.
+    """
+
+    key_codes = {}
+    key_names = {}
+
+    # Names of the Pygame constants, such as K_LSHIFT, come first
+    constants = sorted(name for name in dir(pygame) if name.startswith("K_"))
+    for constant in constants:
+        key_code = getattr(pygame, constant)
+        key_codes.setdefault(normalize_key_name(constant[2:]), key_code)
+
+        # Display names match the names SDL gives the keys
+        if key_code not in key_names:
+            key_names[key_code] = pygame.key.name(key_code).title() \
+                or constant[2:].title()
+
+    # Aliases override the names SDL gives the keys, such as "enter"
+    for alias, name in KEY_ALIASES.items():
+        key_codes[alias] = key_codes[name]
+
+    # Names SDL gives the keys, such as "left shift", come last
+    for key_code, display_name in key_names.items():
+        key_codes.setdefault(normalize_key_name(display_name), key_code)
+
+    return key_codes, key_names
+
+
+# Key codes by normalized name, and display names by key code
+KEY_CODES, KEY_NAMES = build_key_tables()
+
+
+class KeyCombo(namedtuple("KeyCombo", ("key", "modifiers"))):
+    """A key pressed together with modifier keys, such as "Ctrl+Shift+S".
+
+    Args:
+        key (int): The Pygame key code.
+        modifiers (tuple): The Pygame modifier masks that must all be held.
+            A mask like KMOD_CTRL is held if either Ctrl key is held.
+    """
+
+    __slots__ = ()
+
+    def are_modifiers_held(self, mods):
+        """Returns whether every modifier of the combo is held.
+
+        Args:
+            mods (int): The held modifiers, as returned by
+                pygame.key.get_mods().
+
+        Returns:
+            bool: True if every modifier is held, False otherwise.
+        """
+
+        for modifier in self.modifiers:
+            if not mods & modifier:
+                return False
+
+        return True
+
+    def is_pressed(self, keys=None, mods=None):
+        """Returns whether the combo is held down.
+
+        Args:
+            keys (ScancodeWrapper, optional): The pressed keys (default the
+                result of pygame.key.get_pressed()).
+            mods (int, optional): The held modifiers (default the result of
+                pygame.key.get_mods()).
+
+        Returns:
+            bool: True if the combo is held down, False otherwise.
+        """
+
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        if mods is None:
+            mods = pygame.key.get_mods()
+
+        return bool(keys[self.key]) and self.are_modifiers_held(mods)
+
+    def matches(self, event):
+        """Returns whether a key event presses the combo.
+
+        Args:
+            event (pygame.event.Event): The event to check.
+
+        Returns:
+            bool: True if the event is a KEYDOWN event for the combo, False
+                otherwise.
+        """
+
+        return event.type == pygame.KEYDOWN \
+            and event.key == self.key \
+            and self.are_modifiers_held(getattr(event, "mod", 0))
+
+    def get_name(self):
+        """Returns the display name of the combo, such as "Ctrl+Shift+S".
+
+        Returns:
+            str: The display name.
+        """
+
+        names = [MODIFIER_NAMES[modifier] for modifier in self.modifiers]
+        names.append(get_key_name(self.key))
+        return "+".join(names)
+
+
+def get_key_code(name):
+    """Returns the Pygame key code of a key name. Names are matched
+    regardless of case, spacing, and underscores, and aliases such as "esc"
+    are supported.
+
+    Args:
+        name (str): The name of the key, such as "a", "SPACE", or
+            "Left Shift".
+
+    Returns:
+        int: The key code, or None if the name is not recognized.
+    """
+
+    return KEY_CODES.get(normalize_key_name(name))
+
+
+def get_key_name(key_code):
+    """Returns the display name of a Pygame key code.
+
+    Args:
+        key_code (int): The key code.
+
+    Returns:
+        str: The display name, such as "Left Shift", or an empty string if the
+            key code is not recognized.
+    """
+
+    name = KEY_NAMES.get(key_code)
+    if name is None:
+        name = pygame.key.name(key_code).title()
+
+    return name
+
+
+def parse_key(text):
+    """Parses a key name or a combo of modifier names and a key name joined by
+    "+", such as "ctrl+shift+s".
+
+    Args:
+        text (str): The text to parse.
+
+    Returns:
+        int or KeyCombo: The key code, or the combo if modifiers are given.
+            None if the text is not recognized.
+    """
+
+    # A lone "+" or a trailing "++" is the plus key itself
+    if text.endswith("++"):
+        names = text[:-2].split("+") + ["+"]
+    elif "+" in text[1:]:
+        names = text.split("+")
+    else:
+        return get_key_code(text)
+
+    # Every name but the last must be a modifier
+    key_code = get_key_code(names[-1])
+    if key_code is None:
+        return None
+    modifiers = []
+    for name in names[:-1]:
+        modifier = MODIFIERS.get(normalize_key_name(name))
+        if modifier is None:
+            return None
+        if modifier not in modifiers:
+            modifiers.append(modifier)
+
+    return KeyCombo(key_code, tuple(modifiers))
@@ -0,0 +1,248 @@
+import copy
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+from pygkit.utility.config_manager import ConfigManager
+
+CONFIG_TEXT = """
+[display]
+width = 800
+height = 600
+fullscreen = false
+
+[audio]
+volume = 0.5
+device = default
+"""
+
+
+class LazyConfigManagerTest(unittest.TestCase):
+    """Checks that a lazy ConfigManager behaves like an eager one."""
+
+    def setUp(self):
+        """Writes the config file, and loads it eagerly and lazily.
+
+        Returns:
+            None
+        """
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file = os.path.join(directory.name, "config.ini")
+        with open(self.file, "w") as config_file:
+            config_file.write(CONFIG_TEXT)
+
+        self.eager = ConfigManager(self.file)
+
+    def get_lazy(self):
+        """Returns a new lazy ConfigManager with no sections loaded.
+
+        Returns:
+            ConfigManager: The lazy ConfigManager.
+        """
+
+        return ConfigManager(self.file, lazy=True)
+
+    def test_conversions(self):
+        """Checks the conversions and copies of the settings."""
+
+        conversions = (
+            dict,
+            list,
+            len,
+            repr,
+            json.dumps,
+            lambda config: config.copy(),
+            lambda config: config | {},
+            lambda config: {} | config,
+            lambda config: {**config},
+            lambda config: list(config.items()),
+            lambda config: list(config.values()),
+            lambda config: dict(copy.copy(config)),
+            lambda config: dict(copy.deepcopy(config)),
+            lambda config: dict(pickle.loads(pickle.dumps(config)))
+        )
+        for conversion in conversions:
+            self.assertEqual(
+                conversion(self.get_lazy()),
+                conversion(self.eager)
+            )
+
+    def test_comparisons(self):
+        """Checks the comparisons of the settings."""
+
+        expected = dict(self.eager)
+        self.assertEqual(self.get_lazy(), self.eager)
+        self.assertEqual(self.get_lazy(), expected)
+        self.assertEqual(expected, self.get_lazy())
+        self.assertFalse(self.get_lazy() != self.eager)
+        self.assertTrue(self.get_lazy() != {})
+
+    def test_update_plain_dict(self):
+        """Checks that updating a plain dict copies the loaded sections."""
+
+        settings = {}
+        settings.update(self.get_lazy())
+        self.assertEqual(settings, dict(self.eager))
+
+    def test_pop(self):
+        """Checks that popping a section returns its values."""
+
+        lazy = self.get_lazy()
+        self.assertEqual(lazy.pop("display"), self.eager["display"])
+        self.assertNotIn("display", lazy)
+        self.assertIsNone(lazy.pop("display", None))
+        with self.assertRaises(KeyError):
+            lazy.pop("display")
+
+    def test_popitem(self):
+        """Checks that popping the last section returns its values."""
+
+        lazy = self.get_lazy()
+        self.assertEqual(lazy.popitem(), self.eager.copy().popitem())
+        self.assertEqual(len(lazy), len(self.eager) - 1)
+
+    def test_setdefault(self):
+        """Checks that setdefault keeps the values of an existing section."""
+
+        lazy = self.get_lazy()
+        self.assertEqual(lazy.setdefault("display", {}), self.eager["display"])
+        self.assertEqual(lazy["display"], self.eager["display"])
+        self.assertEqual(lazy.setdefault("input", {}), {})
+
+    def test_get(self):
+        """Checks that get loads a section."""
+
+        lazy = self.get_lazy()
+        self.assertEqual(lazy.get("audio"), self.eager["audio"])
+        self.assertIsNone(lazy.get("input"))
+
+
+class HotReloadTest(unittest.TestCase):
+    """Checks that hot reloading keeps the precedence of the loaded files."""
+
+    def setUp(self):
+        """Loads two config files that both have a display section, and
+        starts watching them.
+
+        Returns:
+            None
+        """
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.first_file = os.path.join(directory.name, "first.ini")
+        self.second_file = os.path.join(directory.name, "second.ini")
+        self.write(self.first_file, "[display]\nwidth = 640\n")
+        self.write(self.second_file, "[display]\nwidth = 1024\n")
+
+        self.config = ConfigManager(self.first_file)
+        self.config.load_settings(self.second_file)
+        self.config.watch(0)
+
+    def write(self, file, text):
+        """Writes a config file, and moves its modification time forward so
+        the change is noticed.
+
+        Args:
+            file (str): The path to the config file.
+            text (str): The text to write.
+
+        Returns:
+            None
+        """
+
+        with open(file, "w") as config_file:
+            config_file.write(text)
+        mtime = os.stat(file).st_mtime_ns + 10 ** 9
+        self.mtime = max(getattr(self, "mtime", 0) + 10 ** 9, mtime)
+        os.utime(file, ns=(self.mtime, self.mtime))
+
+    def test_overridden_file_changes(self):
+        """Checks that editing a section overridden by a later file does not
+        change the settings."""
+
+        self.write(self.first_file, "[display]\nwidth = 320\n")
+        self.assertEqual(self.config.check_for_changes(), [])
+        self.assertEqual(self.config["display"]["width"], 1024)
+
+    def test_removed_section(self):
+        """Checks that removing a section from the later file falls back to
+        the earlier file."""
+
+        self.write(self.second_file, "[audio]\nvolume = 1\n")
+        self.config.check_for_changes()
+        self.assertEqual(self.config["display"]["width"], 640)
+        self.assertEqual(self.config["audio"]["volume"], 1)
+
+    def test_missing_file(self):
+        """Checks that a file that is temporarily missing keeps its
+        sections."""
+
+        os.rename(self.second_file, self.second_file + ".bak")
+        self.assertEqual(self.config.check_for_changes(), [])
+        self.assertEqual(self.config["display"]["width"], 1024)
+
+
+class CacheTest(unittest.TestCase):
+    """Checks that the compiled cache only returns the settings of the file
+    it was built from."""
+
+    def setUp(self):
+        """Writes two config files with the same size and modification time,
+        as files unpacked from one archive often have.
+
+        Returns:
+            None
+        """
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.first_file = os.path.join(self.directory, "first.ini")
+        self.second_file = os.path.join(self.directory, "second.ini")
+        for file, width in ((self.first_file, 111), (self.second_file, 222)):
+            with open(file, "w") as config_file:
+                config_file.write(f"[display]\nwidth = {width}\n")
+            os.utime(file, ns=(10 ** 18, 10 ** 18))
+
+    def test_loaded_file(self):
+        """Checks that a file loaded after the first one uses its own
+        cache."""
+
+        for _ in range(2):
+            config = ConfigManager(self.first_file, cache=True)
+            config.load_settings(self.second_file)
+            self.assertEqual(config["display"]["width"], 222)
+
+    def test_shared_cache_path(self):
+        """Checks that managers given the same cache path do not return each
+        other's settings."""
+
+        cache_file = os.path.join(self.directory, "shared.cache")
+        for _ in range(2):
+            first = ConfigManager(self.first_file, cache=cache_file)
+            second = ConfigManager(self.second_file, cache=cache_file)
+            self.assertEqual(first["display"]["width"], 111)
+            self.assertEqual(second["display"]["width"], 222)
+
+    def test_warm_start(self):
+        """Checks that a warm start with several files does not rewrite the
+        caches."""
+
+        cache_file = os.path.join(self.directory, "settings.cache")
+        for cache in (True, cache_file):
+            config = ConfigManager(self.first_file, cache=cache)
+            config.load_settings(self.second_file)
+            with mock.patch.object(ConfigManager, "write_cache") as write:
+                config = ConfigManager(self.first_file, cache=cache)
+                config.load_settings(self.second_file)
+            write.assert_not_called()
+            self.assertEqual(config["display"]["width"], 222)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,281 @@
+import os
+import random
+import unittest
+import pygame
+from pygkit.debug.rect_overlay import RectOverlay
+from pygkit.utility.broad_phase import SpatialHash, SweepAndPrune
+
+# Pygame test for each narrow phase of RectOverlay
+COLLIDED = {
+    "rect": pygame.sprite.collide_rect,
+    "circle": pygame.sprite.collide_circle,
+    "mask": pygame.sprite.collide_mask
+}
+
+
+def setUpModule():
+    """Opens a hidden window for the overlays to draw on.
+
+    Returns:
+        None
+    """
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((200, 200))
+
+
+def tearDownModule():
+    """Closes the window.
+
+    Returns:
+        None
+    """
+
+    pygame.display.quit()
+
+
+def create_sprite(rng):
+    """Creates a sprite with a round image at a random position.
+
+    Args:
+        rng (random.Random): The random number generator to use.
+
+    Returns:
+        pygame.sprite.Sprite: The sprite.
+    """
+
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(
+        rng.randrange(200),
+        rng.randrange(200),
+        rng.randrange(8, 24),
+        rng.randrange(8, 24)
+    )
+    sprite.image = pygame.Surface(sprite.rect.size, pygame.SRCALPHA)
+    pygame.draw.ellipse(sprite.image, "white", sprite.image.get_rect())
+
+    # Give some sprites a radius for the circle test
+    if rng.random() < 0.5:
+        sprite.radius = min(sprite.rect.size) / 2
+
+    return sprite
+
+
+class RectOverlayCollisionTest(unittest.TestCase):
+    """Checks the collisions found by RectOverlay against a brute-force
+    pygame.sprite.spritecollide() run."""
+
+    def setUp(self):
+        """Creates three sprite groups, with a few sprites in both of the
+        first two.
+
+        Returns:
+            None
+        """
+
+        self.rng = random.Random(0)
+        self.groups = [pygame.sprite.Group() for _ in range(3)]
+        for i in range(120):
+            self.groups[i % 3].add(create_sprite(self.rng))
+        self.shared = list(self.groups[0])[:5]
+        self.groups[1].add(self.shared)
+
+    def get_expected(self, narrow_phase, group_pairs=None):
+        """Finds the colliding sprite pairs, and their counts by sprite group
+        pair, by testing every sprite against every sprite group.
+
+        Args:
+            narrow_phase (str): The narrow-phase test.
+            group_pairs (list, optional): The (i, j) tuples of the sprite
+                group pairs to check, with i <= j, or None to check every pair
+                (default None).
+
+        Returns:
+            tuple: The set of colliding sprite pairs, as frozensets, and the
+                dict of their counts by sprite group pair.
+        """
+
+        collided = COLLIDED[narrow_phase]
+        count = len(self.groups)
+        if group_pairs is None:
+            group_pairs = [
+                (i, j) for i in range(count) for j in range(i, count)
+            ]
+
+        pairs = set()
+        counts = {}
+        for i, j in group_pairs:
+            found = 0
+            for sprite in self.groups[i]:
+                for other in pygame.sprite.spritecollide(
+                        sprite,
+                        self.groups[j],
+                        False,
+                        collided
+                    ):
+                    if other is not sprite:
+                        pairs.add(frozenset((sprite, other)))
+                        found += 1
+
+            # Pairs within a group were found from both sprites
+            if i == j:
+                found //= 2
+            if found:
+                counts[(i, j)] = found
+
+        return pairs, counts
+
+    def assert_collisions(self, overlay, narrow_phase, group_pairs=None):
+        """Checks the collisions found by an overlay against the brute-force
+        results.
+
+        Args:
+            overlay (RectOverlay): The overlay to check.
+            narrow_phase (str): The narrow-phase test.
+            group_pairs (list, optional): The (i, j) tuples of the sprite
+                group pairs to check, or None to check every pair
+                (default None).
+
+        Returns:
+            None
+        """
+
+        pairs = overlay.find_collisions()
+        expected_pairs, expected_counts = self.get_expected(
+            narrow_phase,
+            group_pairs
+        )
+
+        # Each pair is reported once, and never pairs a sprite with itself
+        found = {frozenset(pair) for pair in pairs}
+        self.assertEqual(len(found), len(pairs))
+        self.assertTrue(all(len(pair) == 2 for pair in found))
+        self.assertEqual(found, expected_pairs)
+        self.assertEqual(overlay.collision_counts, expected_counts)
+
+    def test_narrow_phases(self):
+        """Checks every narrow phase and broad phase, with and without a
+        collision matrix and static groups."""
+
+        configurations = {
+            "plain": lambda overlay: None,
+            "matrix": lambda overlay: overlay.set_collision_matrix([
+                (group_a, group_b)
+                for group_a in self.groups
+                for group_b in self.groups
+            ]),
+            "static": lambda overlay: overlay.set_static(self.groups[2]),
+            "all_static": lambda overlay: [
+                overlay.set_static(group) for group in self.groups
+            ]
+        }
+        for narrow_phase in COLLIDED:
+            for broad_phase in (SpatialHash, SweepAndPrune):
+                for name, configure in configurations.items():
+                    with self.subTest(
+                            narrow_phase=narrow_phase,
+                            broad_phase=broad_phase.__name__,
+                            configuration=name
+                        ):
+                        overlay = RectOverlay(
+                            self.groups,
+                            broad_phase(),
+                            narrow_phase
+                        )
+                        configure(overlay)
+                        self.assert_collisions(overlay, narrow_phase)
+
+    def test_shared_sprite(self):
+        """Checks that a sprite in two groups is counted in both, and never
+        paired with itself."""
+
+        sprite = self.shared[0]
+        other = create_sprite(self.rng)
+        other.rect.center = sprite.rect.center
+        self.groups[2].add(other)
+
+        for static in (False, True):
+            with self.subTest(static=static):
+                overlay = RectOverlay(self.groups)
+                if static:
+                    overlay.set_static(self.groups[1])
+                self.assert_collisions(overlay, "rect")
+                self.assertNotIn(
+                    (sprite, sprite),
+                    overlay.collision_pairs
+                )
+                self.assertGreater(
+                    overlay.get_collision_count(
+                        self.groups[0],
+                        self.groups[1]
+                    ),
+                    0
+                )
+
+    def test_disabled_pair(self):
+        """Checks that a pair disabled in the collision matrix is not
+        checked, with one build for every group or one for each pair."""
+
+        for static in (False, True):
+            for single_build in (False, True):
+                with self.subTest(static=static, single_build=single_build):
+                    self.check_disabled_pair(static, single_build)
+
+    def check_disabled_pair(self, static, single_build):
+        """Checks that a pair disabled in the collision matrix is not
+        checked.
+
+        Args:
+            static (bool): Whether to make the second group static.
+            single_build (bool): Whether to build the broad-phase index once
+                for every group, instead of once for each pair.
+
+        Returns:
+            None
+        """
+
+        overlay = RectOverlay(self.groups)
+        overlay.sparse_matrix_ratio = 0 if single_build else float("inf")
+        overlay.set_group_pair(self.groups[0], self.groups[1], False)
+        if static:
+            overlay.set_static(self.groups[1])
+        self.assert_collisions(
+            overlay,
+            "rect",
+            [(0, 0), (0, 2), (1, 1), (1, 2), (2, 2)]
+        )
+        self.assertEqual(
+            overlay.get_collision_count(self.groups[0], self.groups[1]),
+            0
+        )
+
+    def test_sparse_matrix(self):
+        """Checks a collision matrix that enables only one pair."""
+
+        overlay = RectOverlay(self.groups)
+        overlay.set_collision_matrix([(self.groups[0], self.groups[2])])
+        self.assert_collisions(overlay, "rect", [(0, 2)])
+
+    def test_static_membership_change(self):
+        """Checks that a static group is rebuilt when its sprites change."""
+
+        overlay = RectOverlay(self.groups)
+        overlay.set_static(self.groups[2])
+        self.assert_collisions(overlay, "rect")
+
+        # Add a sprite on top of a dynamic sprite, and remove another
+        sprite = create_sprite(self.rng)
+        sprite.rect.center = list(self.groups[0])[-1].rect.center
+        self.groups[2].add(sprite)
+        self.groups[2].remove(list(self.groups[2])[0])
+        self.assert_collisions(overlay, "rect")
+
+        # Moving a static sprite needs invalidate_static()
+        sprite.rect.center = list(self.groups[1])[-1].rect.center
+        overlay.invalidate_static(self.groups[2])
+        self.assert_collisions(overlay, "rect")
+
+
+if __name__ == "__main__":
+    unittest.main()